@@ -9,8 +9,6 @@ import time
 from datetime import date
 from dotenv import load_dotenv
 import threading
-import tkinter as tk
-import google.genai
 from livekit import agents
 from livekit.agents import Agent, AgentSession, RoomInputOptions, function_tool
 from livekit.plugins import (
@@ -21,58 +19,29 @@ from livekit.plugins import (
 from livekit.plugins.google.beta import realtime as google_realtime
 
 # ---------------------- YOUR MODULE IMPORTS ----------------------
-from jarvis_prompts import behavior_prompts, Reply_prompts
-from jarvis_screenshot import screenshot_tool
-from jarvis_google_search import google_search, get_current_datetime
-from jarvis_memory import load_memory, save_memory, get_recent_conversations, add_memory_entry
-from memory_inter import MEMORY_KEYWORDS, inject_memory_context
-from jarvis_get_whether import get_weather
-from jarvis_window_CTRL import open, close, folder_file
-from jarvis_file_opner import Play_file
+# Tool modules are NOT imported here - see agent_tools.TOOL_SPECS
+from agent_tools import TOOL_SPECS
+from tool_registry import get_tool_registry
+from hud_state import HUDStatePublisher
 
-from jarvis_gui import open_gui
-from keyboard_mouse_CTRL import (
-    move_cursor_tool,
-    mouse_click_tool,
-    scroll_cursor_tool,
-    type_text_tool,
-    press_key_tool,
-    swipe_gesture_tool,
-    press_hotkey_tool,
-    control_volume_tool
-)
-from mouse_scroll import (
-    slow_scroll_tool_once,
-    start_slow_scroll_tool,
-    stop_slow_scroll_tool
-)
-from jarvis_music_tools import activate_music, deactivate_music, play_song
-
-from image_gen_sd import sd_generate_image
-from image_generate import generate_magic_image
-from Bhojpuri_lang import listen_bhojpuri, speak_bhojpuri
-from jarvis_gui_screen_share import JarvisScreenShare
-from delete_file import send_file_and_delete
-from lock import activate_sleep_mode, lock_screen, shutdown_pc, cancel_shutdown
-from jarvis_whatapp import whatsapp_main  # ✅ WHATSAPP IMPORT
-from ai_integrated_system import JarvisAI
-from jarvis_ppt_tool import create_presentation
-from image_to_pdf import jpg_to_pdf_decoder, multiple_jpg_to_pdf_decoder
-from jarvis_auto_code import jarvis_code_generator
-from jarvis_screen_reader import (
-    read_file_tool,
-    read_screen_tool,
-    read_screen_area_tool,
-    list_supported_formats_tool
-)
-from chess_game import JarvisChessGUI
-from real_stock import realtime_stock_advisor
+try:
+    from jarvis_prompts import behavior_prompts, Reply_prompts
+except ImportError:
+    behavior_prompts = "You are JARVIS, a helpful voice assistant."
+    Reply_prompts = "Greet the user briefly and ask how you can help."
 
 
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-ENABLE_MEMORY_INTERCEPTOR = True
+
+# ==============================================================================
+# LAZY TOOLS - declared up front (agent_tools.py), implementation imported on first call
+# ==============================================================================
+tools = get_tool_registry()
+
+LAZY_TOOLS = tools.declare_all(TOOL_SPECS)
+
 
 # ==============================================================================
 # YOUR EXISTING FUNCTION TOOLS (unchanged)
@@ -111,16 +80,6 @@ async def chess_game() -> str:
     # ...unchanged
     pass
 
-@function_tool
-async def create_presentation(topic: str) -> str:
-    # ... unchanged
-    pass
-
-@function_tool
-async def jarvis_code_generator(topic: str) -> str:
-    # ... unchanged
-    pass
-
 @function_tool
 async def generate_code_file(language: str = "python", content: str = "print('Hello, Jarvis')") -> str:
     # ... unchanged
@@ -152,7 +111,7 @@ async def create_jarvis_website() -> str:
 @function_tool
 async def create_image(prompt: str, size: str = "512x512") -> str:
     try:
-        return await generate_magic_image(prompt, size)
+        return await tools.run("image_generate", "generate_magic_image", prompt, size)
     except Exception as e:
         return f"❌ Image generation failed: {e}"
 # 🔥 ✅ NEW WHATSAPP VOICE AUTOMATION TOOL (exactly like your other tools)
@@ -163,10 +122,10 @@ async def send_whatsapp_message(contact: str, message: str = "") -> str:
         print(f"📱 JARVIS: Sending WhatsApp to {contact}: {message}")
         # Call your existing whatsapp_main function
         if message:
-            result = whatsapp_main(contact=contact, message=message)
+            result = await tools.run("jarvis_whatapp", "whatsapp_main", contact=contact, message=message)
         else:
             # Voice mode - will prompt for message
-            result = whatsapp_main(contact=contact)
+            result = await tools.run("jarvis_whatapp", "whatsapp_main", contact=contact)
         
         if "success" in result.lower() or "sent" in result.lower():
             return f"✅ WhatsApp sent to **{contact}**: {message}"
@@ -179,7 +138,7 @@ async def send_whatsapp_message(contact: str, message: str = "") -> str:
 async def open_whatsapp() -> str:
     """Open WhatsApp Desktop"""
     try:
-        result = whatsapp_main(action="open")
+        result = await tools.run("jarvis_whatapp", "whatsapp_main", action="open")
         return "✅ WhatsApp opened" if "success" in result.lower() else f"⚠️ {result}"
     except Exception as e:
         return f"❌ WhatsApp open failed: {e}"
@@ -187,7 +146,7 @@ async def open_whatsapp() -> str:
 @function_tool
 async def whatapps_auto_reply() -> str:
     try:
-        result = whatsapp_main(action="reply_voice")
+        result = await tools.run("jarvis_whatapp", "whatsapp_main", action="reply_voice")
         return "✅ WhatsApp auto reply sent" if "success" in str(result).lower() else f"⚠️ {result}"
     except Exception as e:
         return f"❌ WhatsApp auto reply failed: {e}"
@@ -200,86 +159,32 @@ class Assistant(Agent):
         super().__init__(
             instructions=behavior_prompts,
             tools=[
-                # ... all your existing tools unchanged
-                google_search,
-                get_current_datetime,
-                get_weather,
-                open,
-                close,
-                load_memory,
-                save_memory,
-                get_recent_conversations,
-                add_memory_entry,
-                folder_file,
-                Play_file,
-                screenshot_tool,
-                activate_sleep_mode,
-                lock_screen,
-                shutdown_pc,
-                cancel_shutdown,
-                move_cursor_tool,
-                mouse_click_tool,
-                scroll_cursor_tool,
-                type_text_tool,
-                press_key_tool,
-                press_hotkey_tool,
-                control_volume_tool,
-                swipe_gesture_tool,
-                # Mouse scroll tools
-                slow_scroll_tool_once,
-                start_slow_scroll_tool,
-                stop_slow_scroll_tool,
-                # Screen reader tools
-                read_file_tool,
-                read_screen_tool,
-                read_screen_area_tool,
-                list_supported_formats_tool,
-                activate_music,
-                deactivate_music,
-                create_jarvis_website,   
-                play_song,
-                
+                # Lazily loaded tools (search, apps, input, music, images, ...)
+                *LAZY_TOOLS,
+                create_jarvis_website,
                 generate_code_file,
-                sd_generate_image,
                 create_image,
-                activate_jarvis_sketch,
-                activate_drawing_mode,
-                
-                generate_magic_image,
                 doctor_strange_effect,
                 activate_ironman_shoot,
                 activate_jarvis_shoot_open,
                 open_chatbot_gui,
                 jarvis_auto_code,
-                create_presentation,
                 activate_bhojpuri_mode,
-                generate_ai_video,
                 # 🔥 ✅ NEW WHATSAPP VOICE TOOLS
                 send_whatsapp_message,
                 open_whatsapp,
                 whatapps_auto_reply,
                 chess_game,
-                jarvis_code_generator,
-                
-                
             ]
         )
 
 # ---------------------- REAL-TIME HUD STATE EXPORTER ----------------------
+hud_state = HUDStatePublisher(os.path.join(os.path.dirname(__file__), "jarvis_state.json"))
+
 def update_jarvis_state(text, speaker="jarvis", data_type="transcript"):
     """Update shared state file for the Hotkey HUD to display"""
-    try:
-        state_file = os.path.join(os.path.dirname(__file__), "jarvis_state.json")
-        state = {
-            "text": text,
-            "speaker": speaker,
-            "data_type": data_type,
-            "timestamp": time.time()
-        }
-        with builtins.open(state_file, "w", encoding="utf-8") as f:
-            json.dump(state, f, ensure_ascii=False)
-    except Exception as e:
-        logger.error(f"Failed to update jarvis_state.json: {e}")
+    # Streaming transcripts are coalesced; status and tool results go out right away
+    hud_state.publish(text, speaker=speaker, data_type=data_type, urgent=data_type != "transcript")
 
 # ==============================================================================
 # ENTRYPOINT (unchanged - your fixed version)
@@ -306,7 +211,7 @@ async def entrypoint(ctx: agents.JobContext):
                         noise_cancellation=noise_cancellation.BVC(),
                         video_enabled=True
                     )
-                
+                )
 
                 # Attach transcript listeners for real-time HUD
                 @session.on("assistant_transcript")
@@ -380,14 +285,6 @@ async def entrypoint(ctx: agents.JobContext):
             # Greeting with WhatsApp mention
             instructions = f"{Reply_prompts}\n\n**NEW**: Say 'send WhatsApp message to Mom: Hi' or 'open WhatsApp'"
             
-            if ENABLE_MEMORY_INTERCEPTOR:
-                try:
-                    memory_context = await get_recent_conversations(limit=5)
-                    if "अभी तक कोई बातचीत याद नहीं है" not in memory_context:
-                        instructions += f"\n\n[RECENT CONTEXT]\n{memory_context}\n[/CONTEXT]"
-                except:
-                    pass
-            
             await session.generate_reply(instructions=instructions)
             print("✅ Jarvis ready with WhatsApp voice control!")
             break
@@ -406,6 +303,7 @@ async def entrypoint(ctx: agents.JobContext):
                     await session.stop()
                 except:
                     pass
+            logger.info(tools.report())
 
 # ==============================================================================
 # MAIN (removed duplicate)
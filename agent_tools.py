@@ -0,0 +1,82 @@
+"""
+JARVIS Agent Tools - Declarations of the Lazily Loaded Agent Tools
+Name, implementation and parameters of every tool the LiveKit agent offers.
+Kept free of heavy imports so the declarations can be checked against the
+implementations without starting the agent (see test_tool_registry.py)
+"""
+from tool_registry import ToolSpec
+
+TOOL_SPECS = [
+
+    # Search, time, weather
+    ToolSpec("google_search", "jarvis_google_search", "google_search",
+             "Search Google and return the top results.", {"query": str}),
+    ToolSpec("get_current_datetime", "jarvis_google_search", "get_current_datetime",
+             "Get the current date and time."),
+    ToolSpec("get_weather", "jarvis_get_whether", "get_weather",
+             "Get the current weather for a city (detected from IP if empty).", {"city": (str, "")}),
+    # Apps, windows, files
+    ToolSpec("open", "jarvis_window_CTRL", "open",
+             "Open an application or website, e.g. 'open chrome'.", {"full_command": str}),
+    ToolSpec("close", "jarvis_window_CTRL", "close",
+             "Close an application window by name.", {"window_name": str}),
+    ToolSpec("folder_file", "jarvis_window_CTRL", "folder_file",
+             "Open a folder or file by path.", {"path": str}),
+    ToolSpec("Play_file", "jarvis_file_opner", "Play_file",
+             "Find a file on this computer by name and open or play it.", {"name": str}),
+    ToolSpec("screenshot_tool", "jarvis_screenshot", "screenshot_tool",
+             "Take a screenshot of the screen."),
+    # Power
+    ToolSpec("activate_sleep_mode", "lock", "activate_sleep_mode", "Put the computer to sleep."),
+    ToolSpec("lock_screen", "lock", "lock_screen", "Lock the screen."),
+    ToolSpec("shutdown_pc", "lock", "shutdown_pc", "Shut down the computer."),
+    ToolSpec("cancel_shutdown", "lock", "cancel_shutdown", "Cancel a scheduled shutdown."),
+    # Keyboard and mouse
+    ToolSpec("move_cursor_tool", "keyboard_mouse_CTRL", "move_cursor_tool",
+             "Move the mouse cursor to screen coordinates.", {"x": int, "y": int}),
+    ToolSpec("mouse_click_tool", "keyboard_mouse_CTRL", "mouse_click_tool",
+             "Click the mouse (left, right or double).", {"button": (str, "left")}),
+    ToolSpec("scroll_cursor_tool", "keyboard_mouse_CTRL", "scroll_cursor_tool",
+             "Scroll up or down.", {"direction": str, "amount": (int, 5)}),
+    ToolSpec("type_text_tool", "keyboard_mouse_CTRL", "type_text_tool",
+             "Type text into the active window.", {"text": str}),
+    ToolSpec("press_key_tool", "keyboard_mouse_CTRL", "press_key_tool",
+             "Press a single key, e.g. 'enter'.", {"key": str}),
+    ToolSpec("press_hotkey_tool", "keyboard_mouse_CTRL", "press_hotkey_tool",
+             "Press a key combination, e.g. 'ctrl+c'.", {"keys": str}),
+    ToolSpec("control_volume_tool", "keyboard_mouse_CTRL", "control_volume_tool",
+             "Change the system volume (up, down, mute).", {"action": str}),
+    ToolSpec("swipe_gesture_tool", "keyboard_mouse_CTRL", "swipe_gesture_tool",
+             "Perform a swipe gesture in a direction.", {"direction": str}),
+    ToolSpec("slow_scroll_tool_once", "mouse_scroll", "slow_scroll_tool_once",
+             "Scroll slowly once.", {"direction": (str, "down")}),
+    ToolSpec("start_slow_scroll_tool", "mouse_scroll", "start_slow_scroll_tool",
+             "Start scrolling slowly and continuously.", {"direction": (str, "down")}),
+    ToolSpec("stop_slow_scroll_tool", "mouse_scroll", "stop_slow_scroll_tool",
+             "Stop continuous scrolling."),
+    # Screen reader
+    ToolSpec("read_file_tool", "jarvis_screen_reader", "read_file_tool",
+             "Read the contents of a document aloud.", {"file_path": str}),
+    ToolSpec("read_screen_tool", "jarvis_screen_reader", "read_screen_tool",
+             "Read the text on the screen."),
+    ToolSpec("read_screen_area_tool", "jarvis_screen_reader", "read_screen_area_tool",
+             "Read the text in an area of the screen.",
+             {"x": int, "y": int, "width": int, "height": int}),
+    ToolSpec("list_supported_formats_tool", "jarvis_screen_reader", "list_supported_formats_tool",
+             "List the document formats the screen reader supports."),
+    # Music
+    ToolSpec("activate_music", "jarvis_music_tools", "activate_music", "Turn music mode on."),
+    ToolSpec("deactivate_music", "jarvis_music_tools", "deactivate_music", "Turn music mode off."),
+    ToolSpec("play_song", "jarvis_music_tools", "play_song",
+             "Play a song by name.", {"song_name": str}),
+    # Images, documents, code
+    ToolSpec("sd_generate_image", "image_gen_sd", "sd_generate_image",
+             "Generate an image with Stable Diffusion.", {"prompt": str}),
+    ToolSpec("generate_magic_image", "image_generate", "generate_magic_image",
+             "Generate an image from a prompt.", {"prompt": str, "size": (str, "512x512")}),
+    ToolSpec("create_presentation", "jarvis_ppt_tool", "create_presentation",
+             "Create a PowerPoint presentation on a topic.", {"topic": str}),
+    ToolSpec("jarvis_code_generator", "jarvis_auto_code", "jarvis_code_generator",
+             "Generate code in a language for a task.",
+             {"language": str, "task": str, "style": (str, "clean"), "comments": (bool, True)}),
+]
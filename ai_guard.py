@@ -0,0 +1,285 @@
+"""
+JARVIS AI Guard - Rate Limiting and Circuit Breaking for Gemini
+Keeps knowledge requests within the model's quota, answers identical
+in-flight questions with one request and fails fast while Gemini is down
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from config import AI_GUARD_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class AIUnavailable(Exception):
+    """Raised instead of calling Gemini (reason: 'throttled', 'circuit_open' or 'failed')"""
+
+    def __init__(self, reason: str, detail: str = ""):
+        super().__init__(f"{reason}: {detail}" if detail else reason)
+        self.reason = reason
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at the model's request rate
+
+    Callers reserve a token up front and sleep until it is due, so
+    concurrent callers queue in order instead of all waking at once.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Take a token
+
+        Returns:
+            Seconds to wait before using it, or None if that is over max_wait
+            (nothing is taken then)
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if wait > max_wait:
+                return None
+            self.tokens -= 1
+            return wait
+
+    def take_spare(self, keep: int) -> bool:
+        """Take a token only if `keep` more are left afterwards (never waits)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < keep + 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Closed -> open after `failure_threshold` consecutive failures (or one
+    quota error); after `reset_seconds` one trial call is let through
+    (half-open) and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now"""
+        with self.lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = 'half_open'
+                logger.info("🔌 Gemini circuit half-open - sending a trial request")
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            if self.state != 'closed':
+                logger.info("✅ Gemini circuit closed")
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self, quota: bool = False):
+        with self.lock:
+            self.failures += 1
+            if quota or self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    logger.warning(f"🔌 Gemini circuit open for {self.reset_seconds:.0f} s "
+                                   f"({'quota exhausted' if quota else f'{self.failures} failures'})")
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+class _Flight:
+    """One in-flight request that identical requests wait on"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """429 / ResourceExhausted from the Gemini client"""
+    text = str(error).lower()
+    return (type(error).__name__ == 'ResourceExhausted' or '429' in text
+            or 'quota' in text or 'rate limit' in text)
+
+
+class GuardedKnowledgeEngine:
+    """
+    KnowledgeEngine wrapper with rate limiting, request coalescing and a
+    circuit breaker
+
+    explain() returns the engine's answer or raises AIUnavailable, so the
+    caller can answer from its offline fallback right away. Everything else
+    (last_topic, clear_context, ...) is passed through to the engine.
+    """
+
+    def __init__(self, engine, rate_per_minute: float = 15, burst: int = 3, max_wait: float = 2.0,
+                 failure_threshold: int = 3, reset_seconds: float = 30):
+        """
+        Initialize guard
+
+        Args:
+            engine: KnowledgeEngine to protect
+            rate_per_minute: Requests per minute allowed by the model quota
+            burst: Requests allowed back to back
+            max_wait: Seconds a call may wait for quota before it is throttled
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Open circuit cooldown before a trial request
+        """
+        self.engine = engine
+        self.max_wait = max_wait
+        self.bucket = TokenBucket(rate_per_minute, burst)
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self._flights: Dict[tuple, _Flight] = {}
+        self._flights_lock = threading.Lock()
+
+        self.calls = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.delayed = 0            # waited for a token
+        self.throttled = 0          # no token within max_wait
+        self.coalesced = 0          # answered by another caller's request
+        self.cached = 0             # answered from the answer cache
+        self.short_circuited = 0    # circuit open
+
+    def __getattr__(self, name):
+        return getattr(self.engine, name)
+
+    def explain(self, question: str, context: Optional[str] = None, cacheable: bool = True) -> str:
+        """
+        Explain via the engine, guarded (cached answers skip the guard)
+
+        Raises:
+            AIUnavailable: Throttled, circuit open, or the request failed
+        """
+        return self.explain_with_source(question, context, cacheable)[0]
+
+    def explain_with_source(self, question: str, context: Optional[str] = None,
+                            cacheable: bool = True) -> Tuple[str, str]:
+        """
+        Same as explain(), also saying where the answer came from
+
+        Returns:
+            (answer, source) - source is 'cache', 'model', or 'shared' when
+            another caller's identical request answered it
+
+        Raises:
+            AIUnavailable: Throttled, circuit open, or the request failed
+        """
+        self.calls += 1
+        if cacheable:
+            cached = self.engine.cached_answer(question)
+            if cached is not None:
+                self.cached += 1
+                return cached, 'cache'
+        key = (question, context, cacheable)
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            self.coalesced += 1
+            logger.info("🔗 Identical question already in flight - sharing its answer")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, 'shared'
+
+        try:
+            flight.result = self._call(question, context, cacheable)
+            return flight.result, 'model'
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _call(self, question: str, context: Optional[str], cacheable: bool) -> str:
+        if not self.breaker.allow():
+            self.short_circuited += 1
+            raise AIUnavailable('circuit_open')
+
+        wait = self.bucket.reserve(self.max_wait)
+        if wait is None:
+            self.throttled += 1
+            # A half-open trial that never ran must not keep the circuit stuck
+            if self.breaker.state == 'half_open':
+                self.breaker.state = 'open'
+            logger.warning("⏳ Gemini quota reached - answering offline")
+            raise AIUnavailable('throttled')
+        if wait:
+            self.delayed += 1
+            time.sleep(wait)
+
+        try:
+            answer = self.engine.answer(question, context, cacheable)
+        except Exception as e:
+            self.failed += 1
+            self.breaker.record_failure(quota=is_quota_error(e))
+            logger.error(f"❌ AI generation failed: {e}")
+            raise AIUnavailable('failed', str(e)) from e
+        self.succeeded += 1
+        self.breaker.record_success()
+        return answer
+
+    def spare(self, keep: int) -> bool:
+        """
+        Take quota for background work (e.g. prefetching), only while the
+        circuit is closed and `keep` tokens stay free for the user's turns
+        """
+        return self.breaker.state == 'closed' and self.bucket.take_spare(keep)
+
+    def stats(self) -> Dict:
+        """Call counters and circuit state"""
+        return {
+            'calls': self.calls,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'delayed': self.delayed,
+            'throttled': self.throttled,
+            'coalesced': self.coalesced,
+            'cached': self.cached,
+            'short_circuited': self.short_circuited,
+            'circuit': self.breaker.state,
+        }
+
+
+def guard_engine(engine) -> GuardedKnowledgeEngine:
+    """Wrap an engine with the settings from AI_GUARD_CONFIG"""
+    return GuardedKnowledgeEngine(
+        engine,
+        rate_per_minute=AI_GUARD_CONFIG['requests_per_minute'],
+        burst=AI_GUARD_CONFIG['burst'],
+        max_wait=AI_GUARD_CONFIG['max_wait'],
+        failure_threshold=AI_GUARD_CONFIG['failure_threshold'],
+        reset_seconds=AI_GUARD_CONFIG['reset_seconds'],
+    )
@@ -0,0 +1,285 @@
+"""
+JARVIS Answer Cache - Semantic Cache for Knowledge Answers
+Serves a stored explanation when a new question means the same as one
+already answered ("what is recursion" / "explain recursion" / "recursion
+kya hai"), from a small SQLite vector store with LRU eviction and TTLs
+"""
+import logging
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from config import ANSWER_CACHE_CONFIG
+from semantic_intent import HashedNgramEmbedder, np
+from tracing import traced
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question TEXT NOT NULL,
+    key TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    answer TEXT NOT NULL,
+    created REAL NOT NULL,
+    expires REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Words that ask for an explanation rather than say what it is about.
+# Why/how/when/where stay - they change the answer.
+QUESTION_WORDS = frozenset({
+    'what', 'whats', "what's", 'is', 'are', 'was', 'were', 'the', 'a', 'an', 'of', 'to', 'me', 'us',
+    'tell', 'about', 'explain', 'define', 'describe', 'definition', 'meaning', 'mean', 'means',
+    'does', 'do', 'please', 'can', 'could', 'would', 'you', 'jarvis', 'i', 'want', 'know',
+    'kya', 'hai', 'hain', 'hota', 'hoti', 'hote', 'ke', 'bare', 'baare', 'mein', 'batao',
+    'bataiye', 'samjhao', 'samjhaiye', 'ka', 'ki', 'ko', 'karo', 'kijiye', 'mujhe', 'achcha',
+})
+
+# Devanagari vowel signs are not \w, so keep the whole block explicitly.
+# Symbols stay too - "c++" / "c#" and "2+2" / "2*2" are different questions.
+_TOKEN = re.compile(r"[\w'\u0900-\u097F+#*/=.]+", re.UNICODE)
+
+# Keys with symbols or digits are only served on an exact key match: the
+# embedder drops symbols, and "2+2" / "2+3" are n-gram neighbours
+_EXACT_ONLY = re.compile(r"[+#*/=.\d]")
+
+
+class AnswerCache:
+    """
+    Explanations keyed by what the question is about
+
+    Questions are reduced to their content words, embedded with the
+    hashed n-gram embedder and compared by cosine similarity against every
+    live entry (vectors are kept in memory as one matrix; on disk they are
+    float16 blobs). Keys with symbols or digits ("c++", "2+2") are looked
+    up by exact key instead. Entries expire after their TTL, the least recently
+    used ones are evicted beyond max_entries, and questions matching an
+    exclude pattern (today, latest, weather, ...) are never cached.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, threshold: float = 0.85,
+                 ttl: float = 7 * 24 * 3600, max_entries: int = 500, dim: int = 1024,
+                 exclude_patterns: Optional[Iterable[str]] = None):
+        """
+        Initialize answer cache
+
+        Args:
+            db_path: SQLite database file (default from ANSWER_CACHE_CONFIG)
+            threshold: Minimum cosine similarity to serve a cached answer
+            ttl: Default seconds an answer stays valid
+            max_entries: Entries kept before least recently used ones are evicted
+            dim: Hashed feature dimensions
+            exclude_patterns: Regexes for time-sensitive questions that are never cached
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+        self.db_path = db_path or ANSWER_CACHE_CONFIG['db_path']
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embedder = HashedNgramEmbedder(dim)
+        patterns = ANSWER_CACHE_CONFIG['exclude_patterns'] if exclude_patterns is None else exclude_patterns
+        self.exclude = re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE) if patterns else None
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.evicted = 0
+        self._load()
+        logger.info(f"✅ Answer cache opened: {self.db_path} ({len(self._ids)} answers)")
+
+    def _load(self):
+        """Read live vectors into memory (dropping expired rows first)"""
+        with self._lock:
+            self._conn.execute('DELETE FROM answers WHERE expires <= ?', (time.time(),))
+            self._conn.commit()
+            rows = self._conn.execute('SELECT id, question, key, vector, expires FROM answers').fetchall()
+            self._ids = np.array([row['id'] for row in rows], dtype=np.int64)
+            self._expires = np.array([row['expires'] for row in rows], dtype=np.float64)
+            # Keys are recomputed so rows stored under an older key() still match correctly
+            self._keys = np.array([self.key(row['question']) for row in rows], dtype=object)
+            self._exact = np.array([bool(_EXACT_ONLY.search(key)) for key in self._keys], dtype=bool)
+            self._matrix = np.zeros((len(rows), self.embedder.dim), dtype=np.float32)
+            for i, row in enumerate(rows):
+                if row['key'] == self._keys[i]:
+                    self._matrix[i] = np.frombuffer(row['vector'], dtype=np.float16)
+                else:
+                    self._matrix[i] = self.embedder.embed(self._keys[i])
+
+    def key(self, question: str) -> str:
+        """Content words of a question ('' if there are none)"""
+        words = (token.rstrip('.') for token in _TOKEN.findall(question.lower()))
+        return ' '.join(w for w in words if w and w not in QUESTION_WORDS)
+
+    def cacheable(self, question: str) -> bool:
+        """False for time-sensitive questions and ones with no content words"""
+        if self.exclude is not None and self.exclude.search(question):
+            return False
+        return bool(self.key(question))
+
+    def _nearest(self, key: str, vector) -> tuple:
+        """(row, similarity) of the closest live entry, or (-1, 0.0)"""
+        if not len(self._ids):
+            return -1, 0.0
+        live = self._expires > time.time()
+        if _EXACT_ONLY.search(key):
+            rows = np.flatnonzero(live & (self._keys == key))
+            return (int(rows[-1]), 1.0) if len(rows) else (-1, 0.0)
+        similarities = self._matrix @ vector
+        similarities[~live | self._exact] = -1.0
+        row = int(similarities.argmax())
+        return row, float(similarities[row])
+
+    @traced("answer_cache")
+    def get(self, question: str) -> Optional[str]:
+        """
+        Cached answer for a question meaning the same thing
+
+        Returns:
+            Answer text, or None on a miss (or for uncacheable questions)
+        """
+        if not self.cacheable(question):
+            self.skipped += 1
+            return None
+        key = self.key(question)
+        vector = self.embedder.embed(key)
+        with self._lock:
+            row, similarity = self._nearest(key, vector)
+            if row < 0 or similarity < self.threshold:
+                self.misses += 1
+                return None
+            entry_id = int(self._ids[row])
+            result = self._conn.execute('SELECT question, answer FROM answers WHERE id = ?',
+                                        (entry_id,)).fetchone()
+            if result is None:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE answers SET last_used = ?, hits = hits + 1 WHERE id = ?',
+                               (time.time(), entry_id))
+            self._conn.commit()
+        self.hits += 1
+        logger.info("💾 ANSWER CACHE HIT (%.2f, cached for '%s')", similarity, result['question'])
+        return result['answer']
+
+    def put(self, question: str, answer: str, ttl: Optional[float] = None):
+        """
+        Store an answer
+
+        Args:
+            question: Question as the user asked it
+            answer: Answer to serve for it and its paraphrases
+            ttl: Seconds the answer stays valid (default: the cache TTL, 0 = don't store)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if not ttl or not answer or not self.cacheable(question):
+            return
+        key = self.key(question)
+        vector = self.embedder.embed(key)
+        blob = vector.astype(np.float16).tobytes()
+        now = time.time()
+        with self._lock:
+            row, similarity = self._nearest(key, vector)
+            if row >= 0 and similarity >= self.threshold:
+                # Same question again (e.g. after a follow-up) - refresh it
+                self._conn.execute(
+                    'UPDATE answers SET question = ?, key = ?, vector = ?, answer = ?, created = ?, '
+                    'expires = ?, last_used = ? WHERE id = ?',
+                    (question, key, blob, answer, now, now + ttl, now, int(self._ids[row])))
+                self._conn.commit()
+                self._matrix[row] = vector
+                self._expires[row] = now + ttl
+                self._keys[row] = key
+                return
+            cursor = self._conn.execute(
+                'INSERT INTO answers (question, key, vector, answer, created, expires, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)', (question, key, blob, answer, now, now + ttl, now))
+            self._conn.commit()
+            self._ids = np.append(self._ids, cursor.lastrowid)
+            self._expires = np.append(self._expires, now + ttl)
+            self._keys = np.append(self._keys, key)
+            self._exact = np.append(self._exact, bool(_EXACT_ONLY.search(key)))
+            self._matrix = np.vstack([self._matrix, vector[None, :]])
+            if len(self._ids) > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones down to max_entries"""
+        with self._lock:
+            self._conn.execute('DELETE FROM answers WHERE expires <= ?', (time.time(),))
+            count = self._conn.execute('SELECT COUNT(*) FROM answers').fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                self._conn.execute('DELETE FROM answers WHERE id IN '
+                                   '(SELECT id FROM answers ORDER BY last_used LIMIT ?)', (excess,))
+            self._conn.commit()
+            before = len(self._ids)
+            self._load()
+            self.evicted += before - len(self._ids)
+
+    def clear(self):
+        """Forget every answer"""
+        with self._lock:
+            self._conn.execute('DELETE FROM answers')
+            self._conn.commit()
+            self._load()
+        logger.info("🧹 Answer cache cleared")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict:
+        """Hit rate and size"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._ids),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'skipped': self.skipped,
+            'evicted': self.evicted,
+        }
+
+
+# Global instance for easy access
+_answer_cache = None
+
+def get_answer_cache() -> Optional[AnswerCache]:
+    """
+    Get or create global answer cache (settings from ANSWER_CACHE_CONFIG)
+
+    Returns:
+        The cache, or None if disabled or NumPy is missing
+    """
+    global _answer_cache
+    if _answer_cache is None:
+        if not ANSWER_CACHE_CONFIG['enabled']:
+            return None
+        if np is None:
+            logger.warning("⚠️ numpy not installed - answer cache disabled")
+            return None
+        _answer_cache = AnswerCache(
+            threshold=ANSWER_CACHE_CONFIG['threshold'],
+            ttl=ANSWER_CACHE_CONFIG['ttl'],
+            max_entries=ANSWER_CACHE_CONFIG['max_entries'],
+            dim=ANSWER_CACHE_CONFIG['dim'],
+        )
+    return _answer_cache
@@ -0,0 +1,232 @@
+"""
+JARVIS App Resolver - One Answer to "Which App Did The User Mean?"
+Maps spoken English/Hindi/Hinglish app names to an app SystemController can
+launch on this OS (or a website), using a precomputed alias table, phonetic
+keys and a memoized fuzzy fallback
+"""
+import logging
+import re
+import shutil
+from collections import namedtuple
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from config import APP_ALIASES, WEBSITES
+
+try:
+    from fuzzywuzzy import fuzz
+except ImportError:
+    fuzz = None
+
+logger = logging.getLogger(__name__)
+
+# Phonetic keys shorter than this collide too easily ("clock" / "calc")
+MIN_PHONETIC_KEY = 3
+
+# Spelling similarity (0-100) a phonetic match still needs - sound-alike
+# keys alone match "chromium" to chrome
+PHONETIC_FLOOR = 75
+
+# kind is 'app' (launch through SystemController) or 'website' (target is a URL)
+AppMatch = namedtuple('AppMatch', ['name', 'kind', 'target', 'alias', 'score'])
+
+# Words that surround an app name in a spoken command
+FILLER_WORDS = frozenset([
+    # English
+    'open', 'opening', 'opened', 'launch', 'start', 'run', 'please', 'the', 'app',
+    'application', 'can', 'could', 'you', 'for', 'me', 'my', 'now', 'and', 'up',
+    'hey', 'hello', 'hi', 'jarvis',
+    # Hinglish
+    'kholo', 'khol', 'chalu', 'shuru', 'kijiye', 'karo', 'kariye', 'kar', 'do', 'dikhao',
+    'aap', 'zara', 'jara', 'sakte', 'ho', 'mera', 'meri',
+    # Hindi
+    'खोलो', 'खोल', 'ओपन', 'ओपनिंग', 'करो', 'कर', 'और', 'उसमें', 'दो', 'हेलो', 'जार्विस',
+    'व्हाट', 'आर', 'यू', 'डूइंग', 'ज़रा', 'आप', 'कीजिए',
+])
+
+# Devanagari vowel signs are not \w, so keep the whole block explicitly
+_PUNCTUATION = re.compile(r'[^\w\s\u0900-\u097F]+', re.UNICODE)
+
+# Rough Devanagari -> Latin mapping, enough to line up phonetic keys
+_DEVANAGARI = str.maketrans({
+    'क': 'k', 'ख': 'k', 'ग': 'g', 'घ': 'g', 'च': 'ch', 'छ': 'ch', 'ज': 'j', 'झ': 'j',
+    'ट': 't', 'ठ': 't', 'ड': 'd', 'ढ': 'd', 'ण': 'n', 'त': 't', 'थ': 't', 'द': 'd',
+    'ध': 'd', 'न': 'n', 'प': 'p', 'फ': 'f', 'ब': 'b', 'भ': 'b', 'म': 'm', 'य': 'y',
+    'र': 'r', 'ल': 'l', 'व': 'v', 'श': 's', 'ष': 's', 'स': 's', 'ह': 'h',
+    'अ': 'a', 'आ': 'a', 'इ': 'i', 'ई': 'i', 'उ': 'u', 'ऊ': 'u', 'ए': 'e', 'ऐ': 'e',
+    'ओ': 'o', 'औ': 'o', 'ऑ': 'o',
+    'ा': 'a', 'ि': 'i', 'ी': 'i', 'ु': 'u', 'ू': 'u', 'े': 'e', 'ै': 'e', 'ो': 'o',
+    'ौ': 'o', 'ॉ': 'o', 'ं': 'n', 'ँ': 'n', '्': '', '़': '',
+})
+
+
+def app_phrase(command: str) -> str:
+    """The words of a command that can name an app (fillers like "open"/"kholo" removed)"""
+    return ' '.join(w for w in normalize(command).split() if w not in FILLER_WORDS)
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip punctuation and collapse whitespace"""
+    return ' '.join(_PUNCTUATION.sub(' ', text.lower()).split())
+
+
+def spelling(text: str) -> str:
+    """Latin-script spelling with sound-alike letters unified (\"क्रोम\" -> \"krom\", \"chrome\" -> \"khrome\")"""
+    key = normalize(text).translate(_DEVANAGARI).replace(' ', '')
+    key = key.replace('ph', 'f').replace('x', 'ks')
+    return key.translate(str.maketrans('wcqz', 'vkks'))
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Sound-alike key for an app name (Devanagari or Latin script)
+
+    "chrome", "krome" and "क्रोम" all map to "krm"; "whatsapp" and
+    "व्हाट्सएप" both map to "vtsp".
+    """
+    key = spelling(text)
+    if not key:
+        return ''
+
+    first, rest = key[0], key[1:]
+    rest = ''.join(ch for ch in rest if ch not in 'aeiouyh' and ch.isalpha())
+    collapsed = first
+    for ch in rest:
+        if ch != collapsed[-1]:
+            collapsed += ch
+    return collapsed
+
+
+@lru_cache(maxsize=256)
+def which(executable: str) -> Optional[str]:
+    """Cached PATH lookup for an executable"""
+    return shutil.which(executable)
+
+
+class AppResolver:
+    """
+    Resolves app names from spoken commands
+
+    Targets are the apps SystemController can launch on this OS plus the
+    websites; spoken aliases are layered on top. Lookup order: exact alias
+    (longest phrase first), phonetic key (with a spelling-similarity floor),
+    then a fuzzy score of the whole phrase. Results are memoized per command.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None,
+                 websites: Optional[Dict[str, str]] = None, min_score: int = 80,
+                 commands: Optional[Dict[str, str]] = None):
+        """
+        Initialize resolver and precompute lookup tables
+
+        Args:
+            aliases: Canonical app name -> spoken aliases (default APP_ALIASES)
+            websites: Site name -> URL (default WEBSITES)
+            min_score: Minimum fuzzy score (0-100) to accept a match
+            commands: App name -> launch command (default: SystemController's
+                APP_COMMANDS for this OS)
+        """
+        if commands is None:
+            # system_controller imports which() from here - import it late
+            from system_controller import APP_COMMANDS, CURRENT_OS
+            commands = APP_COMMANDS.get(CURRENT_OS, {})
+        self.websites = dict(WEBSITES if websites is None else websites)
+        self.min_score = min_score
+        self.targets = set(commands) | set(self.websites)
+
+        # Aliases first, so "google chrome" lands on chrome rather than on
+        # its own APP_COMMANDS entry; apps this OS can't launch are left out
+        self.alias_table: Dict[str, str] = {}
+        for name, spoken in (APP_ALIASES if aliases is None else aliases).items():
+            if name not in self.targets:
+                continue
+            for alias in [name] + list(spoken):
+                self.alias_table.setdefault(normalize(alias), name)
+        for name in self.targets:
+            self.alias_table.setdefault(normalize(name), name)
+
+        # Phonetic key -> aliases sharing it; a match also has to be spelled
+        # alike (PHONETIC_FLOOR), which settles keys shared by several apps
+        self.phonetic_table: Dict[str, List[str]] = {}
+        for alias in self.alias_table:
+            key = phonetic_key(alias)
+            if len(key) >= MIN_PHONETIC_KEY:
+                self.phonetic_table.setdefault(key, []).append(alias)
+
+        self.max_alias_words = max(len(alias.split()) for alias in self.alias_table)
+        self._aliases = list(self.alias_table)
+        self.resolve = lru_cache(maxsize=1024)(self._resolve)
+
+        logger.info(f"✅ App resolver initialized ({len(self.alias_table)} aliases)")
+
+    def _resolve(self, command: str) -> Optional[AppMatch]:
+        """
+        Resolve the app named in a command
+
+        Args:
+            command: Full spoken command, e.g. "chrome kholo"
+
+        Returns:
+            AppMatch or None if no app was recognised
+        """
+        words = app_phrase(command).split()
+        if not words:
+            return None
+
+        phrases = [' '.join(words[i:i + n])
+                   for n in range(min(self.max_alias_words, len(words)), 0, -1)
+                   for i in range(len(words) - n + 1)]
+
+        # 1. Exact alias, longest phrase first
+        for phrase in phrases:
+            name = self.alias_table.get(phrase)
+            if name:
+                return self._match(name, phrase, 100)
+
+        # 2. Phonetic key, if the spelling is close too
+        for phrase in phrases:
+            aliases = self.phonetic_table.get(phonetic_key(phrase))
+            if not aliases:
+                continue
+            score, alias = max((self._score(spelling(phrase), spelling(alias)), alias) for alias in aliases)
+            if score >= PHONETIC_FLOOR:
+                return self._match(self.alias_table[alias], phrase, 90)
+
+        # 3. Fuzzy score of the whole phrase (single words like "file" in
+        # "file hanuman chalisa" would match far too much)
+        phrase = ' '.join(words)
+        best_alias, best_score = None, 0
+        for alias in self._aliases:
+            score = self._score(phrase, alias)
+            if score > best_score:
+                best_alias, best_score = alias, score
+        if best_score >= self.min_score:
+            return self._match(self.alias_table[best_alias], best_alias, best_score)
+
+        logger.debug(f"App resolver: no match for '{command}'")
+        return None
+
+    def _match(self, name: str, alias: str, score: int) -> AppMatch:
+        """Build an AppMatch for a canonical name"""
+        if name in self.websites:
+            return AppMatch(name, 'website', self.websites[name], alias, score)
+        return AppMatch(name, 'app', None, alias, score)
+
+    @staticmethod
+    def _score(query: str, alias: str) -> int:
+        """Fuzzy similarity between a spoken phrase and an alias"""
+        if fuzz:
+            return fuzz.ratio(query, alias)
+        return int(SequenceMatcher(None, query, alias).ratio() * 100)
+
+
+# Global instance for easy access
+_app_resolver = None
+
+def get_app_resolver() -> AppResolver:
+    """Get global AppResolver instance"""
+    global _app_resolver
+    if _app_resolver is None:
+        _app_resolver = AppResolver()
+    return _app_resolver
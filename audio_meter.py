@@ -0,0 +1,233 @@
+"""
+JARVIS Audio Meter - Live Microphone Levels
+Per-band RMS/peak metering of the mic stream for the waveform visualizer,
+voice activity checks and noise-floor diagnostics
+"""
+import logging
+import math
+from typing import Dict, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# PCM sample width (bytes) -> NumPy dtype and full-scale value
+_SAMPLE_FORMATS = {
+    1: ('u1', 128.0),
+    2: ('<i2', 32768.0),
+    4: ('<i4', 2147483648.0),
+}
+
+
+class LevelBuffer:
+    """
+    Single-writer, lock-free level buffer
+
+    The audio thread writes new levels between two increments of a
+    sequence number; readers copy the array out and retry if the sequence
+    changed underneath them (a seqlock). Readers never block the writer.
+    """
+
+    def __init__(self, size: int):
+        self.data = np.zeros(size, dtype=np.float32)
+        self.seq = 0
+
+    def write(self, values):
+        """Publish new values (audio thread only)"""
+        self.seq += 1          # odd: write in progress
+        np.copyto(self.data, values)
+        self.seq += 1          # even: stable
+
+    def read_into(self, out, retries: int = 3) -> bool:
+        """
+        Copy the latest values into a caller-owned array
+
+        Args:
+            out: Preallocated float array of the same size
+            retries: Attempts before accepting a torn read
+
+        Returns:
+            True if a consistent snapshot was copied
+        """
+        for _ in range(retries):
+            seq = self.seq
+            if seq % 2:
+                continue
+            np.copyto(out, self.data)
+            if self.seq == seq:
+                return True
+        np.copyto(out, self.data)
+        return False
+
+
+class LevelMeter:
+    """
+    Computes per-band levels from raw PCM chunks
+
+    Each chunk is windowed and FFT'd; magnitudes are grouped into
+    log-spaced bands and mapped from dB to 0..1. Overall RMS and peak
+    (dBFS) and a slowly adapting noise floor are tracked alongside.
+    """
+
+    def __init__(self, bands: int = 32, sample_rate: int = 16000, sample_width: int = 2,
+                 min_db: float = -70.0, max_db: float = -10.0, smoothing: float = 0.5,
+                 speech_margin_db: float = 10.0):
+        """
+        Initialize level meter
+
+        Args:
+            bands: Number of frequency bands
+            sample_rate: Stream sample rate (Hz)
+            sample_width: Bytes per sample (1, 2 or 4)
+            min_db: Band level shown as 0
+            max_db: Band level shown as 1
+            smoothing: Fall-off factor for band levels (0 = none)
+            speech_margin_db: dB above the noise floor that counts as speech
+        """
+        self.bands = bands
+        self.sample_rate = sample_rate
+        self.min_db = min_db
+        self.max_db = max_db
+        self.smoothing = smoothing
+        self.speech_margin_db = speech_margin_db
+        self.dtype, self.full_scale = _SAMPLE_FORMATS.get(sample_width, _SAMPLE_FORMATS[2])
+
+        self.available = np is not None
+        if not self.available:
+            logger.warning("⚠️ NumPy not installed - microphone level meter disabled")
+            return
+
+        self.levels = LevelBuffer(bands)   # smoothed band levels, 0..1
+        self.peaks = LevelBuffer(bands)    # per-band peak levels, 0..1
+        self._levels = np.zeros(bands, dtype=np.float32)
+        self._peaks = np.zeros(bands, dtype=np.float32)
+        self._frame_size = None
+
+        self.rms_db = -120.0
+        self.peak_db = -120.0
+        self.noise_floor_db = None
+        self.chunks = 0
+
+    def _prepare(self, frame_size: int):
+        """Precompute the window and band edges for a chunk size"""
+        self._frame_size = frame_size
+        self._window = np.hanning(frame_size).astype(np.float32)
+        self._window_gain = float(self._window.sum()) / 2
+
+        freqs = np.fft.rfftfreq(frame_size, 1.0 / self.sample_rate)
+        edges = np.geomspace(80.0, self.sample_rate / 2, self.bands + 1)
+        starts = np.searchsorted(freqs, edges[:-1])
+        # Every band gets at least one FFT bin (low bands are narrower than a bin)
+        for i in range(1, self.bands):
+            starts[i] = max(starts[i], starts[i - 1] + 1)
+        starts = np.minimum(starts, len(freqs) - 1)
+        self._band_starts = starts
+        ends = np.append(starts[1:], len(freqs))
+        self._band_widths = np.maximum(ends - starts, 1).astype(np.float32)
+
+    def process(self, chunk: bytes):
+        """
+        Meter one chunk of PCM audio (called from the audio thread)
+
+        Args:
+            chunk: Raw little-endian PCM bytes
+        """
+        if not self.available or not chunk:
+            return
+        try:
+            samples = np.frombuffer(chunk, dtype=self.dtype).astype(np.float32)
+            if self.dtype == 'u1':
+                samples -= 128.0
+            samples /= self.full_scale
+            if len(samples) < 8:
+                return
+            if len(samples) != self._frame_size:
+                self._prepare(len(samples))
+
+            # Overall level (dBFS)
+            rms = float(np.sqrt(np.mean(samples * samples)))
+            peak = float(np.max(np.abs(samples)))
+            self.rms_db = 20 * math.log10(rms + 1e-9)
+            self.peak_db = 20 * math.log10(peak + 1e-9)
+            self._track_noise_floor()
+
+            # Per-band RMS and peak from the spectrum
+            power = np.abs(np.fft.rfft(samples * self._window)) / self._window_gain
+            power *= power
+            band_rms = np.sqrt(np.add.reduceat(power, self._band_starts) / self._band_widths)
+            band_peak = np.sqrt(np.maximum.reduceat(power, self._band_starts))
+
+            levels = self._to_unit(band_rms)
+            np.maximum(levels, self._levels * self.smoothing, out=self._levels)
+            np.maximum(self._to_unit(band_peak), self._peaks * 0.9, out=self._peaks)
+
+            self.levels.write(self._levels)
+            self.peaks.write(self._peaks)
+            self.chunks += 1
+        except Exception as e:
+            logger.debug(f"Level meter error: {e}")
+
+    def _to_unit(self, amplitude):
+        """Map linear amplitudes to 0..1 on the meter's dB scale"""
+        db = 20 * np.log10(amplitude + 1e-9)
+        return np.clip((db - self.min_db) / (self.max_db - self.min_db), 0.0, 1.0).astype(np.float32)
+
+    def _track_noise_floor(self):
+        """Follow quiet passages quickly, loud ones very slowly"""
+        if self.noise_floor_db is None:
+            self.noise_floor_db = self.rms_db
+        elif self.rms_db < self.noise_floor_db:
+            self.noise_floor_db += (self.rms_db - self.noise_floor_db) * 0.3
+        else:
+            self.noise_floor_db += (self.rms_db - self.noise_floor_db) * 0.005
+
+    def reset(self):
+        """Drop levels to zero (e.g. when the mic closes)"""
+        if self.available:
+            self._levels.fill(0)
+            self._peaks.fill(0)
+            self.levels.write(self._levels)
+            self.peaks.write(self._peaks)
+
+    def is_speech(self) -> bool:
+        """Rough voice activity check against the noise floor"""
+        if not self.available or self.noise_floor_db is None:
+            return False
+        return self.rms_db > self.noise_floor_db + self.speech_margin_db
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Current levels for diagnostics"""
+        if not self.available:
+            return {'available': False}
+        return {
+            'available': True,
+            'rms_db': round(self.rms_db, 1),
+            'peak_db': round(self.peak_db, 1),
+            'noise_floor_db': None if self.noise_floor_db is None else round(self.noise_floor_db, 1),
+            'speech': self.is_speech(),
+            'chunks': self.chunks,
+        }
+
+
+class MeteredStream:
+    """
+    Wraps a PyAudio input stream and feeds every chunk read to a LevelMeter
+
+    Drop-in for speech_recognition's Microphone.stream, so metering reuses
+    the recognizer's own reads instead of opening a second stream.
+    """
+
+    def __init__(self, stream, meter: LevelMeter):
+        self._stream = stream
+        self._meter = meter
+
+    def read(self, size):
+        data = self._stream.read(size)
+        self._meter.process(data)
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
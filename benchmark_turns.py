@@ -0,0 +1,458 @@
+"""
+JARVIS Turn Latency Benchmark
+Drives the full listen -> brain -> tasks -> translate -> speak pipeline
+with deterministic stand-ins for the recognizer, Gemini, translator, TTS
+and app launching, and reports p50/p95/p99 per stage and per turn
+
+Usage:
+    python benchmark_turns.py                                  # built-in text fixtures
+    python benchmark_turns.py --wav-dir recordings/            # WAVs + same-name .txt transcripts
+    python benchmark_turns.py --delay gemini=1200 --repeat 10
+    python benchmark_turns.py --save-baseline benchmark_baseline.json
+    python benchmark_turns.py --baseline benchmark_baseline.json   # exit 1 on regression
+"""
+import argparse
+import array
+import json
+import logging
+import math
+import os
+import random
+import sys
+import time
+import wave
+from typing import Dict, List, Optional, Tuple
+
+import speech_recognition as sr
+
+from jarvis_brain import JarvisBrain
+from jarvis_memory import ConversationMemory
+from jarvis_tasks import JarvisTasks
+from jarvis_voice_advanced import JarvisVoiceSystem
+from knowledge_engine import KnowledgeEngine
+from tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+
+STAGES = ['listen', 'brain', 'tasks', 'translate', 'speak', 'total']
+
+# Injected latencies of the external services (ms, +/- JITTER)
+DEFAULT_DELAYS_MS = {
+    'recognize': 250,      # Google speech recognition round trip
+    'gemini': 600,         # Gemini generate_content
+    'translate': 120,      # GoogleTranslator.translate
+    'tts': 200,            # TTS synthesis before playback starts
+    'automation': 40,      # Launching an app / browser tab
+}
+JITTER = 0.1
+
+# (text, language) - one per brain route
+TEXT_FIXTURES = [
+    ("open chrome", 'en'),
+    ("search python tutorials", 'en'),
+    ("play believer on youtube", 'en'),
+    ("what time is it", 'en'),
+    ("what is machine learning", 'en'),
+    ("explain how photosynthesis works", 'en'),
+    ("hello jarvis how are you", 'en'),
+    ("thank you", 'en'),
+]
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2
+CHUNK = 1024
+WORD_SECONDS = 0.35        # speaking rate used to size synthetic utterances
+
+
+# ----------------------------------------------------------------- #
+# Stand-ins
+# ----------------------------------------------------------------- #
+class FakeDelays:
+    """Deterministic jittered delays (seeded)"""
+
+    def __init__(self, delays_ms: Dict[str, float], seed: int = 42):
+        self.delays_ms = delays_ms
+        self.random = random.Random(seed)
+
+    def sleep(self, name: str):
+        base = self.delays_ms.get(name, 0) / 1000
+        if base:
+            time.sleep(base * self.random.uniform(1 - JITTER, 1 + JITTER))
+
+
+class Utterance:
+    """One fixture: transcript, language and PCM audio"""
+
+    def __init__(self, text: str, language: str = 'en', pcm: Optional[bytes] = None):
+        self.text = text
+        self.language = language
+        self.pcm = pcm if pcm is not None else synth_pcm(len(text.split()) * WORD_SECONDS)
+
+    @property
+    def duration(self) -> float:
+        return len(self.pcm) / (SAMPLE_RATE * SAMPLE_WIDTH)
+
+
+def synth_pcm(seconds: float) -> bytes:
+    """Deterministic voice-like test signal (two tones, 16-bit mono)"""
+    samples = array.array('h', (
+        int(6000 * math.sin(2 * math.pi * 220 * i / SAMPLE_RATE)
+            + 3000 * math.sin(2 * math.pi * 1100 * i / SAMPLE_RATE))
+        for i in range(int(seconds * SAMPLE_RATE))
+    ))
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+class FakeAudioStream:
+    """PyAudio-style stream over a PCM buffer (silence once exhausted)"""
+
+    def __init__(self, pcm: bytes):
+        self.pcm = pcm
+        self.pos = 0
+
+    def read(self, size):
+        nbytes = size * SAMPLE_WIDTH
+        data = self.pcm[self.pos:self.pos + nbytes]
+        self.pos += nbytes
+        return data + b'\x00' * (nbytes - len(data))
+
+
+class FakeMicrophone:
+    """Stands in for sr.Microphone; plays the current fixture's audio"""
+    SAMPLE_RATE = SAMPLE_RATE
+    SAMPLE_WIDTH = SAMPLE_WIDTH
+    CHUNK = CHUNK
+
+    def __init__(self):
+        self.utterance: Optional[Utterance] = None
+        self.stream = None
+
+    def __enter__(self):
+        self.stream = FakeAudioStream(self.utterance.pcm)
+        return self
+
+    def __exit__(self, *exc):
+        self.stream = None
+
+
+class FakeAudioData:
+    def __init__(self, utterance: Utterance):
+        self.utterance = utterance
+
+
+class FakeRecognizer:
+    """
+    Stands in for sr.Recognizer
+
+    Calibration and listening consume the fixture audio through the
+    (metered) stream and take its duration divided by `audio_speed`;
+    recognition takes the 'recognize' delay and returns the transcript.
+    """
+
+    def __init__(self, delays: FakeDelays, audio_speed: float = 10.0):
+        self.delays = delays
+        self.audio_speed = audio_speed
+        self.energy_threshold = 300
+        self.dynamic_energy_threshold = True
+        self.pause_threshold = 0.8
+
+    def _consume(self, source, seconds: float):
+        for _ in range(max(int(seconds * SAMPLE_RATE / CHUNK), 1)):
+            source.stream.read(CHUNK)
+        time.sleep(seconds / self.audio_speed)
+
+    def adjust_for_ambient_noise(self, source, duration: float = 1.0):
+        self._consume(source, duration)
+
+    def listen(self, source, timeout=None, phrase_time_limit=None):
+        # Speech plus the trailing pause that ends the phrase
+        self._consume(source, source.utterance.duration + self.pause_threshold)
+        return FakeAudioData(source.utterance)
+
+    def recognize_google(self, audio: FakeAudioData, language: str = 'en-US'):
+        self.delays.sleep('recognize')
+        if not language.startswith(audio.utterance.language):
+            raise sr.UnknownValueError()
+        return audio.utterance.text
+
+
+class FakeGeminiResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """Stands in for genai.GenerativeModel"""
+
+    def __init__(self, delays: FakeDelays):
+        self.delays = delays
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.delays.sleep('gemini')
+        self.calls += 1
+        return FakeGeminiResponse(
+            "Here is a simple explanation.\n\n"
+            "It works step by step, much like everyday examples you already know.\n\n"
+            "In short: that's the idea."
+        )
+
+
+class FakeTranslator:
+    """Stands in for deep_translator.GoogleTranslator"""
+    delays: FakeDelays = None
+
+    def __init__(self, source: str = 'auto', target: str = 'en'):
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        self.delays.sleep('translate')
+        return f"[{self.target}] {text}"
+
+
+class FakeTTSEngine:
+    """Stands in for pyttsx3 (synthesis delay only, no playback)"""
+
+    def __init__(self, delays: FakeDelays):
+        self.delays = delays
+        self.spoken = []
+
+    def say(self, text: str):
+        self.spoken.append(text)
+
+    def runAndWait(self):
+        self.delays.sleep('tts')
+
+
+class FakeSystemController:
+    """Stands in for SystemController - every launch takes the 'automation' delay"""
+
+    def __init__(self, delays: FakeDelays):
+        self.delays = delays
+
+    def __getattr__(self, name):
+        def launch(*args, **kwargs):
+            self.delays.sleep('automation')
+            return True, f"{name} ok"
+        return launch
+
+
+# ----------------------------------------------------------------- #
+# Pipeline
+# ----------------------------------------------------------------- #
+def build_pipeline(delays: FakeDelays, output_language: str, audio_speed: float):
+    """Real brain/tasks/voice objects wired to the stand-ins"""
+    memory = ConversationMemory()
+    engine = KnowledgeEngine(api_key='benchmark', model_name='fake-gemini', model=FakeGeminiModel(delays),
+                             memory=memory)
+    brain = JarvisBrain(memory, knowledge_engine=engine)
+
+    tasks = JarvisTasks()
+    tasks.system_controller = FakeSystemController(delays)
+    tasks.automation = None
+    tasks.content_extractor = None
+
+    FakeTranslator.delays = delays
+    microphone = FakeMicrophone()
+    voice = JarvisVoiceSystem(
+        recognizer=FakeRecognizer(delays, audio_speed),
+        microphone=microphone,
+        tts_engine=FakeTTSEngine(delays),
+        translator_factory=FakeTranslator,
+    )
+    voice.output_language = output_language
+    return voice, brain, tasks, microphone
+
+
+def run_turn(voice, brain, tasks) -> Dict[str, float]:
+    """One turn, as in the GUI listening loop; returns ms per stage"""
+    timings = {}
+    turn_start = time.perf_counter()
+
+    started = time.perf_counter()
+    text, lang = voice.listen(timeout=10)
+    timings['listen'] = (time.perf_counter() - started) * 1000
+    if not text:
+        raise RuntimeError("fixture was not recognized")
+
+    started = time.perf_counter()
+    result = brain.process_input(text, lang)
+    timings['brain'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    if result['action']:
+        task_response = tasks.execute_task(result)
+        if task_response:
+            result['response'] = task_response
+    timings['tasks'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    response = result['response']
+    if voice.output_language != 'en':
+        response = voice.translate_text(response, voice.output_language)
+    timings['translate'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    voice.speak(response)
+    timings['speak'] = (time.perf_counter() - started) * 1000
+
+    timings['total'] = (time.perf_counter() - turn_start) * 1000
+    return timings
+
+
+def load_wav_fixtures(wav_dir: str) -> List[Utterance]:
+    """WAV files (16 kHz 16-bit mono) with the transcript in a same-name .txt"""
+    fixtures = []
+    for name in sorted(os.listdir(wav_dir)):
+        if not name.lower().endswith('.wav'):
+            continue
+        path = os.path.join(wav_dir, name)
+        transcript_path = os.path.splitext(path)[0] + '.txt'
+        if not os.path.exists(transcript_path):
+            logger.warning(f"⚠️ No transcript for {name}, skipping")
+            continue
+        with open(transcript_path, encoding='utf-8') as f:
+            text = f.read().strip()
+        with wave.open(path, 'rb') as w:
+            if w.getframerate() != SAMPLE_RATE or w.getsampwidth() != SAMPLE_WIDTH or w.getnchannels() != 1:
+                logger.warning(f"⚠️ {name} is not 16 kHz 16-bit mono, skipping")
+                continue
+            pcm = w.readframes(w.getnframes())
+        fixtures.append(Utterance(text, 'en', pcm))
+    return fixtures
+
+
+# ----------------------------------------------------------------- #
+# Statistics and regression check
+# ----------------------------------------------------------------- #
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for stage in STAGES:
+        values = [s[stage] for s in samples]
+        summary[stage] = {
+            'p50': round(percentile(values, 50), 2),
+            'p95': round(percentile(values, 95), 2),
+            'p99': round(percentile(values, 99), 2),
+            'max': round(max(values), 2),
+        }
+    return summary
+
+
+def find_regressions(summary: Dict, baseline: Dict, tolerance: float, min_ms: float,
+                     limits: Dict[str, float]) -> List[str]:
+    """
+    Compare p95 per stage against a baseline and absolute limits
+
+    A stage regresses when its p95 exceeds the baseline p95 by more than
+    `tolerance` (relative) and `min_ms` (absolute), or exceeds its limit.
+    """
+    problems = []
+    for stage, stats in summary.items():
+        base = baseline.get(stage)
+        if base:
+            allowed = max(base['p95'] * (1 + tolerance), base['p95'] + min_ms)
+            if stats['p95'] > allowed:
+                problems.append(f"{stage}: p95 {stats['p95']:.1f} ms > {allowed:.1f} ms "
+                                f"(baseline {base['p95']:.1f} ms)")
+        if stage in limits and stats['p95'] > limits[stage]:
+            problems.append(f"{stage}: p95 {stats['p95']:.1f} ms > limit {limits[stage]:.1f} ms")
+    return problems
+
+
+def parse_pairs(pairs: List[str]) -> Dict[str, float]:
+    """['gemini=800', ...] -> {'gemini': 800.0}"""
+    parsed = {}
+    for pair in pairs or []:
+        name, value = pair.split('=', 1)
+        parsed[name.strip()] = float(value)
+    return parsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="JARVIS end-to-end turn latency benchmark")
+    parser.add_argument('--wav-dir', help="Directory of WAV fixtures with .txt transcripts")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs over the fixture set")
+    parser.add_argument('--delay', action='append', metavar='NAME=MS',
+                        help=f"Override an injected delay ({', '.join(DEFAULT_DELAYS_MS)})")
+    parser.add_argument('--language', default='hi', help="Output language (translation when not 'en')")
+    parser.add_argument('--audio-speed', type=float, default=10.0,
+                        help="Play fixture audio N times faster than real time")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--baseline', help="Baseline JSON to compare against (exit 1 on regression)")
+    parser.add_argument('--save-baseline', help="Write this run's summary as a baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative p95 increase")
+    parser.add_argument('--min-ms', type=float, default=5.0, help="Ignore p95 increases below this")
+    parser.add_argument('--max', action='append', metavar='STAGE=MS', help="Absolute p95 limit")
+    parser.add_argument('--trace', help="Write per-turn tracing spans to this JSONL file")
+    parser.add_argument('--verbose', action='store_true', help="Show JARVIS logs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(message)s')
+
+    delays_ms = dict(DEFAULT_DELAYS_MS)
+    delays_ms.update(parse_pairs(args.delay))
+    delays = FakeDelays(delays_ms, seed=args.seed)
+
+    if args.wav_dir:
+        fixtures = load_wav_fixtures(args.wav_dir)
+    else:
+        fixtures = [Utterance(text, language) for text, language in TEXT_FIXTURES]
+    if not fixtures:
+        print("No fixtures found")
+        return 2
+
+    voice, brain, tasks, microphone = build_pipeline(delays, args.language, args.audio_speed)
+    get_tracer().path = args.trace
+
+    print("=" * 70)
+    print("JARVIS TURN LATENCY BENCHMARK")
+    print("=" * 70)
+    print(f"Fixtures: {len(fixtures)} x {args.repeat} | delays (ms): {delays_ms}")
+
+    samples = []
+    for _ in range(args.repeat):
+        for utterance in fixtures:
+            microphone.utterance = utterance
+            with get_tracer().span("turn", text=utterance.text):
+                samples.append(run_turn(voice, brain, tasks))
+
+    summary = summarize(samples)
+    print(f"\n{'stage':<12}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}   (ms, {len(samples)} turns)")
+    print("-" * 70)
+    for stage in STAGES:
+        s = summary[stage]
+        print(f"{stage:<12}{s['p50']:>10.1f}{s['p95']:>10.1f}{s['p99']:>10.1f}{s['max']:>10.1f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\n💾 Baseline saved to {args.save_baseline}")
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    problems = find_regressions(summary, baseline, args.tolerance, args.min_ms, parse_pairs(args.max))
+
+    print("\n" + "=" * 70)
+    if problems:
+        print("❌ REGRESSION")
+        for problem in problems:
+            print(f"   {problem}")
+        return 1
+    print("✅ WITHIN THRESHOLDS" if (baseline or args.max) else "BENCHMARK COMPLETE")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+JARVIS Chat View - Bounded Chat Transcript
+Keeps only a window of recent messages in the Tk text widget, trims the
+oldest in bulk and pages older history back in when the user scrolls up
+"""
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Text colors per message type
+CHAT_COLORS = {
+    'user': '#00e5ff',
+    'assistant': '#00ff88',
+    'system': '#ffaa00',
+}
+
+
+class ChatTranscript:
+    """
+    Chat transcript rendered into a (CTk)Textbox
+
+    Every message is kept in a lightweight history log; the widget only
+    holds a bounded window of it. New messages are inserted with a single
+    insert() call, the widget stays in 'normal' state (keyboard edits are
+    swallowed instead of toggling state per message) and trimming deletes
+    a whole batch of old lines at once.
+    """
+
+    def __init__(self, textbox, max_messages: int = 50, trim_batch: int = 10,
+                 page_size: int = 20, history_limit: int = 5000):
+        """
+        Initialize chat transcript
+
+        Args:
+            textbox: CTkTextbox (or tk.Text) to render into
+            max_messages: Messages kept in the widget
+            trim_batch: Extra messages allowed before trimming in bulk
+            page_size: Older messages loaded per scroll to the top
+            history_limit: Messages kept in the history log
+        """
+        self.textbox = textbox
+        self.max_messages = max_messages
+        self.trim_batch = trim_batch
+        self.page_size = page_size
+
+        # (formatted text, msg_type, line count) per message
+        self.history = deque(maxlen=history_limit)
+        self.dropped = 0            # messages that fell off the history log
+        self.window_start = 0       # absolute index of first rendered message
+        self.window_end = 0         # absolute index after last rendered message
+
+        self.inserts = 0
+        self.insert_time = 0.0
+        self.max_insert_ms = 0.0
+
+        self.textbox.configure(state='normal')
+        for msg_type, color in CHAT_COLORS.items():
+            self.textbox.tag_config(msg_type, foreground=color)
+
+        # Read-only without per-message state toggling (copy still works)
+        self.textbox.bind('<Key>', self._block_edit)
+        for sequence in ('<<Paste>>', '<<Cut>>', '<<Clear>>'):
+            self.textbox.bind(sequence, lambda e: 'break')
+
+        # Older history is paged in when scrolled to the top
+        for sequence in ('<MouseWheel>', '<Button-4>'):
+            self.textbox.bind(sequence, lambda e: self.textbox.after_idle(self._maybe_load_older))
+
+    # ----------------------------------------------------------------- #
+    # Public API
+    # ----------------------------------------------------------------- #
+    def add_message(self, sender: str, message: str, msg_type: str = 'user'):
+        """
+        Append a message
+
+        Args:
+            sender: Sender name
+            message: Message text
+            msg_type: 'user', 'assistant' or 'system'
+        """
+        started = time.perf_counter()
+
+        timestamp = datetime.now().strftime('%H:%M')
+        formatted = f"\n[{timestamp}] {sender}:\n{message}\n"
+        live = self.window_end == self._total()
+        if len(self.history) == self.history.maxlen:
+            self.dropped += 1
+        self.history.append((formatted, msg_type, formatted.count('\n')))
+
+        if not live:
+            # User was paging through old history - jump back to the latest
+            self._render_latest()
+        else:
+            at_bottom = self.textbox.yview()[1] >= 0.999
+            self.textbox.insert('end', formatted, msg_type)
+            self.window_end += 1
+            if self.window_end - self.window_start > self.max_messages + self.trim_batch:
+                self._trim_oldest(self.window_end - self.window_start - self.max_messages)
+            if at_bottom:
+                self.textbox.see('end')
+
+        elapsed = (time.perf_counter() - started) * 1000
+        self.inserts += 1
+        self.insert_time += elapsed
+        self.max_insert_ms = max(self.max_insert_ms, elapsed)
+
+    def stats(self) -> Dict[str, float]:
+        """Transcript size and insert latency"""
+        return {
+            'messages': self._total(),
+            'rendered': self.window_end - self.window_start,
+            'inserts': self.inserts,
+            'avg_insert_ms': round(self.insert_time / self.inserts, 3) if self.inserts else 0.0,
+            'max_insert_ms': round(self.max_insert_ms, 3),
+        }
+
+    # ----------------------------------------------------------------- #
+    # Internals
+    # ----------------------------------------------------------------- #
+    def _total(self) -> int:
+        """Absolute index after the newest message"""
+        return self.dropped + len(self.history)
+
+    def _entry(self, index: int):
+        """History entry by absolute index"""
+        return self.history[index - self.dropped]
+
+    def _lines(self, start: int, end: int) -> int:
+        return sum(self._entry(i)[2] for i in range(start, end))
+
+    def _trim_oldest(self, count: int):
+        """Delete the oldest rendered messages in one call"""
+        lines = self._lines(self.window_start, self.window_start + count)
+        self.textbox.delete('1.0', f'{lines + 1}.0')
+        self.window_start += count
+
+    def _render_latest(self):
+        """Replace the widget contents with the newest max_messages"""
+        total = self._total()
+        self.window_start = max(total - self.max_messages, self.dropped)
+        self.window_end = total
+        self.textbox.delete('1.0', 'end')
+        for i in range(self.window_start, self.window_end):
+            formatted, msg_type, _ = self._entry(i)
+            self.textbox.insert('end', formatted, msg_type)
+        self.textbox.see('end')
+
+    def _maybe_load_older(self):
+        """Page older history in when the view is scrolled to the top"""
+        if self.textbox.yview()[0] > 0 or self.window_start <= self.dropped:
+            return
+
+        start = max(self.window_start - self.page_size, self.dropped)
+        added = self._lines(start, self.window_start)
+        for i in reversed(range(start, self.window_start)):
+            formatted, msg_type, _ = self._entry(i)
+            self.textbox.insert('1.0', formatted, msg_type)
+        loaded = self.window_start - start
+        self.window_start = start
+
+        # Keep the window bounded by dropping the newest messages
+        excess = self.window_end - self.window_start - (self.max_messages + self.page_size)
+        if excess > 0:
+            kept_lines = self._lines(self.window_start, self.window_end - excess)
+            self.textbox.delete(f'{kept_lines + 1}.0', 'end')
+            self.window_end -= excess
+
+        # Stay on the message the user was looking at
+        self.textbox.see(f'{added + 1}.0')
+        logger.debug(f"📜 Loaded {loaded} older chat messages")
+
+    @staticmethod
+    def _block_edit(event):
+        """Swallow typing; let copy / select-all shortcuts through"""
+        if event.state & 0x4 and event.keysym.lower() in ('c', 'a'):
+            return None
+        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End'):
+            return None
+        return 'break'
@@ -42,6 +42,7 @@ VOICE_CONFIG = {
     'pause_threshold': 1.2,         # Pause detection (higher = capture longer)
     'phrase_timeout': 15,           # Max phrase length (seconds)
     'use_online_tts': True,         # Use gTTS (True) or pyttsx3 (False)
+    'meter_bands': 32,              # Mic level meter bands (matches GUI waveform_bars)
 }
 
 # ====================================
@@ -61,6 +62,15 @@ When asked to perform tasks, acknowledge and confirm actions.
 If information is missing, ask clarifying questions."""
 }
 
+# Gemini call guard for the knowledge engine (see ai_guard.py)
+AI_GUARD_CONFIG = {
+    'requests_per_minute': 15,      # Model quota (Flash free tier)
+    'burst': 3,                     # Requests allowed back to back
+    'max_wait': 2.0,                # Seconds a turn may wait for quota before falling back
+    'failure_threshold': 3,         # Consecutive failures that open the circuit
+    'reset_seconds': 30,            # Open circuit cooldown before a trial request
+}
+
 # ====================================
 # GUI SETTINGS
 # ====================================
@@ -73,7 +83,8 @@ GUI_CONFIG = {
     'animation_fps': 60,
     'waveform_bars': 32,
     'show_chat_history': True,
-    'max_chat_messages': 50,
+    'max_chat_messages': 50,        # Messages kept in the chat widget
+    'chat_history_limit': 5000,     # Messages kept for scrolling back
 }
 
 # ====================================
@@ -101,6 +112,35 @@ APPS = {
     'powershell': 'start powershell',
 }
 
+# Spoken names for each app, keyed by the canonical name SystemController
+# knows how to launch (English, Hindi and Hinglish) - see app_resolver.py
+APP_ALIASES = {
+    'chrome': ['chrome', 'google chrome', 'क्रोम', 'गूगल क्रोम'],
+    'browser': ['browser', 'web browser', 'ब्राउज़र'],
+    'edge': ['edge', 'microsoft edge'],
+    'firefox': ['firefox', 'mozilla firefox'],
+    'vscode': ['vscode', 'vs code', 'visual studio code'],
+    'whatsapp': ['whatsapp', 'whats app', 'व्हाट्सएप', 'व्हाट्सऐप'],
+    'telegram': ['telegram', 'टेलीग्राम'],
+    'slack': ['slack'],
+    'discord': ['discord'],
+    'spotify': ['spotify', 'स्पॉटिफाई'],
+    'vlc': ['vlc', 'vlc player', 'media player'],
+    'music': ['music', 'music player', 'windows media player', 'wmplayer'],
+    'notepad': ['notepad', 'note pad', 'नोटपैड'],
+    'calculator': ['calculator', 'calc', 'कैलकुलेटर'],
+    'paint': ['paint', 'ms paint', 'mspaint', 'पेंट'],
+    'files': ['files', 'file explorer', 'explorer', 'file manager', 'finder'],
+    'cmd': ['cmd', 'command prompt'],
+    'terminal': ['terminal', 'टर्मिनल'],
+    'powershell': ['powershell', 'power shell'],
+    'word': ['word', 'ms word', 'microsoft word'],
+    'excel': ['excel', 'ms excel', 'microsoft excel'],
+    'powerpoint': ['powerpoint', 'power point', 'ppt'],
+    'youtube': ['youtube', 'you tube', 'युटुब', 'यूट्यूब'],
+    'gmail': ['gmail', 'जीमेल'],
+}
+
 # Websites for quick access
 WEBSITES = {
     'youtube': 'https://www.youtube.com',
@@ -117,6 +157,87 @@ FOOD_SERVICES = {
     'zomato': 'https://www.zomato.com',
 }
 
+# File index used by Play_file (see file_index.py)
+FILE_INDEX_CONFIG = {
+    'db_path': 'jarvis_file_index.db',
+    'roots': ['D:/'] if os.name == 'nt' else [os.path.expanduser('~')],
+    'exclude_dirs': [
+        '$recycle.bin', 'system volume information', 'windows', 'appdata',
+        'node_modules', '__pycache__', '.git', '.venv', 'venv', '.cache',
+    ],
+    'exclude_patterns': ['*.tmp', '*.sys', '*.dll', '~$*', '.*'],
+    'use_watcher': True,            # Filesystem notifications (needs watchdog)
+    'rescan_interval': 300,         # Seconds between mtime rescans without watcher
+}
+
+# Shared HTTP client for web tools (see http_client.py)
+HTTP_CONFIG = {
+    'timeout': 10,                  # Seconds per attempt
+    'connect_timeout': 4,
+    'retries': 2,                   # Extra attempts on timeouts / 429 / 5xx
+    'backoff': 0.5,                 # Seconds, doubled per retry
+    'pool_size': 10,                # Keep-alive connections
+    'cache_size': 256,              # Cached responses
+    'cache_ttl': {                  # Seconds per endpoint
+        'city_by_ip': 6 * 3600,
+        'weather': 10 * 60,
+        'search': int(os.getenv('JARVIS_SEARCH_CACHE_TTL', 3600)),
+    },
+}
+
+# Semantic cache for knowledge answers (see answer_cache.py, needs numpy)
+ANSWER_CACHE_CONFIG = {
+    'enabled': True,
+    'db_path': 'jarvis_answer_cache.db',
+    'threshold': 0.85,              # Cosine similarity to reuse an answer
+    'ttl': 7 * 24 * 3600,           # Seconds an answer stays valid
+    'max_entries': 500,             # Least recently used answers are evicted beyond this
+    'dim': 1024,                    # Hashed feature dimensions
+    'exclude_patterns': [           # Time-sensitive questions - never cached
+        r'\b(today|tonight|now|currently|latest|recent|news|this (week|month|year))\b',
+        r'\b(weather|price|stock|score|rate)\b',
+        r'\b(what time|what date|which day)\b',
+        r'\b(aaj|abhi|kal|mausam)\b',
+    ],
+}
+
+# Conversation history, running summary and context size (see jarvis_memory.py)
+MEMORY_CONFIG = {
+    'history_path': 'jarvis_history.json',  # History + summary saved every turn ('' = not saved)
+    'summary_chars': 800,           # Running summary of older turns stays under this
+    'summary_model': os.getenv('JARVIS_SUMMARY_MODEL', '0') == '1',  # Let the model rewrite it (extra quota)
+    'summary_batch': 6,             # Dropped messages folded in per model call
+    'summary_keep_tokens': 1,       # Guard tokens left free for the user's own turns
+    'context_chars': 6000,          # Most recent-turn context sent with one request
+}
+
+# Speculative follow-up answers (see prefetch.py) - spends extra model quota
+PREFETCH_CONFIG = {
+    'enabled': os.getenv('JARVIS_PREFETCH', '0') == '1',
+    'kinds': ['simpler', 'example'],  # Follow-ups generated after each explanation
+    'max_per_hour': 30,             # Background requests allowed per hour
+    'keep_tokens': 1,               # Guard tokens left free for the user's own turns
+    'max_delay': 20.0,              # Seconds a prefetch waits for spare quota before it is skipped
+    'wait_inflight': 5.0,           # Seconds a follow-up waits for a prefetch already running
+}
+
+# Optional embedding intent classifier (see semantic_intent.py, needs numpy)
+SEMANTIC_INTENT_CONFIG = {
+    'enabled': os.getenv('JARVIS_SEMANTIC_INTENT', '0') == '1',
+    'examples_file': 'intent_examples.json',  # Extra labelled examples, if present
+    'dim': 4096,                    # Hashed feature dimensions
+    'k': 5,                         # Neighbours that vote
+    'min_confidence': 0.3,          # Below this the keyword scores decide
+}
+
+# Per-turn tracing spans (see tracing.py)
+TRACING_CONFIG = {
+    'enabled': True,
+    'file': 'jarvis_traces.jsonl',  # One JSON line per turn ('' = no file)
+    'max_bytes': 5 * 1024 * 1024,   # Rolled over to .1 at this size
+    'ring_size': 200,               # Recent turns kept in memory for the GUI
+}
+
 # ====================================
 # LOGGING SETTINGS
 # ====================================
@@ -125,4 +246,10 @@ LOGGING_CONFIG = {
     'level': 'INFO',
     'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     'file': 'jarvis.log',
+    'max_bytes': 5 * 1024 * 1024,   # Rotate jarvis.log at 5 MB
+    'backup_count': 3,              # jarvis.log.1 .. jarvis.log.3
+    'console': True,
+    # Per-module levels, e.g. {'intent_detector': 'DEBUG'}; also settable
+    # with JARVIS_LOG_LEVELS="intent_detector=DEBUG,jarvis_tasks=WARNING"
+    'levels': {},
 }
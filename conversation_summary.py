@@ -0,0 +1,176 @@
+"""
+JARVIS Conversation Summary - Rolling Summary of Older Turns
+Messages that fall out of ConversationMemory are folded into a short
+running summary (local heuristic, or batched model calls in the
+background), so long sessions keep their context without sending it all
+"""
+import logging
+import re
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Longest line kept for one message in the local summary
+POINT_CHARS = 160
+
+_SENTENCE_END = re.compile(r'(?<=[.!?\u0964])\s')
+
+SUMMARY_PROMPT = """Update the running summary of a conversation between a user and JARVIS (a voice assistant).
+
+Summary so far:
+{summary}
+
+Newer messages:
+{messages}
+
+Write the updated summary in under {max_chars} characters: the topics discussed, what the user wanted,
+what JARVIS answered or did, and anything the user said about themselves. Plain sentences, no headings."""
+
+
+def summarize_message(message: Dict) -> str:
+    """One summary line for a message: its first sentence, shortened"""
+    text = ' '.join(message.get('content', '').split())
+    first = _SENTENCE_END.split(text, 1)[0]
+    if len(first) > POINT_CHARS:
+        first = first[:POINT_CHARS - 3].rstrip() + '...'
+    if message.get('role') == 'user':
+        return f"User: {first}"
+    if message.get('action'):
+        return f"JARVIS ({message['action']}): {first}"
+    return f"JARVIS: {first}"
+
+
+class RollingSummarizer:
+    """
+    Running summary of the messages ConversationMemory no longer holds
+
+    Every dropped message becomes one short line right away (first
+    sentence, microseconds). With a model attached, those lines are
+    rewritten into a prose summary in batches on a background thread;
+    until a batch is done its lines stand in for it. text() is always
+    kept under max_chars - the oldest lines go first.
+    """
+
+    def __init__(self, max_chars: int = 800, batch_messages: int = 6):
+        """
+        Initialize summarizer
+
+        Args:
+            max_chars: Longest summary text()
+            batch_messages: Dropped messages folded into the summary per model call
+        """
+        self.max_chars = max_chars
+        self.batch_messages = batch_messages
+        self.summary = ''
+        self.points = deque()
+        self._generate: Optional[Callable[[str], str]] = None
+        self._spare: Optional[Callable[[], bool]] = None
+        self._busy = False
+        self._unsummarized = 0      # lines added since the last batch started
+        self._epoch = 0             # bumped by clear(), so late batches are dropped
+        self._lock = threading.Lock()
+
+        self.folded = 0
+        self.model_calls = 0
+        self.model_failures = 0
+
+    def use_model(self, generate: Callable[[str], str], spare: Optional[Callable[[], bool]] = None):
+        """
+        Rewrite the summary with a model
+
+        Args:
+            generate: prompt -> text (e.g. KnowledgeEngine.generate_standalone)
+            spare: Returns whether quota can be spent now (e.g. the AI guard's);
+                without quota the local lines are kept until the next batch
+        """
+        self._generate = generate
+        self._spare = spare
+
+    def add(self, messages: Iterable[Dict]):
+        """Fold messages that were dropped from memory into the summary"""
+        with self._lock:
+            for message in messages:
+                self.points.append(summarize_message(message))
+                self.folded += 1
+                self._unsummarized += 1
+            self._trim()
+            start = (self._generate is not None and not self._busy
+                     and self._unsummarized >= self.batch_messages)
+            if start:
+                self._busy = True
+                self._unsummarized = 0
+                args = (self.summary, list(self.points), self._epoch)
+        if start:
+            threading.Thread(target=self._rewrite, args=args, daemon=True,
+                             name="conversation-summary").start()
+
+    def _rewrite(self, summary: str, batch: List[str], epoch: int):
+        """Background: fold a batch of lines into the prose summary"""
+        try:
+            if self._spare is not None and not self._spare():
+                return
+            self.model_calls += 1
+            text = self._generate(SUMMARY_PROMPT.format(
+                summary=summary or '(nothing yet)', messages='\n'.join(batch), max_chars=self.max_chars))
+            text = ' '.join(text.split())[:self.max_chars]
+            with self._lock:
+                if epoch != self._epoch:
+                    return
+                # Lines added (or trimmed) meanwhile stay; only the batch is replaced
+                for point in batch:
+                    if self.points and self.points[0] == point:
+                        self.points.popleft()
+                self.summary = text
+                self._trim()
+            logger.debug("📝 Conversation summary rewritten (%d chars)", len(text))
+        except Exception as e:
+            self.model_failures += 1
+            logger.debug(f"Conversation summary failed, keeping local lines: {e}")
+        finally:
+            self._busy = False
+
+    def _trim(self):
+        """Drop the oldest lines (then cut the prose) until text() fits"""
+        while self.points and len(self._join()) > self.max_chars:
+            self.points.popleft()
+        if len(self.summary) > self.max_chars:
+            self.summary = self.summary[:self.max_chars]
+
+    def _join(self) -> str:
+        return '\n'.join(([self.summary] if self.summary else []) + list(self.points))
+
+    def text(self) -> str:
+        """The summary ('' if nothing has been dropped yet)"""
+        with self._lock:
+            return self._join()
+
+    def clear(self):
+        with self._lock:
+            self.summary = ''
+            self.points.clear()
+            self._unsummarized = 0
+            self._epoch += 1
+
+    def to_dict(self) -> Dict:
+        """State to persist with the history"""
+        with self._lock:
+            return {'summary': self.summary, 'points': list(self.points)}
+
+    def load(self, state: Dict):
+        """Restore state saved by to_dict()"""
+        with self._lock:
+            self.summary = state.get('summary', '')
+            self.points = deque(state.get('points', []))
+            self._trim()
+
+    def stats(self) -> Dict:
+        """Summary size and model usage"""
+        return {
+            'chars': len(self.text()),
+            'lines': len(self.points),
+            'folded': self.folded,
+            'model_calls': self.model_calls,
+            'model_failures': self.model_failures,
+        }
@@ -41,6 +41,11 @@ try:
     print("\n>>> SPEAK NOW: 'open youtube' <<<\n")
     text, lang = voice.listen(timeout=5)
     
+    levels = voice.level_meter.stats()
+    if levels.get('available'):
+        print(f"Mic levels: last RMS {levels['rms_db']} dBFS, peak {levels['peak_db']} dBFS, "
+              f"noise floor {levels['noise_floor_db']} dBFS")
+    
     if text:
         print(f"SUCCESS: Recognized '{text}' in language '{lang}'")
     else:
@@ -0,0 +1,453 @@
+"""
+JARVIS File Index - Persistent, Incrementally Updated File Catalogue
+Keeps an on-disk SQLite index of the configured roots so file lookups
+never have to walk the whole drive again
+"""
+import fnmatch
+import logging
+import os
+import sqlite3
+import threading
+import time
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional
+
+from config import FILE_INDEX_CONFIG
+from ngram_index import NgramIndex
+
+try:
+    from fuzzywuzzy import fuzz
+except ImportError:
+    fuzz = None
+
+# Filesystem notifications are optional - fall back to mtime rescans
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Tie-breaking priority when fuzzy scores are equal (higher wins)
+MEDIA_PRIORITY = {
+    **dict.fromkeys(['.mp3', '.wav', '.flac', '.m4a', '.aac', '.ogg', '.wma'], 2),
+    **dict.fromkeys(['.mp4', '.mkv', '.avi', '.mov', '.wmv', '.webm', '.flv'], 2),
+    **dict.fromkeys(['.pdf', '.docx', '.doc', '.pptx', '.xlsx', '.txt', '.jpg', '.png'], 1),
+}
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    name_lower TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    ext TEXT NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_dirs_parent ON dirs(parent);
+"""
+
+
+class _IndexEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to the owning FileIndex"""
+
+    def __init__(self, index: 'FileIndex'):
+        self.index = index
+
+    def on_created(self, event):
+        self.index._on_fs_event('created', event.src_path, event.is_directory)
+
+    def on_deleted(self, event):
+        self.index._on_fs_event('deleted', event.src_path, event.is_directory)
+
+    def on_moved(self, event):
+        self.index._on_fs_event('deleted', event.src_path, event.is_directory)
+        self.index._on_fs_event('created', event.dest_path, event.is_directory)
+
+
+class FileIndex:
+    """
+    SQLite-backed file index with background build and incremental updates
+
+    The index is built once in a background thread. After that it is kept
+    current through filesystem notifications (watchdog / inotify) when
+    available, otherwise through periodic mtime-based rescans that only
+    re-list directories whose mtime changed.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, roots: Optional[List[str]] = None,
+                 exclude_dirs: Optional[Iterable[str]] = None,
+                 exclude_patterns: Optional[Iterable[str]] = None):
+        """
+        Initialize file index
+
+        Args:
+            db_path: SQLite database file (default from FILE_INDEX_CONFIG)
+            roots: Directories to index
+            exclude_dirs: Directory names that are never descended into
+            exclude_patterns: Glob patterns for file names to skip
+        """
+        self.db_path = db_path or FILE_INDEX_CONFIG['db_path']
+        self.roots = [os.path.normpath(r) for r in (roots or FILE_INDEX_CONFIG['roots'])]
+        self.exclude_dirs = {d.lower() for d in (exclude_dirs or FILE_INDEX_CONFIG['exclude_dirs'])}
+        self.exclude_patterns = list(exclude_patterns or FILE_INDEX_CONFIG['exclude_patterns'])
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+            self._conn.commit()
+
+        # In-memory trigram shortlist over files.id, loaded in the background
+        self.ngrams = NgramIndex()
+        self.ngrams_ready = threading.Event()
+
+        self.ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+
+        logger.info(f"✅ File index opened: {self.db_path} (roots: {self.roots})")
+
+    # ==================== LIFECYCLE ==================== #
+
+    def start(self):
+        """Build/refresh the index in the background and keep it updated"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='file-index', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop background updates and close the database"""
+        self._stop.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+        if self._thread:
+            self._thread.join(timeout=2)
+        with self._lock:
+            self._conn.close()
+
+    def _run(self):
+        """Background worker: initial scan, then watcher or periodic rescans"""
+        try:
+            started = time.perf_counter()
+            self._load_ngrams()
+            self.rescan()
+            logger.info(f"✅ File index ready: {self.count()} files "
+                        f"({time.perf_counter() - started:.1f}s)")
+        except Exception as e:
+            logger.error(f"❌ File index build failed: {e}")
+        finally:
+            self.ready.set()
+
+        if FILE_INDEX_CONFIG['use_watcher'] and self._start_watcher():
+            return
+
+        interval = FILE_INDEX_CONFIG['rescan_interval']
+        while not self._stop.wait(interval):
+            try:
+                self.rescan()
+            except Exception as e:
+                logger.error(f"❌ File index rescan failed: {e}")
+
+    def _start_watcher(self) -> bool:
+        """Start filesystem notifications for all roots"""
+        if not WATCHDOG_AVAILABLE:
+            logger.info("ℹ️ watchdog not installed - using periodic mtime rescans")
+            return False
+        try:
+            self._observer = Observer()
+            handler = _IndexEventHandler(self)
+            for root in self.roots:
+                if os.path.isdir(root):
+                    self._observer.schedule(handler, root, recursive=True)
+            self._observer.start()
+            logger.info("👀 File index watching for filesystem changes")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ File watcher unavailable ({e}) - using periodic rescans")
+            self._observer = None
+            return False
+
+    def _load_ngrams(self):
+        """Build the trigram index from rows already on disk"""
+        with self._lock:
+            rows = self._conn.execute('SELECT id, name FROM files').fetchall()
+        ngrams = NgramIndex()
+        ngrams.add_many((row['id'], self._search_text(row['name'])) for row in rows)
+        with self._lock:
+            self.ngrams = ngrams
+        self.ngrams_ready.set()
+
+    # ==================== SCANNING ==================== #
+
+    def rescan(self):
+        """
+        Incrementally bring the index up to date
+
+        Directories whose mtime is unchanged are not re-listed; their known
+        subdirectories are still visited so deep changes are picked up.
+        """
+        with self._lock:
+            known = {row['path']: row['mtime'] for row in
+                     self._conn.execute('SELECT path, mtime FROM dirs')}
+
+        seen = set()
+        for root in self.roots:
+            if not os.path.isdir(root):
+                logger.warning(f"⚠️ Index root not found: {root}")
+                continue
+            self._walk(root, None, known, seen)
+
+        # Drop directories that vanished since the last scan
+        if not self._stop.is_set():
+            removed = [path for path in known if path not in seen]
+            if removed:
+                with self._lock:
+                    for path in removed:
+                        self._forget_dir(path)
+                    self._conn.commit()
+
+    def _walk(self, top: str, parent: Optional[str], known: Dict[str, float], seen: set):
+        """Visit a directory tree, re-listing only directories whose mtime changed"""
+        stack = [(top, parent)]
+        while stack and not self._stop.is_set():
+            path, parent = stack.pop()
+            seen.add(path)
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+
+            if known.get(path) == mtime:
+                with self._lock:
+                    children = [row['path'] for row in self._conn.execute(
+                        'SELECT path FROM dirs WHERE parent = ?', (path,))]
+                stack.extend((child, path) for child in children)
+                continue
+
+            stack.extend((child, path) for child in self._scan_dir(path, parent, mtime))
+
+    def _scan_dir(self, path: str, parent: Optional[str], mtime: float) -> List[str]:
+        """List one directory, replace its file rows and return its subdirectories"""
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in self.exclude_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and not self._is_excluded(entry.name):
+                            files.append(self._row_for(entry.path, entry.name, path,
+                                                       entry.stat(follow_symlinks=False).st_mtime))
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+
+        with self._lock:
+            self._delete_files('dir = ?', (path,))
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO files (path, name, name_lower, dir, ext, mtime) '
+                'VALUES (?, ?, ?, ?, ?, ?)', files)
+            for row in self._conn.execute('SELECT id, name FROM files WHERE dir = ?', (path,)):
+                self.ngrams.add(row['id'], self._search_text(row['name']))
+            self._conn.execute('INSERT OR REPLACE INTO dirs (path, parent, mtime) VALUES (?, ?, ?)',
+                               (path, parent, mtime))
+            self._conn.commit()
+        return subdirs
+
+    def _delete_files(self, where: str, params: tuple):
+        """Delete file rows and their trigram postings (caller holds the lock)"""
+        for row in self._conn.execute(f'SELECT id FROM files WHERE {where}', params):
+            self.ngrams.remove(row['id'])
+        self._conn.execute(f'DELETE FROM files WHERE {where}', params)
+
+    def _forget_dir(self, path: str):
+        """Remove a directory and everything below it (caller holds the lock)"""
+        # Range on the separator instead of LIKE, whose _ and % wildcards
+        # would also match siblings such as my_dir / myXdir
+        base = path.rstrip('\\/')
+        low, high = base + os.sep, base + chr(ord(os.sep) + 1)
+        self._delete_files('dir = ? OR (dir >= ? AND dir < ?)', (path, low, high))
+        self._conn.execute('DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)',
+                           (path, low, high))
+
+    def _in_excluded_dir(self, path: str) -> bool:
+        """Check whether a path lies below an excluded directory of its root"""
+        for root in self.roots:
+            if path.startswith(root.rstrip('\\/') + os.sep):
+                path = os.path.relpath(path, root)
+                break
+        parents = path.split(os.sep)[:-1]
+        return any(part.lower() in self.exclude_dirs for part in parents)
+
+    def _is_excluded(self, name: str) -> bool:
+        """Check a file name against the exclusion patterns"""
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self.exclude_patterns)
+
+    @staticmethod
+    def _search_text(name: str) -> str:
+        """File name without extension, as matched by queries"""
+        return os.path.splitext(name)[0]
+
+    @staticmethod
+    def _row_for(path: str, name: str, directory: str, mtime: float) -> tuple:
+        """Build a files-table row"""
+        return (path, name, name.lower(), directory, os.path.splitext(name)[1].lower(), mtime)
+
+    def _on_fs_event(self, kind: str, path: str, is_directory: bool):
+        """Apply a single filesystem notification to the index"""
+        path = os.path.normpath(path)
+        parent = os.path.dirname(path)
+        name = os.path.basename(path)
+        if kind != 'deleted' and self._in_excluded_dir(path):
+            # The initial scan never descends into these trees either
+            return
+        try:
+            with self._lock:
+                if kind == 'deleted':
+                    if is_directory:
+                        self._forget_dir(path)
+                    else:
+                        self._delete_files('path = ?', (path,))
+                elif is_directory:
+                    if name.lower() not in self.exclude_dirs:
+                        # A directory moved in brings its contents along
+                        self._walk(path, parent, {}, set())
+                elif not self._is_excluded(name):
+                    row = self._row_for(path, name, parent, os.path.getmtime(path))
+                    self._delete_files('path = ?', (path,))
+                    cursor = self._conn.execute(
+                        'INSERT INTO files (path, name, name_lower, dir, ext, mtime) '
+                        'VALUES (?, ?, ?, ?, ?, ?)', row)
+                    self.ngrams.add(cursor.lastrowid, self._search_text(name))
+                self._conn.commit()
+        except OSError:
+            pass
+        except Exception as e:
+            logger.debug(f"File index event error ({kind} {path}): {e}")
+
+    # ==================== QUERIES ==================== #
+
+    def count(self) -> int:
+        """Number of indexed files"""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def find(self, query: str, limit: int = 200) -> List[Dict]:
+        """
+        Find candidate files whose name contains the query or its words
+
+        Args:
+            query: Free-text file name query
+            limit: Maximum number of candidates
+
+        Returns:
+            List of dicts with id, name, path, ext, mtime and type
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT * FROM files WHERE name_lower LIKE ? LIMIT ?',
+                (f'%{query}%', limit)).fetchall()
+            if not rows:
+                words = [w for w in query.split() if len(w) > 1]
+                if words:
+                    clause = ' OR '.join(['name_lower LIKE ?'] * len(words))
+                    rows = self._conn.execute(
+                        f'SELECT * FROM files WHERE {clause} LIMIT ?',
+                        [f'%{w}%' for w in words] + [limit]).fetchall()
+
+        return [self._item(row) for row in rows]
+
+    def get(self, ids: List[int]) -> List[Dict]:
+        """Fetch entries by ID"""
+        if not ids:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT * FROM files WHERE id IN ({",".join("?" * len(ids))})', ids).fetchall()
+        return [self._item(row) for row in rows]
+
+    def search(self, query: str, limit: int = 5, shortlist: int = 200) -> List[Dict]:
+        """
+        Fuzzy file search, best match first
+
+        Candidates are shortlisted through the trigram index (or a substring
+        scan while it is still loading), then scored exactly. Equal scores are
+        broken by media type and then by recency.
+
+        Args:
+            query: Free-text file name query
+            limit: Number of results (top-k)
+            shortlist: Candidates scored exactly
+
+        Returns:
+            List of entry dicts with an added 'score' (0-100)
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        if self.ngrams_ready.is_set():
+            with self._lock:
+                ranked = self.ngrams.candidates(query, shortlist)
+            candidates = self.get([entry_id for entry_id, _ in ranked])
+        else:
+            candidates = self.find(query, shortlist)
+
+        for item in candidates:
+            item['score'] = self._score(query, self._search_text(item['name']))
+        candidates.sort(key=lambda item: (item['score'], MEDIA_PRIORITY.get(item['ext'], 0),
+                                          item['mtime']), reverse=True)
+        return candidates[:limit]
+
+    @staticmethod
+    def _score(query: str, name: str) -> int:
+        """Exact fuzzy score between query and a file name"""
+        if fuzz:
+            return fuzz.WRatio(query, name)
+        return int(SequenceMatcher(None, query.lower(), name.lower()).ratio() * 100)
+
+    @staticmethod
+    def _item(row: sqlite3.Row) -> Dict:
+        """Convert a files row to the dict shape used by callers"""
+        return {'id': row['id'], 'name': row['name'], 'path': row['path'],
+                'ext': row['ext'], 'mtime': row['mtime'], 'type': 'file'}
+
+
+# Global instance for easy access
+_file_index = None
+
+def get_file_index() -> FileIndex:
+    """Get global FileIndex instance (starts background indexing on first use)"""
+    global _file_index
+    if _file_index is None:
+        _file_index = FileIndex()
+        _file_index.start()
+    return _file_index
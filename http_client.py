@@ -0,0 +1,190 @@
+"""
+JARVIS HTTP Client - Pooled, Cached Web Requests
+One keep-alive connection pool for the web tools, with timeouts, retries
+with backoff and a response cache with per-endpoint TTLs
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from config import HTTP_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth another attempt
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class HTTPResponse(NamedTuple):
+    """Status and body of a finished request"""
+    status_code: int
+    text: str
+    cached: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class HTTPClient:
+    """
+    Async HTTP client shared by the web tools
+
+    The aiohttp session is created lazily on the running event loop and
+    recreated if the loop changes. Successful GET responses are cached
+    for the TTL the caller passes, keyed by URL and parameters.
+    """
+
+    def __init__(self, timeout: float = 10, connect_timeout: float = 4, retries: int = 2,
+                 backoff: float = 0.5, pool_size: int = 10, cache_size: int = 256):
+        """
+        Initialize HTTP client
+
+        Args:
+            timeout: Total seconds per attempt
+            connect_timeout: Seconds to establish a connection
+            retries: Extra attempts after a timeout, connection error, 429 or 5xx
+            backoff: Delay before the first retry (doubled each time)
+            pool_size: Maximum keep-alive connections
+            cache_size: Maximum cached responses
+        """
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.cache_size = cache_size
+
+        self._session = None
+        self._loop = None
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+        self.requests = 0
+        self.cache_hits = 0
+        self.retried = 0
+        self.errors = 0
+
+    async def _get_session(self):
+        if aiohttp is None:
+            raise RuntimeError("aiohttp not installed")
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout),
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict]) -> str:
+        return url + '?' + json.dumps(params or {}, sort_keys=True, default=str)
+
+    async def get(self, url: str, params: Optional[Dict] = None, ttl: float = 0) -> HTTPResponse:
+        """
+        GET a URL
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            ttl: Seconds to cache a 200 response (0 = don't cache)
+
+        Returns:
+            HTTPResponse (non-200 statuses are returned, not raised)
+
+        Raises:
+            aiohttp.ClientError / asyncio.TimeoutError: If every attempt failed
+        """
+        key = self._cache_key(url, params)
+        if ttl:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return entry[1]._replace(cached=True)
+
+        session = await self._get_session()
+        self.requests += 1
+        delay = self.backoff
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                async with session.get(url, params=params) as resp:
+                    response = HTTPResponse(resp.status, await resp.text())
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    break
+                logger.warning(f"⚠️ HTTP {response.status_code} from {url}, retrying")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    self.errors += 1
+                    raise
+                logger.warning(f"⚠️ HTTP request to {url} failed ({type(e).__name__}), retrying")
+            self.retried += 1
+            # Jitter keeps parallel retries from lining up
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay *= 2
+
+        if ttl and response.status_code == 200:
+            self._cache[key] = (time.monotonic() + ttl, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return response
+
+    async def get_json(self, url: str, params: Optional[Dict] = None, ttl: float = 0) -> Any:
+        """
+        GET a URL and parse the JSON body
+
+        Raises:
+            RuntimeError: On a non-200 status
+        """
+        response = await self.get(url, params=params, ttl=ttl)
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    def clear_cache(self):
+        """Drop every cached response"""
+        self._cache.clear()
+
+    async def close(self):
+        """Close the connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> Dict[str, int]:
+        """Request and cache counters"""
+        return {
+            'requests': self.requests,
+            'cache_hits': self.cache_hits,
+            'cached': len(self._cache),
+            'retried': self.retried,
+            'errors': self.errors,
+        }
+
+
+# Global instance for easy access
+_http_client = None
+
+def get_http_client() -> HTTPClient:
+    """Get or create global HTTP client (settings from HTTP_CONFIG)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = HTTPClient(
+            timeout=HTTP_CONFIG['timeout'],
+            connect_timeout=HTTP_CONFIG['connect_timeout'],
+            retries=HTTP_CONFIG['retries'],
+            backoff=HTTP_CONFIG['backoff'],
+            pool_size=HTTP_CONFIG['pool_size'],
+            cache_size=HTTP_CONFIG['cache_size'],
+        )
+    return _http_client
@@ -0,0 +1,281 @@
+"""
+JARVIS HUD Rendering Helpers
+Shared pieces for the retained-mode canvas animation loops
+"""
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Target frame rate per assistant state (capped by each GUI's own fps setting)
+STATE_FPS = {
+    'LISTENING': 60,
+    'SPEAKING': 60,
+    'PROCESSING': 30,
+    'THINKING': 30,
+    'STANDBY': 10,
+}
+
+
+class FrameMeter:
+    """
+    Frame-time budget meter
+
+    Measures how long each frame takes to render and shows the smoothed
+    cost against the frame budget as a small text item on the canvas.
+    """
+
+    def __init__(self, canvas, x: int, y: int, fps: float, color: str = '#4a6572',
+                 warn_color: str = '#ffaa00', anchor: str = 'nw', refresh_every: int = 15):
+        """
+        Initialize frame meter
+
+        Args:
+            canvas: Tk canvas to draw on
+            x, y: Position of the meter text
+            fps: Target frame rate (sets the per-frame budget)
+            color: Text color while within budget
+            warn_color: Text color when over budget
+            anchor: Tk anchor for the text item
+            refresh_every: Redraw the text every N frames
+        """
+        self.canvas = canvas
+        self.color = color
+        self.warn_color = warn_color
+        self.refresh_every = refresh_every
+        self.set_fps(fps)
+
+        self.frames = 0
+        self.measured_fps = None
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self._started = None
+
+        self.text_item = canvas.create_text(
+            x, y, text='', fill=color, anchor=anchor, font=('Consolas', 9)
+        )
+
+    def set_fps(self, fps: float):
+        """Change the target frame rate"""
+        self.budget_ms = 1000.0 / fps if fps else 0.0
+
+    def begin(self):
+        """Mark the start of a frame"""
+        self._started = time.perf_counter()
+
+    def end(self):
+        """Mark the end of a frame and refresh the meter"""
+        if self._started is None:
+            return
+        cost = (time.perf_counter() - self._started) * 1000
+        self._started = None
+
+        self.frames += 1
+        self.last_ms = cost
+        self.max_ms = max(self.max_ms, cost)
+        # Exponential moving average keeps the readout steady
+        self.avg_ms = cost if self.frames == 1 else self.avg_ms * 0.9 + cost * 0.1
+
+        if self.frames % self.refresh_every == 0:
+            over = self.budget_ms and self.avg_ms > self.budget_ms
+            self.canvas.itemconfig(
+                self.text_item,
+                text=self.summary(),
+                fill=self.warn_color if over else self.color
+            )
+
+    def summary(self) -> str:
+        """One-line readout, e.g. 'render 0.84 ms / 16.7 ms (5%) | 60 fps'"""
+        if not self.budget_ms:
+            text = f"render {self.avg_ms:.2f} ms"
+        else:
+            percent = self.avg_ms / self.budget_ms * 100
+            text = f"render {self.avg_ms:.2f} ms / {self.budget_ms:.1f} ms ({percent:.0f}%)"
+        if self.measured_fps is not None:
+            text += f" | {self.measured_fps:.0f} fps"
+        return text
+
+    def stats(self) -> Dict[str, float]:
+        """Render cost statistics"""
+        return {
+            'frames': self.frames,
+            'avg_ms': round(self.avg_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+            'last_ms': round(self.last_ms, 3),
+            'budget_ms': round(self.budget_ms, 3),
+        }
+
+
+class AnimationScheduler:
+    """
+    Drives a HUD animation loop at a frame rate chosen by assistant state
+
+    Runs fast while listening or speaking, slowly in standby and not at all
+    while the window is minimized or hidden. Late frames are dropped rather
+    than queued, and `step` tells the frame callback how many nominal frames
+    have elapsed so animations keep their speed at any frame rate.
+    """
+
+    def __init__(self, root, frame_callback: Callable[[], None], get_state: Callable[[], str],
+                 max_fps: float = 60, state_fps: Optional[Dict[str, float]] = None,
+                 meter: Optional[FrameMeter] = None):
+        """
+        Initialize animation scheduler
+
+        Args:
+            root: Tk root window (used for after() and map/unmap events)
+            frame_callback: Renders one frame
+            get_state: Returns the current assistant state, e.g. "LISTENING"
+            max_fps: Frame rate cap, and the rate animation speeds are tuned for
+            state_fps: State -> target fps (default STATE_FPS)
+            meter: Optional FrameMeter to time each frame
+        """
+        self.root = root
+        self.frame_callback = frame_callback
+        self.get_state = get_state
+        self.max_fps = max_fps
+        self.state_fps = dict(STATE_FPS if state_fps is None else state_fps)
+        self.meter = meter
+
+        self.running = False
+        self.paused = False
+        self.step = 1.0
+        self.dropped_frames = 0
+        self.fps = 0.0
+        self.cpu_percent = 0.0
+        self.cpu_ms_per_frame = 0.0
+
+        self._after_id = None
+        self._next_due = None
+        self._last_frame = None
+        self._window_start = None
+        self._window_frames = 0
+        self._window_cpu = 0.0
+
+        root.bind('<Unmap>', self._on_unmap, add='+')
+        root.bind('<Map>', self._on_map, add='+')
+
+    def target_fps(self) -> float:
+        """Frame rate for the current state"""
+        fps = self.state_fps.get(self.get_state(), self.state_fps.get('STANDBY', self.max_fps))
+        return min(fps, self.max_fps)
+
+    def start(self, delay_ms: int = 0):
+        """Start the loop"""
+        if self.running:
+            return
+        self.running = True
+        self._schedule(delay_ms)
+
+    def stop(self):
+        """Stop the loop"""
+        self.running = False
+        self._cancel()
+
+    def stats(self) -> Dict[str, float]:
+        """Measured frame rate and CPU cost"""
+        return {
+            'state': self.get_state(),
+            'target_fps': self.target_fps(),
+            'fps': round(self.fps, 1),
+            'cpu_percent': round(self.cpu_percent, 1),
+            'cpu_ms_per_frame': round(self.cpu_ms_per_frame, 3),
+            'dropped_frames': self.dropped_frames,
+            'paused': self.paused,
+        }
+
+    # ----------------------------------------------------------------- #
+    # Internals
+    # ----------------------------------------------------------------- #
+    def _schedule(self, delay_ms: int):
+        self._after_id = self.root.after(max(int(delay_ms), 1), self._tick)
+
+    def _cancel(self):
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _is_hidden(self) -> bool:
+        try:
+            return self.root.state() in ('iconic', 'withdrawn')
+        except Exception:
+            return False
+
+    def _on_unmap(self, event):
+        if event.widget is self.root and self.running and not self.paused:
+            self.paused = True
+            self._cancel()
+            logger.debug("⏸️ HUD animation paused (window hidden)")
+
+    def _on_map(self, event):
+        if event.widget is self.root and self.running and self.paused:
+            self.paused = False
+            self._next_due = None
+            self._last_frame = None
+            self._cancel()
+            self._schedule(0)
+            logger.debug("▶️ HUD animation resumed")
+
+    def _tick(self):
+        self._after_id = None
+        if not self.running or self.paused:
+            return
+        if self._is_hidden():
+            # Map event will restart us
+            self.paused = True
+            return
+
+        interval = 1.0 / self.target_fps()
+        now = time.perf_counter()
+
+        # Missed deadlines are dropped, never replayed
+        if self._next_due is not None and now - self._next_due > interval:
+            self.dropped_frames += int((now - self._next_due) / interval)
+            self._next_due = now
+
+        # Nominal frames elapsed, capped so a long stall doesn't jump the animation
+        if self._last_frame is None:
+            self.step = 1.0
+        else:
+            self.step = min((now - self._last_frame) * self.max_fps, 10.0)
+        self._last_frame = now
+
+        cpu_start = time.thread_time()
+        if self.meter:
+            self.meter.begin()
+        try:
+            self.frame_callback()
+        except Exception as e:
+            logger.error(f"❌ Animation frame error: {e}")
+        if self.meter:
+            self.meter.end()
+        cpu = time.thread_time() - cpu_start
+
+        self._measure(now, cpu)
+
+        self._next_due = (self._next_due or now) + interval
+        self._schedule((self._next_due - time.perf_counter()) * 1000)
+
+    def _measure(self, now: float, cpu: float):
+        """Roll frame count and CPU time into once-a-second figures"""
+        if self._window_start is None:
+            self._window_start = now
+        self._window_frames += 1
+        self._window_cpu += cpu
+
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self.fps = self._window_frames / elapsed
+            self.cpu_percent = self._window_cpu / elapsed * 100
+            self.cpu_ms_per_frame = self._window_cpu / self._window_frames * 1000
+            self._window_start = now
+            self._window_frames = 0
+            self._window_cpu = 0.0
+            if self.meter:
+                self.meter.measured_fps = self.fps
+                self.meter.set_fps(self.target_fps())
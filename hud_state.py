@@ -0,0 +1,216 @@
+"""
+JARVIS HUD State - Coalesced, Atomic State File
+The agent publishes transcript/status updates; a background writer
+coalesces bursts and replaces jarvis_state.json atomically. Every write
+carries a sequence number so the HUD only consumes new state.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class HUDStatePublisher:
+    """
+    Writes the latest HUD state to a JSON file
+
+    publish() never touches the disk: it replaces the pending state and
+    wakes the writer thread. The writer waits out the coalescing window
+    (skipped for urgent updates), writes to a temp file and renames it
+    over the state file, so readers never see half-written JSON.
+    """
+
+    def __init__(self, path: str, coalesce_ms: int = 100):
+        """
+        Initialize HUD state publisher
+
+        Args:
+            path: State file path (e.g. jarvis_state.json)
+            coalesce_ms: Updates within this window collapse into one write
+        """
+        self.path = path
+        self.interval = coalesce_ms / 1000
+        # Identifies this publisher so readers notice a restart (seq starts over)
+        self.session = f"{os.getpid()}-{int(time.time() * 1000)}"
+        self.seq = 0
+
+        self._cond = threading.Condition()
+        self._pending: Optional[Dict[str, Any]] = None
+        self._pending_since = 0.0
+        self._urgent = False
+        self._running = False
+        self._thread = None
+
+        self.published = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.failed = 0
+        self.max_write_ms = 0.0
+
+    def publish(self, text: str, speaker: str = "jarvis", data_type: str = "transcript",
+                urgent: bool = False):
+        """
+        Queue a state update (thread-safe, never blocks on I/O)
+
+        Args:
+            text: Text to show
+            speaker: "jarvis" or "user"
+            data_type: "transcript", "status", "tool_result", ...
+            urgent: Write without waiting for the coalescing window
+        """
+        state = {
+            "text": text,
+            "speaker": speaker,
+            "data_type": data_type,
+            "timestamp": time.time(),
+        }
+        with self._cond:
+            if self._pending is None:
+                self._pending_since = time.monotonic()
+            else:
+                self.coalesced += 1
+            self._pending = state
+            self._urgent = self._urgent or urgent
+            self.published += 1
+            if not self._running:
+                self._start()
+            self._cond.notify()
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Write any pending state now and wait for it"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._urgent = True
+            self._cond.notify()
+            while self._pending is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        self.flush()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """Publish/write counters"""
+        return {
+            'seq': self.seq,
+            'published': self.published,
+            'writes': self.writes,
+            'coalesced': self.coalesced,
+            'failed': self.failed,
+            'max_write_ms': round(self.max_write_ms, 2),
+        }
+
+    # ----------------------------------------------------------------- #
+    # Writer thread
+    # ----------------------------------------------------------------- #
+    def _start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="hud-state-writer")
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and self._running:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+
+                # Let the burst settle unless someone asked for it now
+                while not self._urgent and self._running:
+                    remaining = self._pending_since + self.interval - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                state = self._pending
+                self._urgent = False
+
+            self._write(state)
+
+            with self._cond:
+                if self._pending is state:
+                    self._pending = None
+                self._cond.notify_all()
+
+    def _write(self, state: Dict[str, Any]):
+        """Atomically replace the state file"""
+        started = time.perf_counter()
+        self.seq += 1
+        payload = dict(state, seq=self.seq, session=self.session)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            # Windows refuses to replace a file a reader has open; retry briefly
+            for attempt in range(5):
+                try:
+                    os.replace(tmp_path, self.path)
+                    break
+                except PermissionError:
+                    if attempt == 4:
+                        raise
+                    time.sleep(0.01)
+            self.writes += 1
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Failed to update {os.path.basename(self.path)}: {e}")
+        finally:
+            self.max_write_ms = max(self.max_write_ms, (time.perf_counter() - started) * 1000)
+
+
+class HUDStateReader:
+    """
+    Polls the state file and returns only states that are new
+
+    A stat() call is enough to skip unchanged files; the file is parsed
+    only when its mtime or size moved, and a state is returned only if its
+    (session, seq) differs from the last one consumed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.last_seq = 0
+        self.last_session = None
+        self._last_stat = None
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the state file if it changed
+
+        Returns:
+            The new state dict, or None if there is nothing new
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._last_stat:
+            return None
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._last_stat = signature
+
+        session = state.get("session")
+        seq = state.get("seq", 0)
+        if session == self.last_session and seq <= self.last_seq:
+            return None
+        self.last_session = session
+        self.last_seq = seq
+        return state
@@ -6,6 +6,8 @@ import logging
 import re
 from typing import Tuple, Optional
 
+from tracing import traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +47,7 @@ class InputSanitizer:
         
         logger.info("✅ Input sanitizer initialized")
     
+    @traced("sanitize")
     def sanitize_text(self, text: str) -> Tuple[bool, str, Optional[str]]:
         """
         Sanitize user input text
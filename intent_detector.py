@@ -6,8 +6,19 @@ import logging
 from typing import Dict, Tuple
 import re
 
+from config import SEMANTIC_INTENT_CONFIG
+from tracing import traced
+
 logger = logging.getLogger(__name__)
 
+# details['type'] for each intent
+_INTENT_TYPES = {
+    'ACTION': 'system_control',
+    'INFORMATION': 'knowledge_request',
+    'CONVERSATION': 'casual_chat',
+    'EXIT': 'exit_request',
+}
+
 
 class IntentDetector:
     """
@@ -15,8 +26,18 @@ class IntentDetector:
     Determines whether user wants ACTION or INFORMATION
     """
     
-    def __init__(self):
-        """Initialize intent detector with comprehensive keyword sets"""
+    def __init__(self, semantic=None):
+        """
+        Initialize intent detector with comprehensive keyword sets
+        
+        Args:
+            semantic: SemanticIntentClassifier consulted before the keyword
+                scores (default: the global one if SEMANTIC_INTENT_CONFIG is enabled)
+        """
+        if semantic is None and SEMANTIC_INTENT_CONFIG['enabled']:
+            from semantic_intent import get_semantic_classifier
+            semantic = get_semantic_classifier()
+        self.semantic = semantic
         
         # ACTION KEYWORDS - System control and automation
         self.action_keywords = {
@@ -72,6 +93,7 @@ class IntentDetector:
         
         logger.info("✅ Intent detector initialized with comprehensive rules")
     
+    @traced("intent")
     def classify_intent(self, text: str) -> Tuple[str, float, Dict]:
         """
         Classify user input into one of four intents:
@@ -91,17 +113,26 @@ class IntentDetector:
         """
         text_lower = text.lower().strip()
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"🎯 INTENT CLASSIFICATION")
-        logger.info(f"📝 INPUT: '{text}'")
+        logger.debug("\n" + "=" * 60)
+        logger.debug("🎯 INTENT CLASSIFICATION")
+        logger.debug("📝 INPUT: '%s'", text)
         
         # PRIORITY 1: Check for EXIT intent
         exit_score = self._calculate_keyword_score(text_lower, self.exit_keywords)
         if exit_score > 0.5:
-            logger.info(f"🚪 DETECTED: EXIT (confidence: {exit_score:.2f})")
-            logger.info(f"{'='*60}\n")
+            logger.info("🚪 DETECTED: EXIT (confidence: %.2f)", exit_score)
             return 'EXIT', exit_score, {'reason': 'exit_keyword_match'}
         
+        # Embedding classifier (optional) - the keyword scores below decide
+        # whenever it isn't confident
+        if self.semantic is not None:
+            intent, confidence, nearest = self.semantic.classify(text)
+            if intent is not None:
+                logger.info("🧭 FINAL INTENT: %s (confidence: %.2f, semantic)", intent, confidence)
+                logger.debug("🧭 Nearest example: '%s'", nearest)
+                return intent, confidence, {'type': _INTENT_TYPES[intent], 'classifier': 'semantic'}
+            logger.debug("🧭 Semantic classifier unsure (%.2f) - using keyword scores", confidence)
+        
         # PRIORITY 2: Check for ACTION intent (MUST be high priority)
         # System commands should NEVER go to Gemini
         action_score = self._calculate_action_score(text_lower)
@@ -113,36 +144,30 @@ class IntentDetector:
         conversation_score = self._calculate_conversation_score(text_lower)
         
         # Log all scores
-        logger.info(f"📊 SCORES:")
-        logger.info(f"   ACTION: {action_score:.2f}")
-        logger.info(f"   INFORMATION: {info_score:.2f}")
-        logger.info(f"   CONVERSATION: {conversation_score:.2f}")
+        logger.debug("📊 SCORES: ACTION %.2f | INFORMATION %.2f | CONVERSATION %.2f",
+                     action_score, info_score, conversation_score)
         
         # CRITICAL DECISION LOGIC:
         # If action score is significant, treat as ACTION to ensure execution
         if action_score >= 0.4:  # Lower threshold for better detection
-            logger.info(f"⚡ FINAL INTENT: ACTION (confidence: {action_score:.2f})")
-            logger.info(f"🚨 SYSTEM COMMAND - Will execute locally, NOT sent to Gemini")
-            logger.info(f"{'='*60}\n")
+            logger.info("⚡ FINAL INTENT: ACTION (confidence: %.2f)", action_score)
+            logger.debug("🚨 SYSTEM COMMAND - Will execute locally, NOT sent to Gemini")
             return 'ACTION', action_score, {'type': 'system_control'}
         
         elif info_score > 0.4:  # Information/learning
-            logger.info(f"📚 FINAL INTENT: INFORMATION (confidence: {info_score:.2f})")
-            logger.info(f"🤖 KNOWLEDGE REQUEST - Will query Gemini AI")
-            logger.info(f"{'='*60}\n")
+            logger.info("📚 FINAL INTENT: INFORMATION (confidence: %.2f)", info_score)
+            logger.debug("🤖 KNOWLEDGE REQUEST - Will query Gemini AI")
             return 'INFORMATION', info_score, {'type': 'knowledge_request'}
         
         elif conversation_score > 0.3:  # Casual conversation
-            logger.info(f"💬 FINAL INTENT: CONVERSATION (confidence: {conversation_score:.2f})")
-            logger.info(f"🤖 CASUAL CHAT - Will use Gemini for response")
-            logger.info(f"{'='*60}\n")
+            logger.info("💬 FINAL INTENT: CONVERSATION (confidence: %.2f)", conversation_score)
+            logger.debug("🤖 CASUAL CHAT - Will use Gemini for response")
             return 'CONVERSATION', conversation_score, {'type': 'casual_chat'}
         
         else:
             # Default to INFORMATION if unclear (educational bias)
-            logger.info(f"❓ UNCLEAR - Defaulting to INFORMATION")
-            logger.info(f"🤖 Will query Gemini AI for best response")
-            logger.info(f"{'='*60}\n")
+            logger.info("❓ UNCLEAR - Defaulting to INFORMATION")
+            logger.debug("🤖 Will query Gemini AI for best response")
             return 'INFORMATION', 0.5, {'type': 'unclear_fallback'}
     
     def _calculate_action_score(self, text: str) -> float:
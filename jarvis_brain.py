@@ -6,11 +6,17 @@ WITH SECURITY: Input sanitization to prevent command injection
 import logging
 import re
 from typing import Dict, List, Optional, Tuple
-from config import AI_CONFIG, AI_PROVIDER, GEMINI_API_KEY, OPENAI_API_KEY
+from config import AI_CONFIG, AI_PROVIDER, GEMINI_API_KEY, MEMORY_CONFIG, OPENAI_API_KEY
 
 # Import new dual-brain components
 from intent_detector import IntentDetector
 from knowledge_engine import KnowledgeEngine
+from ai_guard import AIUnavailable, GuardedKnowledgeEngine, guard_engine
+from answer_cache import get_answer_cache
+from prefetch import get_prefetcher
+from app_resolver import get_app_resolver
+from small_talk import SmallTalkEngine
+from tracing import traced
 
 # Import security module
 try:
@@ -37,12 +43,14 @@ class JarvisBrain:
     - Sanitizes input before processing
     """
     
-    def __init__(self, memory_manager):
+    def __init__(self, memory_manager, knowledge_engine: Optional[KnowledgeEngine] = None):
         """
         Initialize dual-brain system
         
         Args:
             memory_manager: ConversationMemory instance
+            knowledge_engine: Pre-built KnowledgeEngine, used as is
+                (default: Gemini from AI_CONFIG behind the AI_GUARD_CONFIG rate limiter)
         """
         self.memory = memory_manager
         
@@ -58,14 +66,33 @@ class JarvisBrain:
         self.intent_detector = IntentDetector()
         logger.info("✅ Intent Detector initialized")
         
+        # Local small talk tier (answers greetings etc. without the model)
+        self.small_talk = SmallTalkEngine()
+        
         # Initialize Knowledge Engine (Educational AI) - ALWAYS with API key
-        from config import AI_CONFIG
-        self.knowledge_engine = KnowledgeEngine(
-            api_key=GEMINI_API_KEY,
-            model_name=AI_CONFIG['model']
-        )
+        if knowledge_engine is not None:
+            self.knowledge_engine = knowledge_engine
+        else:
+            self.knowledge_engine = guard_engine(KnowledgeEngine(
+                api_key=GEMINI_API_KEY,
+                model_name=AI_CONFIG['model'],
+                memory=self.memory,
+                answer_cache=get_answer_cache()
+            ))
         logger.info("✅ Knowledge Engine initialized with Gemini")
         
+        # Optional: generate likely follow-ups in the background
+        self.prefetcher = get_prefetcher(self.knowledge_engine)
+        
+        # Optional: let the model rewrite the running conversation summary
+        # (batched, in the background, only with quota to spare)
+        if MEMORY_CONFIG['summary_model']:
+            engine = self.knowledge_engine
+            spare = None
+            if isinstance(engine, GuardedKnowledgeEngine):
+                spare = lambda: engine.spare(MEMORY_CONFIG['summary_keep_tokens'])
+            self.memory.summarizer.use_model(engine.generate_standalone, spare)
+        
         # Legacy settings
         self.ai_provider = AI_PROVIDER
         self.system_prompt = AI_CONFIG['system_prompt']
@@ -107,6 +134,7 @@ class JarvisBrain:
             logger.error(f"❌ OpenAI initialization failed: {e}")
             self.ai_client = None
     
+    @traced("brain")
     def process_input(self, user_text: str, detected_lang: str = 'en') -> Dict:
         """
         DUAL-BRAIN PROCESSING WITH SECURITY:
@@ -121,11 +149,12 @@ class JarvisBrain:
         Returns:
             Dict with: intent, response, action, confidence, entities
         """
-        logger.info(f"\n{'='*60}")
-        logger.info(f"🧠 JARVIS DUAL-BRAIN PROCESSING")
-        logger.info(f"📝 RAW INPUT: '{user_text}'")
-        logger.info(f"🌐 LANGUAGE: {detected_lang}")
-        logger.info(f"{'='*60}")
+        # Hot path: lazy %-style arguments, details only at DEBUG
+        logger.debug("\n" + "=" * 60)
+        logger.debug("🧠 JARVIS DUAL-BRAIN PROCESSING")
+        logger.info("📝 RAW INPUT: '%s'", user_text)
+        logger.info("🌐 LANGUAGE: %s", detected_lang)
+        logger.debug("=" * 60)
         
         # SECURITY: Sanitize input first
         if self.sanitizer:
@@ -146,12 +175,12 @@ class JarvisBrain:
                 logger.warning(f"⚠️ {warning}")
             
             user_text = sanitized_text
-            logger.info(f"🔒 SANITIZED INPUT: '{user_text}'")
+            logger.debug("🔒 SANITIZED INPUT: '%s'", user_text)
         
         # STEP 1: CLASSIFY INTENT
         primary_intent, confidence, details = self.intent_detector.classify_intent(user_text)
         
-        logger.info(f"\n🎯 PRIMARY INTENT: {primary_intent} (confidence: {confidence:.2f})")
+        logger.info("🎯 PRIMARY INTENT: %s (confidence: %.2f)", primary_intent, confidence)
         
         # Add to memory with intent
         self.memory.add_user_message(
@@ -163,17 +192,33 @@ class JarvisBrain:
         
         # ROUTE TO APPROPRIATE BRAIN
         
+        # Keyword scores send plenty of small talk ("how are you",
+        # "thank you jarvis") to INFORMATION - answer it locally either way
+        small_talk_reply = None
+        if primary_intent in ('INFORMATION', 'CONVERSATION'):
+            small_talk_reply = self.small_talk.reply(user_text)
+        
+        # ========== SMALL TALK (LOCAL, NO AI) ==========
+        if small_talk_reply is not None:
+            result = {
+                'intent': 'conversation',
+                'response': small_talk_reply,
+                'action': None,
+                'parameters': {},
+                'entities': {},
+                'confidence': confidence
+            }
+        
         # ========== ACTION BRAIN (PRIORITY 1) ==========
-        if primary_intent == 'ACTION':
-            logger.info("\n⚡ ROUTING TO: ACTION BRAIN")
-            logger.info("🎯 Detecting specific action...")
-            logger.info("🚨 SYSTEM COMMAND - Will execute locally, NOT sent to AI")
+        elif primary_intent == 'ACTION':
+            logger.debug("⚡ ROUTING TO: ACTION BRAIN")
+            logger.debug("🚨 SYSTEM COMMAND - Will execute locally, NOT sent to AI")
             
             # Use existing action detection
             action_result = self.detect_action_intent(user_text)
             
-            logger.info(f"⚙️ ACTION: {action_result.get('action', 'unknown')}")
-            logger.info(f"🏷️ ENTITIES: {action_result.get('entities', {})}")
+            logger.info("⚙️ ACTION: %s", action_result.get('action', 'unknown'))
+            logger.debug("🏷️ ENTITIES: %s", action_result.get('entities', {}))
             
             # Generate simple acknowledgment
             response_text = self._generate_natural_response(user_text, action_result)
@@ -189,13 +234,25 @@ class JarvisBrain:
         
         # ========== KNOWLEDGE BRAIN (PRIORITY 2) ==========
         elif primary_intent == 'INFORMATION':
-            logger.info("\n📚 ROUTING TO: KNOWLEDGE BRAIN (Educational AI)")
+            logger.debug("📚 ROUTING TO: KNOWLEDGE BRAIN (Educational AI)")
             
             # Get context from memory
             context = self.memory.get_last_topic()
             
+            # A follow-up may already have been answered in the background
+            response_text = self.prefetcher.take(user_text) if self.prefetcher else None
+            
             # Generate educational explanation
-            response_text = self.knowledge_engine.explain(user_text, context)
+            if response_text is None:
+                try:
+                    response_text, source = self.knowledge_engine.explain_with_source(user_text, context)
+                    # Only a fresh model answer spends background quota (a shared
+                    # answer is scheduled by the caller whose request made it)
+                    if self.prefetcher and source == 'model':
+                        self.prefetcher.schedule(user_text)
+                except AIUnavailable as e:
+                    logger.warning("🔌 Knowledge brain unavailable (%s) - answering offline", e.reason)
+                    response_text = self._intelligent_fallback(user_text)
             
             result = {
                 'intent': 'information',
@@ -208,7 +265,7 @@ class JarvisBrain:
         
         # ========== CONVERSATION BRAIN (PRIORITY 3) ==========
         elif primary_intent == 'CONVERSATION':
-            logger.info("\n💬 ROUTING TO: CONVERSATION BRAIN")
+            logger.debug("💬 ROUTING TO: CONVERSATION BRAIN")
             response_text = self._handle_conversation(user_text)
             
             result = {
@@ -252,8 +309,8 @@ class JarvisBrain:
             intent=result.get('intent')
         )
         
-        logger.info(f"\n💬 FINAL RESPONSE: '{result['response'][:100]}...'")
-        logger.info(f"{'='*60}\n")
+        logger.info("💬 FINAL RESPONSE: '%.100s...'", result['response'])
+        logger.debug("=" * 60)
         
         return result
     
@@ -526,6 +583,9 @@ Instructions:
 
 Conversation history:
 """
+                summary = self.memory.get_summary()
+                if summary:
+                    prompt += f"(Earlier: {summary})\n"
                 for msg in context[-3:]:
                     prompt += f"{msg['role'].capitalize()}: {msg['content']}\n"
                 
@@ -553,7 +613,7 @@ Be conversational and human-like. Common greetings:
 - "how are you" → "I'm great, thanks for asking! How can I assist you?"
 - "thanks" → "You're welcome! Happy to help."
 """
-            response = self.knowledge_engine.explain(conversational_prompt, None)
+            response = self.knowledge_engine.explain(conversational_prompt, None, cacheable=False)
             return response.strip()
         except Exception as e:
             logger.error(f"❌ Conversation handling failed: {e}")
@@ -564,41 +624,19 @@ Be conversational and human-like. Common greetings:
         Intelligent fallback responses (NO AI available)
         Natural, context-aware, NO generic phrases
         """
-        text_lower = text.lower()
-        
-        # Greeting
-        if any(word in text_lower for word in ['hello', 'hi', 'hey', 'namaste', 'namaskaar']):
-            return "Hello! What can I do for you?"
-        
-        # How are you
-        if any(phrase in text_lower for phrase in ['how are you', 'kaise ho', 'how r you']):
-            return "I'm doing great! What about you?"
-        
-        # Thanks
-        if any(word in text_lower for word in ['thank', 'thanks', 'shukriya', 'dhanyavad']):
-            return "You're welcome!"
-        
-        # Who are you
-        if any(phrase in text_lower for phrase in ['who are you', 'what are you', 'kaun ho', 'tum kaun']):
-            return "I'm JARVIS, your AI assistant. I can control your computer, answer questions, and help with tasks."
-        
-        # Name question
-        if any(phrase in text_lower for phrase in ['your name', 'naam kya', 'what is your name']):
-            return "I'm JARVIS."
-        
-        # Capabilities
-        if any(phrase in text_lower for phrase in ['what can you do', 'kya kar sakte', 'capabilities']):
-            return "I can open apps, search the web, play music on YouTube, send messages, and answer your questions."
+        # Any small talk phrase will do here - there is no model to ask
+        match = self.small_talk.match(text, min_confidence=0)
+        if match:
+            return match.reply
         
         # Default - natural acknowledgment
         return "I'm here. What would you like me to do?"
     
     def _extract_app_name(self, text: str) -> str:
         """Extract application name from text"""
-        from config import APPS
-        for app_name in APPS.keys():
-            if app_name in text:
-                return app_name
+        match = get_app_resolver().resolve(text)
+        if match:
+            return match.name
         return "the application"
     
     def _extract_search_query(self, text: str) -> str:
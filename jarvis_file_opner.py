@@ -2,14 +2,10 @@ import os
 import subprocess
 import sys
 import logging
-from fuzzywuzzy import process
 from livekit.agents import function_tool
 import asyncio
-try:
-    import pygetwindow as gw
-except ImportError:
-    gw = None
-    
+from file_index import get_file_index
+from window_tracker import get_window_tracker
 
 sys.stdout.reconfigure(encoding='utf-8')
 
@@ -17,49 +13,23 @@ sys.stdout.reconfigure(encoding='utf-8')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def focus_window(title_keyword: str) -> bool:
-    if not gw:
-        logger.warning("⚠ pygetwindow")
-        return False
-
-    await asyncio.sleep(1.5)
-    title_keyword = title_keyword.lower().strip()
-
-    for window in gw.getAllWindows():
-        if title_keyword in window.title.lower():
-            if window.isMinimized:
-                window.restore()
-            window.activate()
-            logger.info(f"🪟 window focus में है: {window.title}")
-            return True
+async def focus_window(title_keyword: str, timeout: float = 5.0) -> bool:
+    # Focus as soon as the player window appears instead of a fixed sleep
+    if await get_window_tracker().focus(title_keyword, timeout):
+        return True
     logger.warning("⚠ Focus करने के लिए window नहीं मिली।")
     return False
 
-async def index_files(base_dirs):
-    file_index = []
-    for base_dir in base_dirs:
-        for root, _, files in os.walk(base_dir):
-            for f in files:
-                file_index.append({
-                    "name": f,
-                    "path": os.path.join(root, f),
-                    "type": "file"
-                })
-    logger.info(f"✅ {base_dirs} से कुल {len(file_index)} files को index किया गया।")
-    return file_index
-
 async def search_file(query, index):
-    choices = [item["name"] for item in index]
-    if not choices:
+    results = await asyncio.to_thread(index.search, query, 5)
+    if not results:
         logger.warning("⚠ Match करने के लिए कोई files नहीं हैं।")
         return None
 
-    best_match, score = process.extractOne(query, choices)
-    logger.info(f"🔍 Matched '{query}' to '{best_match}' (Score: {score})")
-    if score > 70:
-        for item in index:
-            if item["name"] == best_match:
-                return item
+    best = results[0]
+    logger.info(f"🔍 Matched '{query}' to '{best['name']}' (Score: {best['score']})")
+    if best["score"] > 70:
+        return best
     return None
 
 async def open_file(item):
@@ -85,8 +55,9 @@ async def handle_command(command, index):
 
 @function_tool
 async def Play_file(name: str) -> str:
-    folders_to_index = ["D:/"]
-    index = await index_files(folders_to_index)
+    index = get_file_index()
+    if not index.ready.is_set():
+        logger.info("⏳ File index अभी बन रहा है, अब तक indexed files में search कर रहे हैं।")
     command = name.strip()
     return await handle_command(command, index)
 
@@ -11,6 +11,7 @@ import math
 import time
 from datetime import datetime
 from jarvis_voice import JarvisVoice
+from hud_render import AnimationScheduler, FrameMeter
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -55,8 +56,12 @@ class JarvisFuturisticUI:
         self.listening_thread = threading.Thread(target=self.continuous_listening, daemon=True)
         self.listening_thread.start()
         
-        # Start animation loop
-        self.root.after(50, self.animate)
+        # Start animation loop (20 FPS cap, lower in standby)
+        self.animation = AnimationScheduler(
+            self.root, self.animate, lambda: self.status,
+            max_fps=20, meter=self.frame_meter
+        )
+        self.animation.start(delay_ms=50)
         
         # Start message processor
         self.root.after(100, self.process_message_queue)
@@ -87,6 +92,9 @@ class JarvisFuturisticUI:
         # Draw static elements
         self.draw_static_elements()
         
+        # Animated items are created once and updated every frame
+        self.create_dynamic_items()
+        
         # Status overlay
         self.status_frame = ctk.CTkFrame(
             main_frame,
@@ -154,35 +162,61 @@ class JarvisFuturisticUI:
             width=3
         )
     
+    def create_dynamic_items(self):
+        """Create animated canvas items once - animate() only updates them"""
+        # Two rings of 8 arc segments; the second one is only shown
+        # while listening (outside) or speaking (inside)
+        self.arc_rings = []
+        for _ in range(2):
+            arcs = [
+                self.canvas.create_arc(
+                    0, 0, 0, 0, start=0, extent=30, style="arc",
+                    state="hidden", tags="dynamic"
+                )
+                for _ in range(8)
+            ]
+            self.arc_rings.append({'arcs': arcs, 'radius': None, 'visible': False})
+        
+        # Connecting lines from center
+        self.line_items = [
+            self.canvas.create_line(
+                self.center_x, self.center_y, self.center_x, self.center_y,
+                fill="#004488", width=1, tags="dynamic"
+            )
+            for _ in range(12)
+        ]
+        
+        # Render cost per frame
+        self.frame_meter = FrameMeter(self.canvas, 20, 20, 20, color="#006699")
+    
     def animate(self):
-        """Animate the interface"""
-        # Clear dynamic elements
-        self.canvas.delete("dynamic")
+        """Animate the interface (one frame, driven by AnimationScheduler)"""
+        step = self.animation.step
         
         # Rotation
-        self.rotation += 1
-        if self.rotation >= 360:
-            self.rotation = 0
+        self.rotation = (self.rotation + step) % 360
         
         # Pulse effect
-        self.pulse_phase += 0.1
+        self.pulse_phase += 0.1 * step
         pulse = math.sin(self.pulse_phase) * 0.3 + 0.7
         
         # Draw animated rings based on status
         if self.status == "LISTENING":
             color = "#00ff00"
-            self.draw_rotating_arc(200, color, pulse)
-            self.draw_rotating_arc(220, color, pulse * 0.8)
+            self.draw_rotating_arc(0, 200, color, pulse)
+            self.draw_rotating_arc(1, 220, color, pulse * 0.8)
         elif self.status == "PROCESSING":
             color = "#ffaa00"
-            self.draw_rotating_arc(200, color, pulse)
+            self.draw_rotating_arc(0, 200, color, pulse)
+            self.hide_arc_ring(1)
         elif self.status == "SPEAKING":
             color = "#00aaff"
-            self.draw_rotating_arc(200, color, pulse)
-            self.draw_rotating_arc(180, color, pulse * 0.7)
+            self.draw_rotating_arc(0, 200, color, pulse)
+            self.draw_rotating_arc(1, 180, color, pulse * 0.7)
         else:
             color = "#003366"
-            self.draw_rotating_arc(200, color, 0.5)
+            self.draw_rotating_arc(0, 200, color, 0.5)
+            self.hide_arc_ring(1)
         
         # Update core circle color
         core_colors = {
@@ -195,51 +229,50 @@ class JarvisFuturisticUI:
         
         # Draw connecting lines
         self.draw_connecting_lines()
-        
-        # Schedule next frame
-        self.root.after(50, self.animate)
     
-    def draw_rotating_arc(self, radius, color, opacity):
-        """Draw rotating arc segments"""
-        num_segments = 8
-        for i in range(num_segments):
-            angle = (self.rotation + i * 45) % 360
-            start_angle = angle
-            extent = 30
-            
-            x1 = self.center_x + radius * math.cos(math.radians(angle))
-            y1 = self.center_y + radius * math.sin(math.radians(angle))
-            x2 = self.center_x + (radius + 20) * math.cos(math.radians(angle + extent))
-            y2 = self.center_y + (radius + 20) * math.sin(math.radians(angle + extent))
-            
-            self.canvas.create_arc(
-                self.center_x - radius, self.center_y - radius,
-                self.center_x + radius, self.center_y + radius,
-                start=start_angle,
-                extent=extent,
-                outline=color,
-                width=int(3 * opacity),
-                style="arc",
-                tags="dynamic"
-            )
+    def draw_rotating_arc(self, ring_index, radius, color, opacity):
+        """Rotate one ring of arc segments"""
+        ring = self.arc_rings[ring_index]
+        
+        # Radius only changes with status
+        if ring['radius'] != radius:
+            ring['radius'] = radius
+            for arc in ring['arcs']:
+                self.canvas.coords(
+                    arc,
+                    self.center_x - radius, self.center_y - radius,
+                    self.center_x + radius, self.center_y + radius
+                )
+        
+        for i, arc in enumerate(ring['arcs']):
+            options = {
+                'start': (self.rotation + i * 45) % 360,
+                'outline': color,
+                'width': int(3 * opacity),
+            }
+            if not ring['visible']:
+                options['state'] = "normal"
+            self.canvas.itemconfig(arc, **options)
+        ring['visible'] = True
+    
+    def hide_arc_ring(self, ring_index):
+        """Hide a ring of arc segments"""
+        ring = self.arc_rings[ring_index]
+        if ring['visible']:
+            ring['visible'] = False
+            for arc in ring['arcs']:
+                self.canvas.itemconfig(arc, state="hidden")
     
     def draw_connecting_lines(self):
-        """Draw connecting lines from center"""
-        num_lines = 12
-        for i in range(num_lines):
+        """Move connecting lines from center"""
+        for i, line in enumerate(self.line_items):
             angle = (self.rotation * 2 + i * 30) % 360
             length = 150 + math.sin(self.pulse_phase + i) * 20
             
             x = self.center_x + length * math.cos(math.radians(angle))
             y = self.center_y + length * math.sin(math.radians(angle))
             
-            self.canvas.create_line(
-                self.center_x, self.center_y,
-                x, y,
-                fill="#004488",
-                width=1,
-                tags="dynamic"
-            )
+            self.canvas.coords(line, self.center_x, self.center_y, x, y)
     
     def set_status(self, status, message=""):
         """Update status display"""
@@ -1,18 +1,26 @@
 import os
-import requests
 import logging
 from dotenv import load_dotenv
 from livekit.agents import function_tool  
 
+from config import HTTP_CONFIG
+from http_client import get_http_client
+
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def detect_city_by_ip() -> str:
+IP_LOOKUP_URL = "https://ipapi.co/json/"
+WEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+async def detect_city_by_ip() -> str:
     try:
         logger.info("IP के ज़रिए शहर detect करने की कोशिश की जा रही है")
-        ip_info = requests.get("https://ipapi.co/json/").json()
+        # The public IP rarely changes - cached for hours
+        ip_info = await get_http_client().get_json(
+            IP_LOOKUP_URL, ttl=HTTP_CONFIG['cache_ttl']['city_by_ip']
+        )
         city = ip_info.get("city")
         if city:
             logger.info(f"IP से शहर Detect किया गया: {city}")
@@ -29,23 +37,24 @@ async def get_weather(city: str = "") -> str:
     
     API_KEY = os.getenv("OPENWEATHER_API_KEY")
 
-    if not api_key:
+    if not API_KEY:
         logger.error("OpenWeather API key missing है।")
         return "Environment variables में OpenWeather API key नहीं मिली।"
 
     if not city:
-        city = detect_city_by_ip()
+        city = await detect_city_by_ip()
 
     logger.info(f"City के लिए weather fetch किया जा रहा है।: {city}")
-    url = "https://api.openweathermap.org/data/2.5/weather"
     params = {
         "q": city,
-        "appid": api_key,
+        "appid": API_KEY,
         "units": "metric"
     }
 
     try:
-        response = requests.get(url, params=params)
+        response = await get_http_client().get(
+            WEATHER_URL, params=params, ttl=HTTP_CONFIG['cache_ttl']['weather']
+        )
         if response.status_code != 200:
             logger.error(f"OpenWeather API में error आया।: {response.status_code} - {response.text}")
             return f"Error: {city} के लिए weather fetch नहीं कर पाए। कृपया city name चेक करें।"
@@ -55,14 +64,12 @@ async def get_weather(city: str = "") -> str:
         temperature = data["main"]["temp"]
         humidity = data["main"]["humidity"]
         wind_speed = data["wind"]["speed"]
-        UV_INDEX = data["UV"]["Index"]
 
         result = (f"Weather in {city}:\n"
                   f"- Condition: {weather}\n"
                   f"- Temperature: {temperature}°C\n"
                   f"- Humidity: {humidity}%\n"
                   f"- Wind Speed: {wind_speed} m/s")
-                  f" - UV Index: {UV_INDEX}\n"
 
         logger.info(f"Weather result: \n{result}")
         return result
@@ -1,11 +1,13 @@
-import o
+import os
 import sys
-import requests
 import logging
 from dotenv import load_dotenv
 from livekit.agents import function_tool
 from datetime import datetime
 
+from config import HTTP_CONFIG
+from http_client import get_http_client
+
 # Load environment variable
 load_dotenv()
 
@@ -13,6 +15,8 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+
 @function_tool
 async def google_search(query: str) -> str:
     logger.info(f"Query प्राप्त हुई।: {query}")
@@ -24,7 +28,6 @@ async def google_search(query: str) -> str:
         logger.error("API key या Search Engine ID missing है।")
         return "Environment variables में API key या Search Engine ID missing है।"
 
-    url = "https://www.googleapis.com/customsearch/v1"
     params = {
         "key": api_key,
         "cx": search_engine_id,
@@ -33,7 +36,15 @@ async def google_search(query: str) -> str:
     }
 
     logger.info("Google Custom Search API को request भेजी जा रही है...")
-    response = requests.get(url, params=params)
+    try:
+        response = await get_http_client().get(
+            SEARCH_URL, params=params, ttl=HTTP_CONFIG['cache_ttl']['search']
+        )
+    except Exception as e:
+        logger.error(f"Google Search request failed: {e}")
+        return f"Google Search request failed: {e}"
+    if response.cached:
+        logger.info("Cached search results")
 
     if response.status_code != 200:
         logger.error(f"Google API में error आया: {response.status_code} - {response.text}")
@@ -55,11 +66,11 @@ async def google_search(query: str) -> str:
         formatted += f"{i}. {title}\n{link}\n{snippet}\n\n"
         logger.info(f"{i}. {title}\n{link}\n{snippet}\n")
 
-    return formetted strip()
+    return formatted.strip()
 
 @function_tool
 async def get_current_datetime() -> str:
-    return datetime().now.isoformate()
+    return datetime.now().isoformat()
 
 
 
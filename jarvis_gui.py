@@ -6,7 +6,6 @@ Futuristic circular HUD with voice integration
 import customtkinter as ctk
 from tkinter import Canvas
 import threading
-import queue
 import math
 import time
 from datetime import datetime
@@ -14,6 +13,10 @@ import subprocess
 import logging
 from constants import COLORS, FONTS, HUD, PANELS, APPS, ANIMATION
 from jarvis_voice import JarvisVoice
+from app_resolver import get_app_resolver
+from system_controller import get_system_controller
+from hud_render import AnimationScheduler, FrameMeter
+from ui_bus import UIEventBus, StatusChanged
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -50,7 +53,10 @@ class JarvisHUD:
         self.rotation = 0
         self.pulse_phase = 0
         self.is_listening = False
-        self.message_queue = queue.Queue()
+        
+        # Worker threads publish here; the main loop applies the latest status
+        self.ui = UIEventBus(self.root)
+        self.ui.subscribe(StatusChanged, lambda event: self.set_status(event.status, event.detail))
         
         # Setup UI
         self.setup_ui()
@@ -59,10 +65,14 @@ class JarvisHUD:
         self.listening_thread = threading.Thread(target=self.continuous_listening, daemon=True)
         self.listening_thread.start()
         
-        # Start animations
-        self.animate()
+        # Start animations (frame rate follows self.status)
+        self.animation = AnimationScheduler(
+            self.root, self.animate, lambda: self.status,
+            max_fps=ANIMATION['fps'], meter=self.frame_meter
+        )
+        self.animation.start()
         self.update_time()
-        self.process_messages()
+        self.ui.start()
         
         logger.info("✅ JARVIS HUD Initialized")
     
@@ -82,6 +92,9 @@ class JarvisHUD:
         # Draw static HUD elements
         self.draw_static_hud()
         
+        # Animated items are created once and moved every frame
+        self.create_dynamic_items()
+        
         # Create panels
         self.create_left_panel()
         self.create_right_panel()
@@ -331,14 +344,58 @@ class JarvisHUD:
             y=self.center_y - 20
         )
     
+    def create_dynamic_items(self):
+        """Create animated canvas items once - animate() only updates them"""
+        rings = [
+            (HUD['ring3_radius'], COLORS['cyan_accent'], 2),
+            (HUD['ring2_radius'], COLORS['cyan_primary'], 2),
+            (HUD['ring1_radius'], COLORS['blue_glow'], 3),
+        ]
+        
+        # Rings: one oval plus 8 rotating arc segments each
+        self.ring_items = []
+        for radius, color, width in rings:
+            bbox = (
+                self.center_x - radius, self.center_y - radius,
+                self.center_x + radius, self.center_y + radius
+            )
+            oval = self.canvas.create_oval(*bbox, outline=color, width=width, tags='dynamic')
+            arcs = [
+                self.canvas.create_arc(
+                    *bbox, start=i * 45, extent=30, outline=color,
+                    width=width, style='arc', tags='dynamic'
+                )
+                for i in range(8)
+            ]
+            self.ring_items.append({'oval': oval, 'arcs': arcs, 'width': width, 'current': width})
+        
+        # Radar lines from center
+        self.radar_items = [
+            self.canvas.create_line(
+                self.center_x, self.center_y, self.center_x, self.center_y,
+                fill=COLORS['gray_dark'], width=1, tags='dynamic'
+            )
+            for _ in range(12)
+        ]
+        
+        # Status dots around outer ring (every third one is bigger and bright)
+        self.dot_items = []
+        for i in range(24):
+            color = COLORS['cyan_accent'] if i % 3 == 0 else COLORS['gray_dark']
+            size = 4 if i % 3 == 0 else 2
+            item = self.canvas.create_oval(0, 0, 0, 0, fill=color, outline='', tags='dynamic')
+            self.dot_items.append((item, size))
+        
+        # Render cost per frame
+        self.frame_meter = FrameMeter(self.canvas, 80, 40, ANIMATION['fps'], color=COLORS['gray_dark'])
+    
     def animate(self):
-        """Animate HUD elements"""
-        # Clear dynamic elements
-        self.canvas.delete('dynamic')
+        """Animate HUD elements (one frame, driven by AnimationScheduler)"""
+        step = self.animation.step
         
         # Update rotation
-        self.rotation = (self.rotation + ANIMATION['rotation_speed']) % 360
-        self.pulse_phase += 0.05
+        self.rotation = (self.rotation + ANIMATION['rotation_speed'] * step) % 360
+        self.pulse_phase += 0.05 * step
         
         # Pulse effect
         pulse = math.sin(self.pulse_phase) * 0.15 + 0.85
@@ -351,89 +408,48 @@ class JarvisHUD:
         
         # Draw status dots
         self.draw_status_dots()
-        
-        # Schedule next frame
-        self.root.after(int(1000 / ANIMATION['fps']), self.animate)
     
     def draw_rotating_rings(self, pulse):
-        """Draw animated circular rings"""
-        rings = [
-            (HUD['ring3_radius'], COLORS['cyan_accent'], 2),
-            (HUD['ring2_radius'], COLORS['cyan_primary'], 2),
-            (HUD['ring1_radius'], COLORS['blue_glow'], 3),
-        ]
-        
-        for radius, color, width in rings:
-            # Draw circle
-            x1 = self.center_x - radius
-            y1 = self.center_y - radius
-            x2 = self.center_x + radius
-            y2 = self.center_y + radius
+        """Rotate ring arcs (and pulse their width while listening)"""
+        for ring in self.ring_items:
+            width = ring['width']
             
             # Adjust opacity based on status
             if self.status == "LISTENING":
                 width = int(width * pulse * 1.5)
             
-            self.canvas.create_oval(
-                x1, y1, x2, y2,
-                outline=color,
-                width=width,
-                tags='dynamic'
-            )
+            # Width only changes while listening - skip redundant configs
+            if width != ring['current']:
+                ring['current'] = width
+                self.canvas.itemconfig(ring['oval'], width=width)
+                for arc in ring['arcs']:
+                    self.canvas.itemconfig(arc, width=width)
             
-            # Draw arc segments (rotating)
-            num_segments = 8
-            for i in range(num_segments):
-                angle = (self.rotation + i * 45) % 360
-                self.canvas.create_arc(
-                    x1, y1, x2, y2,
-                    start=angle,
-                    extent=30,
-                    outline=color,
-                    width=width,
-                    style='arc',
-                    tags='dynamic'
-                )
+            # Rotate arc segments
+            for i, arc in enumerate(ring['arcs']):
+                self.canvas.itemconfig(arc, start=(self.rotation + i * 45) % 360)
     
     def draw_radar_lines(self):
-        """Draw radar-style lines from center"""
-        num_lines = 12
-        for i in range(num_lines):
+        """Rotate radar-style lines from center"""
+        length = HUD['center_radius'] - 20
+        for i, line in enumerate(self.radar_items):
             angle = math.radians((self.rotation * 2 + i * 30) % 360)
-            length = HUD['center_radius'] - 20
             
             x = self.center_x + length * math.cos(angle)
             y = self.center_y + length * math.sin(angle)
             
-            self.canvas.create_line(
-                self.center_x, self.center_y,
-                x, y,
-                fill=COLORS['gray_dark'],
-                width=1,
-                tags='dynamic'
-            )
+            self.canvas.coords(line, self.center_x, self.center_y, x, y)
     
     def draw_status_dots(self):
-        """Draw status indicator dots"""
-        # Draw dots around outer ring
-        num_dots = 24
-        for i in range(num_dots):
+        """Move status indicator dots around the outer ring"""
+        radius = HUD['ring3_radius'] + 15
+        for i, (dot, size) in enumerate(self.dot_items):
             angle = math.radians((self.rotation + i * 15) % 360)
-            radius = HUD['ring3_radius'] + 15
             
             x = self.center_x + radius * math.cos(angle)
             y = self.center_y + radius * math.sin(angle)
             
-            color = COLORS['cyan_accent'] if i % 3 == 0 else COLORS['gray_dark']
-            size = 4 if i % 3 == 0 else 2
-            
-            self.canvas.create_oval(
-                x - size, y - size,
-                x + size, y + size,
-                fill=color,
-                outline='',
-                tags='dynamic'
-            )
+            self.canvas.coords(dot, x - size, y - size, x + size, y + size)
     
     def update_time(self):
         """Update time display"""
@@ -443,7 +459,7 @@ class JarvisHUD:
         self.root.after(1000, self.update_time)
     
     def set_status(self, status, detail=""):
-        """Update status display"""
+        """Update status display (main thread - workers publish StatusChanged)"""
         self.status = status
         
         status_colors = {
@@ -502,7 +518,7 @@ class JarvisHUD:
                     logger.info("👂 Listening for ANY speech... (Just speak your command)")
                     
                     self.is_listening = True
-                    self.message_queue.put({'type': 'status', 'status': 'LISTENING'})
+                    self.ui.publish(StatusChanged('LISTENING'))
                     
                     # Listen directly for command (NO wake word check)
                     logger.info("🎯 Waiting for your voice input...")
@@ -522,7 +538,7 @@ class JarvisHUD:
                         logger.warning("⚠️ No speech detected or processing failed\n")
                     
                     self.is_listening = False
-                    self.message_queue.put({'type': 'status', 'status': 'STANDBY'})
+                    self.ui.publish(StatusChanged('STANDBY'))
                 
                 # Small sleep to prevent CPU overload
                 time.sleep(0.05)
@@ -541,7 +557,7 @@ class JarvisHUD:
         logger.info(f"\n🎯 ===== PROCESSING COMMAND =====")
         logger.info(f"📝 Recognized: '{english_text}'")
         
-        self.message_queue.put({'type': 'status', 'status': 'PROCESSING'})
+        self.ui.publish(StatusChanged('PROCESSING'))
         
         text = english_text.lower().strip()
         response = None
@@ -575,45 +591,21 @@ class JarvisHUD:
         elif 'open' in text:
             intent = "open_app"
             logger.info(f"🧠 Detected Intent: {intent}")
-            opened = False
-            
-            # Try to match app name (case-insensitive, flexible matching)
-            for app in APPS:
-                app_name_lower = app['name'].lower()
-                # Check if app name in command OR common aliases
-                if app_name_lower in text:
-                    logger.info(f"⚙️ Executing task: Open {app['name']}")
-                    logger.info(f"🚀 Launching: {app['command']}")
-                    self.launch_app(app['command'])
-                    response = f"Opening {app['name']} for you, Arjun."
-                    opened = True
-                    break
             
-            # Check for common aliases if not found
-            if not opened:
-                # Browser aliases
-                if any(word in text for word in ['chrome', 'browser', 'google chrome', 'edge', 'firefox']):
-                    logger.info(f"⚙️ Executing task: Open Browser (Chrome)")
-                    logger.info(f"🚀 Launching: start chrome")
-                    self.launch_app('start chrome')
-                    response = "Opening Chrome browser for you, Arjun."
-                    opened = True
-                # WhatsApp
-                elif 'whatsapp' in text:
-                    logger.info(f"⚙️ Executing task: Open WhatsApp")
-                    logger.info(f"🚀 Launching: WhatsApp")
-                    self.launch_app('start https://web.whatsapp.com')
-                    response = "Opening WhatsApp for you, Arjun."
-                    opened = True
-                # VS Code
-                elif any(word in text for word in ['code', 'vs code', 'visual studio code']):
-                    logger.info(f"⚙️ Executing task: Open VS Code")
-                    logger.info(f"🚀 Launching: code")
-                    self.launch_app('code')
-                    response = "Opening VS Code for you, Arjun."
-                    opened = True
-                    
-            if not opened:
+            # Same app resolution as the brain and the LiveKit tools
+            match = get_app_resolver().resolve(text)
+            if match:
+                logger.info(f"⚙️ Executing task: Open {match.name} (heard '{match.alias}')")
+                controller = get_system_controller()
+                if match.kind == 'website':
+                    opened, _ = controller.open_url(match.target)
+                else:
+                    opened, _ = controller.open_application(match.name)
+                if opened:
+                    response = f"Opening {match.name.title()} for you, Arjun."
+                else:
+                    response = f"Sorry Arjun, I couldn't open {match.name.title()}."
+            else:
                 response = "What would you like me to open, Arjun?"
         
         # Intent: Search
@@ -683,19 +675,6 @@ class JarvisHUD:
         
         return response
     
-    def process_messages(self):
-        """Process message queue"""
-        try:
-            while not self.message_queue.empty():
-                msg = self.message_queue.get_nowait()
-                
-                if msg['type'] == 'status':
-                    self.set_status(msg['status'])
-        except:
-            pass
-        
-        self.root.after(100, self.process_messages)
-    
     def run(self):
         """Start the HUD"""
         logger.info("🚀 JARVIS HUD Starting...")
@@ -11,6 +11,16 @@ import logging
 from datetime import datetime
 from typing import List, Dict
 from config import GUI_CONFIG, USER_NAME
+from hud_render import AnimationScheduler, FrameMeter
+from ui_bus import UIEventBus, StatusChanged, ChatMessage, ContinueButton
+from chat_view import ChatTranscript
+from startup import resolve
+from tracing import get_tracer
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +35,10 @@ class JarvisAdvancedGUI:
         """
         Initialize advanced GUI
         
+        Each subsystem may be the object itself or a startup.Subsystem
+        handle that is still being built; the listening thread waits for
+        them, so the window can appear before they are ready.
+        
         Args:
             voice_system: JarvisVoiceSystem instance
             brain: JarvisBrain instance
@@ -44,6 +58,8 @@ class JarvisAdvancedGUI:
         # Animation state
         self.rotation = 0
         self.pulse_phase = 0
+        # Filled in place from the voice system's mic level meter once it's ready
+        self.level_meter = None
         self.waveform_data = [0] * GUI_CONFIG['waveform_bars']
         
         # Create main window
@@ -60,8 +76,15 @@ class JarvisAdvancedGUI:
         y = (screen_height - 900) // 2
         self.root.geometry(f"1400x900+{x}+{y}")
         
+        # All widget updates go through the UI bus (drained on the main thread)
+        self.ui = UIEventBus(self.root)
+        self.ui.subscribe(StatusChanged, self._apply_status)
+        self.ui.subscribe(ChatMessage, self._apply_chat_message)
+        self.ui.subscribe(ContinueButton, self._apply_continue_button)
+        
         # Setup UI
         self.setup_ui()
+        self.ui.start()
         
         # Start systems
         self.start_listening_thread()
@@ -114,6 +137,9 @@ class JarvisAdvancedGUI:
         self.center_x = 250
         self.center_y = 400
         
+        # Animated items are created once and updated every frame
+        self.create_animated_items()
+        
         # Status display
         status_frame = ctk.CTkFrame(parent, fg_color='transparent')
         status_frame.place(x=50, y=50)
@@ -196,6 +222,13 @@ class JarvisAdvancedGUI:
         )
         self.chat_display.pack(fill='both', expand=True, padx=10, pady=10)
         
+        # Bounded transcript: keeps max_chat_messages in the widget, pages older ones in on scroll
+        self.chat_transcript = ChatTranscript(
+            self.chat_display,
+            max_messages=GUI_CONFIG['max_chat_messages'],
+            history_limit=GUI_CONFIG['chat_history_limit']
+        )
+        
         # Control buttons frame
         controls_frame = ctk.CTkFrame(parent, fg_color='transparent', height=50)
         controls_frame.pack(fill='x', padx=10, pady=(0, 10))
@@ -214,15 +247,20 @@ class JarvisAdvancedGUI:
         self.add_chat_message("SYSTEM", "Speak naturally - I'm always listening.", "system")
     
     def show_continue_button(self):
-        """Show Continue Explanation button"""
-        if not self.continue_btn_visible:
+        """Show Continue Explanation button (any thread)"""
+        self.ui.publish(ContinueButton(True))
+    
+    def hide_continue_button(self):
+        """Hide Continue Explanation button (any thread)"""
+        self.ui.publish(ContinueButton(False))
+    
+    def _apply_continue_button(self, event: ContinueButton):
+        """Main thread: pack or hide the Continue button"""
+        if event.visible and not self.continue_btn_visible:
             self.continue_btn.pack(side='right', padx=20)
             self.continue_btn_visible = True
             logger.info("✅ Continue button shown")
-    
-    def hide_continue_button(self):
-        """Hide Continue Explanation button"""
-        if self.continue_btn_visible:
+        elif not event.visible and self.continue_btn_visible:
             self.continue_btn.pack_forget()
             self.continue_btn_visible = False
             logger.info("✅ Continue button hidden")
@@ -248,9 +286,56 @@ class JarvisAdvancedGUI:
         else:
             logger.warning("⚠️ No pending explanation to continue")
     
+    def create_animated_items(self):
+        """Create visualizer canvas items once - draw_animations() only updates them"""
+        rings = [
+            (120, GUI_CONFIG['primary_color'], 2),
+            (150, GUI_CONFIG['secondary_color'], 2),
+            (180, GUI_CONFIG['primary_color'], 1),
+        ]
+        
+        # Rings: full circle plus 6 rotating arcs each
+        self.ring_items = []
+        for radius, color, width in rings:
+            bbox = (
+                self.center_x - radius, self.center_y - radius,
+                self.center_x + radius, self.center_y + radius
+            )
+            oval = self.canvas.create_oval(*bbox, outline=color, width=width, tags='animated')
+            arcs = [
+                self.canvas.create_arc(
+                    *bbox, start=i * 60, extent=30, outline=color,
+                    width=width + 1, style='arc', tags='animated'
+                )
+                for i in range(6)
+            ]
+            self.ring_items.append({'oval': oval, 'arcs': arcs, 'color': color, 'current': None})
+        
+        # Waveform bars (hidden unless listening)
+        self.waveform_items = [
+            self.canvas.create_rectangle(
+                0, 0, 0, 0, fill=GUI_CONFIG['primary_color'], outline='',
+                state='hidden', tags='animated'
+            )
+            for _ in range(GUI_CONFIG['waveform_bars'])
+        ]
+        self.waveform_visible = False
+        
+        # Center core: 3 glow rings and the core circle
+        self.glow_items = [
+            self.canvas.create_oval(0, 0, 0, 0, width=2, tags='animated')
+            for _ in range(3)
+        ]
+        self.glow_colors = [None] * len(self.glow_items)
+        self.core_item = self.canvas.create_oval(0, 0, 0, 0, width=2, tags='animated')
+        self.core_color = None
+        
+        # Render cost per frame
+        self.frame_meter = FrameMeter(self.canvas, 50, 840, GUI_CONFIG['animation_fps'])
+    
     def draw_animations(self):
-        """Draw animated visualizer"""
-        self.canvas.delete('animated')
+        """Draw animated visualizer (one frame, driven by AnimationScheduler)"""
+        step = self.animation.step
         
         # Calculate pulse
         pulse = 0.7 + 0.3 * math.sin(self.pulse_phase)
@@ -261,53 +346,29 @@ class JarvisAdvancedGUI:
         # Draw waveform
         if self.status == "LISTENING":
             self.draw_waveform()
+        elif self.waveform_visible:
+            for bar in self.waveform_items:
+                self.canvas.itemconfig(bar, state='hidden')
+            self.waveform_visible = False
         
         # Draw center core
         self.draw_center_core(pulse)
         
         # Update rotation
-        self.rotation = (self.rotation + 1) % 360
-        self.pulse_phase += 0.05
-        
-        # Schedule next frame
-        self.root.after(16, self.draw_animations)  # ~60 FPS
+        self.rotation = (self.rotation + step) % 360
+        self.pulse_phase += 0.05 * step
     
     def draw_rotating_rings(self, pulse):
-        """Draw animated rotating rings"""
-        rings = [
-            (120, GUI_CONFIG['primary_color'], 2),
-            (150, GUI_CONFIG['secondary_color'], 2),
-            (180, GUI_CONFIG['primary_color'], 1),
-        ]
-        
-        for radius, color, width in rings:
-            # Full circle
-            x1 = self.center_x - radius
-            y1 = self.center_y - radius
-            x2 = self.center_x + radius
-            y2 = self.center_y + radius
-            
-            opacity_color = self._adjust_color_opacity(color, pulse * 0.5)
-            
-            self.canvas.create_oval(
-                x1, y1, x2, y2,
-                outline=opacity_color,
-                width=width,
-                tags='animated'
-            )
+        """Rotate ring arcs"""
+        for ring in self.ring_items:
+            opacity_color = self._adjust_color_opacity(ring['color'], pulse * 0.5)
+            if opacity_color != ring['current']:
+                ring['current'] = opacity_color
+                self.canvas.itemconfig(ring['oval'], outline=opacity_color)
             
             # Rotating arcs
-            for i in range(6):
-                angle = (self.rotation + i * 60) % 360
-                self.canvas.create_arc(
-                    x1, y1, x2, y2,
-                    start=angle,
-                    extent=30,
-                    outline=color,
-                    width=width + 1,
-                    style='arc',
-                    tags='animated'
-                )
+            for i, arc in enumerate(ring['arcs']):
+                self.canvas.itemconfig(arc, start=(self.rotation + i * 60) % 360)
     
     def draw_center_core(self, pulse):
         """Draw pulsing center core"""
@@ -325,39 +386,38 @@ class JarvisAdvancedGUI:
         color = status_colors.get(self.status, GUI_CONFIG['primary_color'])
         
         # Outer glow
-        for i in range(3):
+        for i, glow in enumerate(self.glow_items):
             glow_radius = radius + (i * 10)
-            opacity = (3 - i) * 0.15 * pulse
-            glow_color = self._adjust_color_opacity(color, opacity)
-            
-            self.canvas.create_oval(
+            self.canvas.coords(
+                glow,
                 self.center_x - glow_radius,
                 self.center_y - glow_radius,
                 self.center_x + glow_radius,
-                self.center_y + glow_radius,
-                outline=glow_color,
-                width=2,
-                tags='animated'
+                self.center_y + glow_radius
             )
+            opacity = (3 - i) * 0.15 * pulse
+            glow_color = self._adjust_color_opacity(color, opacity)
+            if glow_color != self.glow_colors[i]:
+                self.glow_colors[i] = glow_color
+                self.canvas.itemconfig(glow, outline=glow_color)
         
         # Core circle
-        self.canvas.create_oval(
+        self.canvas.coords(
+            self.core_item,
             self.center_x - radius,
             self.center_y - radius,
             self.center_x + radius,
-            self.center_y + radius,
-            fill=color,
-            outline=color,
-            width=2,
-            tags='animated'
+            self.center_y + radius
         )
+        if color != self.core_color:
+            self.core_color = color
+            self.canvas.itemconfig(self.core_item, fill=color, outline=color)
     
     def draw_waveform(self):
-        """Draw audio waveform visualization"""
-        import random
-        
-        # Simulate audio levels (in real app, get from mic)
-        self.waveform_data = [random.uniform(0.3, 1.0) for _ in range(GUI_CONFIG['waveform_bars'])]
+        """Draw audio waveform visualization from live mic levels"""
+        # Lock-free copy into the preallocated array (never blocks on audio)
+        if self.level_meter:
+            self.level_meter.levels.read_into(self.waveform_data)
         
         bar_width = 6
         spacing = 8
@@ -365,17 +425,14 @@ class JarvisAdvancedGUI:
         start_x = self.center_x - (total_width // 2)
         base_y = self.center_y + 250
         
-        for i, level in enumerate(self.waveform_data):
+        for i, (bar, level) in enumerate(zip(self.waveform_items, self.waveform_data)):
             x = start_x + (i * spacing)
-            height = level * 80
+            height = max(level * 80, 2)  # keep a baseline visible in silence
             
-            self.canvas.create_rectangle(
-                x, base_y - height,
-                x + bar_width, base_y,
-                fill=GUI_CONFIG['primary_color'],
-                outline='',
-                tags='animated'
-            )
+            self.canvas.coords(bar, x, base_y - height, x + bar_width, base_y)
+            if not self.waveform_visible:
+                self.canvas.itemconfig(bar, state='normal')
+        self.waveform_visible = True
     
     def _adjust_color_opacity(self, color: str, opacity: float) -> str:
         """Adjust color opacity (simplified)"""
@@ -383,18 +440,26 @@ class JarvisAdvancedGUI:
         return color
     
     def set_status(self, status: str):
-        """Update system status"""
-        self.status = status
+        """Update system status (any thread)"""
+        self.ui.publish(StatusChanged(status))
+    
+    def _apply_status(self, event: StatusChanged):
+        """Main thread: show the latest status"""
+        self.status = event.status
         
-        status_text = f"● {status}"
+        status_text = f"● {event.status}"
         self.status_label.configure(text=status_text)
         
-        logger.info(f"📊 Status: {status}")
+        logger.info(f"📊 Status: {event.status}")
     
     def add_chat_message(self, sender: str, message: str, msg_type: str = "user", check_length: bool = True):
         """
         Add message to chat display with automatic splitting for long explanations
         
+        Safe to call from any thread - the split decision (and the paused
+        explanation state the listening loop reads) happens immediately,
+        the widget update is delivered through the UI bus.
+        
         Args:
             sender: Message sender name
             message: Message text
@@ -426,7 +491,7 @@ class JarvisAdvancedGUI:
                     continuation = ' '.join(words[split_point:])
                 
                 # Display first part
-                self._add_message_to_chat(sender, first_part, msg_type)
+                self.ui.publish(ChatMessage(sender, first_part, msg_type))
                 
                 # Store continuation and show button
                 self.pending_explanation = continuation
@@ -436,35 +501,46 @@ class JarvisAdvancedGUI:
                 return
         
         # Normal message - add directly
-        self._add_message_to_chat(sender, message, msg_type)
+        self.ui.publish(ChatMessage(sender, message, msg_type))
+    
+    def _apply_chat_message(self, event: ChatMessage):
+        """Main thread: append a chat message"""
+        self._add_message_to_chat(event.sender, event.message, event.msg_type)
     
     def _add_message_to_chat(self, sender: str, message: str, msg_type: str):
-        """Internal method to add message to chat without length check"""
-        self.chat_display.configure(state='normal')
-        
-        timestamp = datetime.now().strftime('%H:%M')
-        
-        # Color based on type
-        colors = {
-            'user': '#00e5ff',
-            'assistant': '#00ff88',
-            'system': '#ffaa00'
-        }
-        color = colors.get(msg_type, '#ffffff')
-        
-        # Format message
-        formatted = f"\n[{timestamp}] {sender}:\n{message}\n"
-        
-        self.chat_display.insert('end', formatted)
-        self.chat_display.see('end')
-        self.chat_display.configure(state='disabled')
+        """Internal method to add message to chat without length check (main thread)"""
+        self.chat_transcript.add_message(sender, message, msg_type)
+    
+    def _attach_level_meter(self):
+        """Drive the waveform from the voice system's mic level meter"""
+        meter = getattr(self.voice, 'level_meter', None)
+        if meter is not None and meter.available:
+            # Buffer first - draw_waveform checks level_meter before reading it
+            self.waveform_data = np.zeros(meter.bands, dtype=np.float32)
+            self.level_meter = meter
     
     def start_listening_thread(self):
         """Start continuous listening in background"""
         def listening_loop():
+            # Subsystems may still be starting in the background
+            self.set_status("STARTING")
+            try:
+                self.voice = resolve(self.voice)
+                self.brain = resolve(self.brain)
+                self.tasks = resolve(self.tasks)
+                self.memory = resolve(self.memory)
+            except Exception as e:
+                logger.error(f"❌ {e}")
+                self.add_chat_message("SYSTEM", f"Startup failed: {e}", "system")
+                self.set_status("OFFLINE")
+                return
+            self._attach_level_meter()
+            
             logger.info("🎤 Continuous listening started")
             
             while self.is_running:
+                # One trace per turn (dropped when nothing was heard)
+                turn = get_tracer().start_span("turn")
                 try:
                     # Set listening status
                     self.set_status("LISTENING")
@@ -486,6 +562,7 @@ class JarvisAdvancedGUI:
                         self.set_status("THINKING")
                         logger.info("🧠 Sending to Brain for processing...")
                         result = self.brain.process_input(text, lang)
+                        turn.set(text=text, language=lang, intent=result['intent'], action=result['action'])
                         
                         logger.info(f"🎯 DETECTED INTENT: {result['intent']}")
                         logger.info(f"⚙️ ACTION: {result['action']}")
@@ -548,13 +625,21 @@ class JarvisAdvancedGUI:
                         
                         # Check for exit
                         if result.get('action') == 'exit':
+                            turn.end()
                             self.is_running = False
                             break
+                        
+                        turn.end()
+                        for trace in get_tracer().recent(1):
+                            logger.info(get_tracer().summarize(trace))
+                    else:
+                        turn.drop()
                     
                     # Return to standby
                     self.set_status("STANDBY")
                     
                 except Exception as e:
+                    turn.end(error=e)
                     logger.error(f"❌ Listening error: {e}")
                     import traceback
                     traceback.print_exc()
@@ -563,8 +648,12 @@ class JarvisAdvancedGUI:
         thread.start()
     
     def start_animations(self):
-        """Start animation loop"""
-        self.root.after(100, self.draw_animations)
+        """Start animation loop (frame rate follows self.status)"""
+        self.animation = AnimationScheduler(
+            self.root, self.draw_animations, lambda: self.status,
+            max_fps=GUI_CONFIG['animation_fps'], meter=self.frame_meter
+        )
+        self.animation.start(delay_ms=100)
     
     def run(self):
         """Start GUI main loop"""
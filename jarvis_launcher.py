@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 from dotenv import load_dotenv
 
+from startup import find_missing
+
 # Load environment variables
 load_dotenv()
 
@@ -31,12 +33,8 @@ def check_dependencies():
         'deep_translator': 'deep-translator'
     }
     
-    missing = []
-    for package, name in required_packages.items():
-        try:
-            __import__(package)
-        except ImportError:
-            missing.append(name)
+    # find_spec only locates packages - nothing heavy is imported here
+    missing = find_missing(required_packages)
     
     if missing:
         logger.error(f"❌ Missing packages: {', '.join(missing)}")
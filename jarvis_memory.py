@@ -1,36 +1,66 @@
 """
 JARVIS Memory Module - Conversation History and Context Management
 """
+import json
 import logging
+import os
 from datetime import datetime
 from collections import deque
 from typing import List, Dict, Optional
 
+from config import MEMORY_CONFIG
+from conversation_summary import RollingSummarizer
+
 logger = logging.getLogger(__name__)
 
 
 class ConversationMemory:
     """Manages conversation history and context for JARVIS"""
     
-    def __init__(self, max_memory: int = 10):
+    def __init__(self, max_memory: int = 10, path: Optional[str] = None,
+                 summarizer: Optional[RollingSummarizer] = None):
         """
         Initialize conversation memory
         
         Args:
             max_memory: Maximum number of conversation exchanges to remember
+            path: JSON file the history and summary are saved to after every
+                turn and restored from (None = not persisted)
+            summarizer: Keeps a running summary of messages that no longer fit
+                (default: local summary with the MEMORY_CONFIG limits)
         """
         self.max_memory = max_memory
         self.conversation_history = deque(maxlen=max_memory)
+        self.path = path
+        self.summarizer = summarizer or RollingSummarizer(
+            max_chars=MEMORY_CONFIG['summary_chars'],
+            batch_messages=MEMORY_CONFIG['summary_batch'],
+        )
         self.session_start = datetime.now()
         self.total_interactions = 0
         
+        # Incremental readers (e.g. the knowledge engine) remember how many
+        # messages they have seen and ask only for the newer ones
+        self.message_count = 0      # Messages ever added (never decreases)
+        self.history_version = 0    # Bumped when the history is cleared
+        
         # Context tracking for educational conversations
         self.last_topic = None
         self.last_intent = None
         self.last_language = 'en'
         
+        if path:
+            self.load()
+        
         logger.info(f"✅ Conversation memory initialized (capacity: {max_memory})")
     
+    def _append(self, message: Dict):
+        """Add a message, folding the one that no longer fits into the summary"""
+        if len(self.conversation_history) == self.max_memory:
+            self.summarizer.add([self.conversation_history[0]])
+        self.conversation_history.append(message)
+        self.message_count += 1
+    
     def add_user_message(self, text: str, language: str = 'en', intent: Optional[str] = None, topic: Optional[str] = None):
         """Add user message to history with context"""
         message = {
@@ -41,7 +71,7 @@ class ConversationMemory:
             'topic': topic,
             'timestamp': datetime.now().isoformat()
         }
-        self.conversation_history.append(message)
+        self._append(message)
         self.total_interactions += 1
         
         # Update context tracking
@@ -63,8 +93,12 @@ class ConversationMemory:
             'intent': intent,
             'timestamp': datetime.now().isoformat()
         }
-        self.conversation_history.append(message)
+        self._append(message)
         logger.info(f"💬 Assistant message added: '{text[:50]}...'")
+        
+        # End of a turn - keep the saved copy current
+        if self.path:
+            self.save()
     
     def get_conversation_history(self, last_n: Optional[int] = None) -> List[Dict]:
         """
@@ -96,6 +130,25 @@ class ConversationMemory:
             })
         return context
     
+    def get_messages_since(self, count: int) -> List[Dict]:
+        """
+        Get messages added after the first `count` messages
+        
+        Args:
+            count: A previous value of message_count
+            
+        Returns:
+            Newer messages, oldest first (ones already dropped from memory are skipped)
+        """
+        new = self.message_count - count
+        if new <= 0:
+            return []
+        return list(self.conversation_history)[-new:]
+    
+    def get_summary(self) -> str:
+        """Running summary of the conversation before the remembered messages ('' if none)"""
+        return self.summarizer.text()
+    
     def get_last_topic(self) -> Optional[str]:
         """Get the last discussed topic"""
         return self.last_topic
@@ -125,8 +178,53 @@ class ConversationMemory:
     def clear_history(self):
         """Clear conversation history"""
         self.conversation_history.clear()
+        self.summarizer.clear()
+        self.history_version += 1
+        if self.path:
+            self.save()
         logger.info("🗑️ Conversation history cleared")
     
+    def save(self):
+        """Write the history and summary to self.path (atomically)"""
+        state = {
+            'version': 1,
+            'messages': list(self.conversation_history),
+            'summary': self.summarizer.to_dict(),
+            'last_topic': self.last_topic,
+            'last_intent': self.last_intent,
+            'last_language': self.last_language,
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"❌ Failed to save conversation history: {e}")
+    
+    def load(self):
+        """Restore the history and summary saved by save(), if any"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            logger.error(f"❌ Failed to load conversation history: {e}")
+            return
+        
+        messages = state.get('messages', [])
+        # Anything beyond this session's capacity goes into the summary
+        overflow = max(0, len(messages) - self.max_memory)
+        self.summarizer.load(state.get('summary', {}))
+        self.summarizer.add(messages[:overflow])
+        self.conversation_history.extend(messages[overflow:])
+        self.message_count = len(self.conversation_history)
+        self.last_topic = state.get('last_topic')
+        self.last_intent = state.get('last_intent')
+        self.last_language = state.get('last_language', 'en')
+        logger.info(f"📂 Restored {len(self.conversation_history)} messages from {self.path}")
+    
     def get_statistics(self) -> Dict:
         """Get conversation statistics"""
         return {
@@ -7,10 +7,16 @@ import logging
 import webbrowser
 import subprocess
 import time
-import pyautogui
 from datetime import datetime
 from typing import Dict, Optional
 from config import APPS, WEBSITES, FOOD_SERVICES
+from app_resolver import get_app_resolver
+from tracing import traced
+
+try:
+    import pyautogui
+except Exception:
+    pyautogui = None  # needs a display; only typing/key presses use it
 
 # Import cross-platform system controller
 try:
@@ -66,6 +72,7 @@ class JarvisTasks:
             self.automation = None
             self.content_extractor = None
     
+    @traced("tasks")
     def execute_task(self, intent_result: Dict) -> str:
         """
         Execute task based on intent with entity-aware processing
@@ -81,11 +88,9 @@ class JarvisTasks:
         entities = intent_result.get('entities', {})
         query = parameters.get('query', '')
         
-        logger.info(f"\n{'='*60}")
-        logger.info(f"⚙️ TASK EXECUTOR")
-        logger.info(f"🎯 ACTION: {action}")
-        logger.info(f"🏷️ ENTITIES: {entities}")
-        logger.info(f"{'='*60}")
+        logger.debug("\n" + "=" * 60)
+        logger.info("⚙️ TASK EXECUTOR - ACTION: %s", action)
+        logger.debug("🏷️ ENTITIES: %s", entities)
         
         try:
             if action == 'change_language':
@@ -129,7 +134,7 @@ class JarvisTasks:
             return None
         
         finally:
-            logger.info(f"{'='*60}\n")
+            logger.debug("=" * 60)
     
     def change_language(self, entities: Dict = None) -> str:
         """
@@ -190,17 +195,24 @@ class JarvisTasks:
         query_lower = query.lower()
         logger.info(f"🔍 Searching for app in query: '{query_lower}'")
         
-        # Extract app name from query
-        app_to_open = None
-        for app_name in APPS.keys():
-            if app_name in query_lower:
-                app_to_open = app_name
-                break
+        # Resolve app name from query (shared with the brain and window tools)
+        match = get_app_resolver().resolve(query_lower)
         
-        if not app_to_open:
+        if not match:
             logger.warning(f"⚠️ NO APP FOUND in query: '{query}'")
             return "Which application would you like me to open?"
         
+        app_to_open = match.name
+        logger.info(f"🎯 Resolved '{match.alias}' → {app_to_open} (score: {match.score})")
+        
+        # Websites (e.g. "open github") open in the browser
+        if match.kind == 'website':
+            if self.system_controller:
+                success, message = self.system_controller.open_url(match.target)
+                return None if success else message
+            webbrowser.open(match.target)
+            return None
+        
         # Use cross-platform system controller if available
         if self.system_controller:
             logger.info(f"🚀 Using cross-platform system controller for: {app_to_open}")
@@ -398,6 +410,8 @@ class JarvisTasks:
         Returns:
             Confirmation
         """
+        if pyautogui is None:
+            return "Keyboard control not available (pyautogui not installed)"
         logger.info(f"⌨️ Typing: {text}")
         time.sleep(1)  # Wait for focus
         pyautogui.write(text, interval=0.05)
@@ -413,6 +427,8 @@ class JarvisTasks:
         Returns:
             Confirmation
         """
+        if pyautogui is None:
+            return "Keyboard control not available (pyautogui not installed)"
         logger.info(f"⌨️ Pressing: {key}")
         pyautogui.press(key)
         return f"Pressed {key}"
@@ -10,6 +10,8 @@ from typing import Tuple, Optional
 from deep_translator import GoogleTranslator
 from langdetect import detect
 from config import VOICE_CONFIG, USER_LANGUAGE
+from audio_meter import LevelMeter, MeteredStream
+from tracing import get_tracer, traced
 
 logger = logging.getLogger(__name__)
 
@@ -17,10 +19,20 @@ logger = logging.getLogger(__name__)
 class JarvisVoiceSystem:
     """Advanced voice input/output system for JARVIS"""
     
-    def __init__(self):
-        """Initialize speech recognition and TTS with improved sensitivity"""
-        self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+    def __init__(self, recognizer=None, microphone=None, tts_engine=None, translator_factory=None):
+        """
+        Initialize speech recognition and TTS with improved sensitivity
+        
+        Args:
+            recognizer: Speech recognizer (default sr.Recognizer)
+            microphone: Audio source (default sr.Microphone)
+            tts_engine: pyttsx3-style engine with say()/runAndWait() (forces offline TTS)
+            translator_factory: Called as factory(source=, target=) -> translator
+                                (default GoogleTranslator)
+        """
+        self.recognizer = recognizer or sr.Recognizer()
+        self.microphone = microphone or sr.Microphone()
+        self.translator_factory = translator_factory or GoogleTranslator
         
         # Configure recognizer with LOWER threshold for better sensitivity
         # Lower energy threshold = more sensitive to quiet speech
@@ -30,9 +42,18 @@ class JarvisVoiceSystem:
         self.recognizer.dynamic_energy_ratio = 1.5
         self.recognizer.pause_threshold = VOICE_CONFIG['pause_threshold']
         
+        # Live mic levels (waveform visualizer, VAD, noise floor)
+        self.level_meter = LevelMeter(
+            bands=VOICE_CONFIG['meter_bands'],
+            sample_rate=self.microphone.SAMPLE_RATE,
+            sample_width=self.microphone.SAMPLE_WIDTH
+        )
+        
         # Initialize TTS
-        self.use_online_tts = VOICE_CONFIG['use_online_tts']
-        if not self.use_online_tts:
+        self.use_online_tts = VOICE_CONFIG['use_online_tts'] and tts_engine is None
+        if tts_engine is not None:
+            self.tts_engine = tts_engine
+        elif not self.use_online_tts:
             self._init_offline_tts()
         
         # Output language (Hindi by default)
@@ -69,6 +90,7 @@ class JarvisVoiceSystem:
             logger.error(f"❌ TTS initialization failed: {e}")
             self.tts_engine = None
     
+    @traced("listen")
     def listen(self, timeout: int = 10) -> Tuple[Optional[str], Optional[str]]:
         """
         Listen to microphone and convert speech to text with improved error handling
@@ -83,18 +105,24 @@ class JarvisVoiceSystem:
             with self.microphone as source:
                 logger.info("🎤 Listening for FULL sentence...")
                 
+                # Meter the recognizer's own reads - no second stream
+                if self.level_meter.available:
+                    source.stream = MeteredStream(source.stream, self.level_meter)
+                
                 # Ambient noise adjustment - 1 second for better calibration
                 logger.info("📊 Calibrating for ambient noise...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+                with get_tracer().span("calibrate"):
+                    self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
                 logger.info(f"🎚️ Energy threshold adjusted to: {self.recognizer.energy_threshold}")
                 
                 # Listen - capture full phrase
                 logger.info("🎙️ Recording speech...")
-                audio = self.recognizer.listen(
-                    source,
-                    timeout=timeout,
-                    phrase_time_limit=VOICE_CONFIG['phrase_timeout']
-                )
+                with get_tracer().span("record"):
+                    audio = self.recognizer.listen(
+                        source,
+                        timeout=timeout,
+                        phrase_time_limit=VOICE_CONFIG['phrase_timeout']
+                    )
                 
                 logger.info("🔄 Processing speech...")
                 
@@ -104,7 +132,8 @@ class JarvisVoiceSystem:
                 
                 # Try English (India) first
                 try:
-                    text = self.recognizer.recognize_google(audio, language='en-IN')
+                    with get_tracer().span("recognize", language='en-IN'):
+                        text = self.recognizer.recognize_google(audio, language='en-IN')
                     recognized_lang = 'en'
                     logger.info(f"✅ RECOGNIZED [en-IN]: '{text}'")
                 except sr.UnknownValueError:
@@ -117,7 +146,8 @@ class JarvisVoiceSystem:
                 # Try Hindi if English failed
                 if not text:
                     try:
-                        text = self.recognizer.recognize_google(audio, language='hi-IN')
+                        with get_tracer().span("recognize", language='hi-IN'):
+                            text = self.recognizer.recognize_google(audio, language='hi-IN')
                         recognized_lang = 'hi'
                         logger.info(f"✅ RECOGNIZED [hi-IN]: '{text}'")
                     except sr.UnknownValueError:
@@ -130,7 +160,8 @@ class JarvisVoiceSystem:
                 # Try English (US) as fallback
                 if not text:
                     try:
-                        text = self.recognizer.recognize_google(audio, language='en-US')
+                        with get_tracer().span("recognize", language='en-US'):
+                            text = self.recognizer.recognize_google(audio, language='en-US')
                         recognized_lang = 'en'
                         logger.info(f"✅ RECOGNIZED [en-US]: '{text}'")
                     except sr.UnknownValueError:
@@ -164,7 +195,10 @@ class JarvisVoiceSystem:
             import traceback
             traceback.print_exc()
             return None, None
+        finally:
+            self.level_meter.reset()
     
+    @traced("speak")
     def speak(self, text: str, language: Optional[str] = None, async_mode: bool = False):
         """
         Speak text with natural voice
@@ -251,6 +285,7 @@ class JarvisVoiceSystem:
         except Exception as e:
             logger.error(f"❌ Offline TTS failed: {e}")
     
+    @traced("translate")
     def translate_text(self, text: str, target_lang: str) -> str:
         """
         Translate text to target language
@@ -266,7 +301,7 @@ class JarvisVoiceSystem:
             return text
         
         try:
-            translator = GoogleTranslator(source='auto', target=target_lang)
+            translator = self.translator_factory(source='auto', target=target_lang)
             translated = translator.translate(text)
             logger.info(f"🌐 Translated to {target_lang}: {translated}")
             return translated
@@ -3,8 +3,8 @@ import subprocess
 import logging
 import sys
 import asyncio
+import re
 import webbrowser
-from fuzzywuzzy import process
 
 try:
     from livekit.agents import function_tool
@@ -19,17 +19,15 @@ except ImportError:
     win32gui = None
     win32con = None
 
-try:
-    import pygetwindow as gw
-except ImportError:
-    gw = None
-
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
 from keyboard_mouse_CTRL import type_text_tool
+from app_resolver import app_phrase, get_app_resolver
+from system_controller import get_system_controller
+from window_tracker import get_window_tracker
 
 # ===================== LOGGER ===================== #
 sys.stdout.reconfigure(encoding="utf-8")
@@ -37,36 +35,13 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("JARVIS-WINDOW")
 
 # ===================== APP MAP ===================== #
-APP_MAPPINGS = {
-    # English
-    "notepad": "notepad",
-    "calculator": "calc",
-    "calc": "calc",
-    "chrome": "chrome",
-    "google chrome": "chrome",
-    "vlc": "vlc",
-    "cmd": "cmd",
-    "command prompt": "cmd",
-    "paint": "mspaint",
-
-        # URLs
-    "youtube": "https://www.youtube.com",
-    "whatsapp": "whatsapp://", # Changed to desktop app URI
-
-    # Hindi
-    "युटुब": "https://www.youtube.com",
-    "यूट्यूब": "https://www.youtube.com",
-    "व्हाट्सएप": "whatsapp://", # Changed to desktop app URI
-    "क्रोम": "chrome",
-    "गूगल क्रोम": "chrome",
-    "कैलकुलेटर": "calc",
-    "नोटपैड": "notepad",
-    "पेंट": "mspaint",
-}
+# Hindi/English app aliases live in config.APP_ALIASES and are resolved by
+# app_resolver, so the GUI, the brain and this tool all agree on the app.
+WHATSAPP_URI = "whatsapp://"  # Desktop app URI
 
 FOCUS_TITLES = {
     "notepad": "Notepad",
-    "calc": "Calculator",
+    "calculator": "Calculator",
     "chrome": "Google Chrome",
     "vlc": "VLC",
     "cmd": "Command Prompt",
@@ -75,87 +50,71 @@ FOCUS_TITLES = {
 }
 
 # ===================== UTIL ===================== #
-def normalize_command(text: str) -> str:
-    """
-    Removes Hindi/English open keywords safely and extracts the app name
-    """
-    REMOVE_WORDS = [
-        "open", "opening", "opened",
-        "खोलो", "खोल", "ओपन", "ओपनिंग", "करो",
-        "और", "उसमें", "लिख", "दो", "हेलो", "जार्विस", "व्हाट", "आर", "यू", "डूइंग"
-    ]
-    text = text.lower()
-    for w in REMOVE_WORDS:
-        text = text.replace(w, "")
-    # Take the first meaningful word
-    words = text.strip().split()
-    if words:
-        return words[0]
-    return text.strip()
-
-async def focus_window(title: str):
-    if not gw:
-        return False
-    await asyncio.sleep(1.2)
-    for w in gw.getAllWindows():
-        if title.lower() in w.title.lower():
-            if w.isMinimized:
-                w.restore()
-            w.activate()
-            return True
-    return False
-
-def fuzzy_match_app(app_name: str) -> str:
-    keys = list(APP_MAPPINGS.keys())
-    match, score = process.extractOne(app_name, keys)
-    if score >= 70:
-        return match
-    return app_name
+async def focus_window(title: str, timeout: float = 10.0):
+    # Focuses the moment the window shows up; slow apps get up to `timeout`
+    return await get_window_tracker().focus(title, timeout)
+
+async def start_menu_search(name: str):
+    # 🪟 Start Menu search (non-blocking)
+    if not pyautogui:
+        return
+    try:
+        await asyncio.to_thread(pyautogui.press, "win")
+        await asyncio.sleep(0.5)
+        await asyncio.to_thread(pyautogui.write, name, 0.05)
+        await asyncio.sleep(0.4)
+        await asyncio.to_thread(pyautogui.press, "enter")
+    except Exception:
+        pass
 
 # ===================== OPEN APP ===================== #
 @function_tool
 async def open(full_command: str) -> str:
     try:
-        clean = normalize_command(full_command)
-        matched_key = fuzzy_match_app(clean)
-        app = APP_MAPPINGS.get(matched_key, matched_key)
-
-        logger.info(f"OPEN → raw='{full_command}' clean='{clean}' match='{matched_key}'")
+        match = get_app_resolver().resolve(full_command)
+        if match:
+            matched_key = match.name
+            logger.info(f"OPEN → raw='{full_command}' alias='{match.alias}' match='{matched_key}' "
+                        f"(score: {match.score})")
+        else:
+            # Not in the app table (zoom, obs, teams, settings...) - use the
+            # spoken name as is
+            matched_key = app_phrase(re.split(r"write|लिख", full_command, 1, flags=re.IGNORECASE)[0])
+            if not matched_key:
+                return f"❌ कौन सा app खोलना है, समझ नहीं आया: {full_command}"
+            logger.info(f"OPEN → raw='{full_command}' clean='{matched_key}' (no app table match)")
+
+        if not match:
+            # 🪟 Let Windows find it: Start Menu search, then the shell
+            await start_menu_search(matched_key)
+            # 🧨 FINAL fallback (NO TIMEOUT)
+            subprocess.Popen(matched_key, shell=True)
 
         # 🌐 URL → browser or desktop app
-        if app.startswith("http"):
-            webbrowser.open(app)
-            await asyncio.sleep(3)  # Wait for browser to open
-            if "youtube" in matched_key.lower():
-                await focus_window("YouTube")
-            elif "whatsapp" in matched_key.lower():
-                # For web WhatsApp, ensure focus
-                await focus_window("WhatsApp")
-        elif app.startswith("whatsapp://"):
+        elif match.kind == "website":
+            webbrowser.open(match.target)
+            title = FOCUS_TITLES.get(matched_key)
+            if title:
+                await focus_window(title)
+        elif matched_key == "whatsapp":
             try:
                 # Try to open desktop app via URI scheme
-                subprocess.Popen([app], shell=True) # Use shell=True for URI schemes on Windows
-                await asyncio.sleep(5)  # Give time for app to open
+                subprocess.Popen([WHATSAPP_URI], shell=True) # Use shell=True for URI schemes on Windows
                 await focus_window("WhatsApp")
             except Exception as uri_e:
                 logger.warning(f"Failed to open WhatsApp desktop app via URI: {uri_e}. Falling back to web.")
                 webbrowser.open("https://web.whatsapp.com")
-                await asyncio.sleep(5)
                 await focus_window("WhatsApp")
         else:
-            # 🪟 Try Start Menu (non-blocking)
-            if pyautogui:
-                try:
-                    await asyncio.to_thread(pyautogui.press, "win")
-                    await asyncio.sleep(0.5)
-                    await asyncio.to_thread(pyautogui.write, matched_key, 0.05)
-                    await asyncio.sleep(0.4)
-                    await asyncio.to_thread(pyautogui.press, "enter")
-                except Exception:
-                    pass
-
-            # 🧨 FINAL fallback (NO TIMEOUT)
-            subprocess.Popen(app, shell=True)
+            # 🚀 Same launcher the brain and GUI use
+            success, message = await asyncio.to_thread(
+                get_system_controller().open_application, matched_key
+            )
+
+            # 🪟 Fallback: Start Menu search
+            if not success:
+                logger.warning(f"{message} - trying Start Menu")
+                await start_menu_search(matched_key)
 
             # 🎯 Focus
             title = FOCUS_TITLES.get(matched_key)
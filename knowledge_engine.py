@@ -4,11 +4,21 @@ Explains concepts like a human teacher using Gemini AI
 NO FALLBACKS - Always uses AI
 """
 import logging
-from typing import Optional
-import google.generativeai as genai
+from typing import Dict, List, Optional, Tuple
+
+from config import AI_CONFIG, MEMORY_CONFIG
+from tracing import traced
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
 
 logger = logging.getLogger(__name__)
 
+# Longest single message carried in the multi-turn context
+CONTEXT_MESSAGE_CHARS = 1500
+
 
 class KnowledgeEngine:
     """
@@ -16,13 +26,25 @@ class KnowledgeEngine:
     Always uses Gemini AI, no fallbacks
     """
     
-    def __init__(self, api_key: str, model_name: str = 'gemini-flash-latest'):
+    def __init__(self, api_key: str, model_name: str = 'gemini-flash-latest', model=None,
+                 memory=None, temperature: Optional[float] = None,
+                 max_tokens: Optional[int] = None, history_exchanges: Optional[int] = None,
+                 context_chars: Optional[int] = None, answer_cache=None):
         """
         Initialize knowledge engine with REQUIRED API key
         
         Args:
             api_key: Gemini API key (REQUIRED)
             model_name: Gemini model to use
+            model: Pre-built model object with generate_content() (skips Gemini setup)
+            memory: ConversationMemory to take multi-turn context from
+                (default: only the engine's own questions and answers)
+            temperature: Sampling temperature (default AI_CONFIG['temperature'])
+            max_tokens: Response length limit (default AI_CONFIG['max_tokens'])
+            history_exchanges: Exchanges of context to send (default AI_CONFIG['conversation_memory'])
+            context_chars: Most characters of recent messages to send (default MEMORY_CONFIG['context_chars']);
+                older turns only reach the model through the memory's running summary
+            answer_cache: AnswerCache for standalone questions (default: none)
         
         Raises:
             ValueError: If API key is missing
@@ -33,6 +55,25 @@ class KnowledgeEngine:
         self.api_key = api_key
         self.model_name = model_name
         self.last_topic = None  # For context memory
+        self.memory = memory
+        self.answer_cache = answer_cache
+        
+        self.generation_config = {
+            'temperature': AI_CONFIG['temperature'] if temperature is None else temperature,
+            'max_output_tokens': AI_CONFIG['max_tokens'] if max_tokens is None else max_tokens,
+        }
+        
+        # Multi-turn context as ready-to-send Content dicts, extended as
+        # messages arrive instead of rebuilt per request. It is trimmed by
+        # half at a time so consecutive requests share a long, unchanged
+        # prefix (which is what server-side prefix caching keys on).
+        self.max_history = 2 * (history_exchanges or AI_CONFIG['conversation_memory'])
+        self.max_context_chars = context_chars or MEMORY_CONFIG['context_chars']
+        self.history: List[Dict] = []
+        self._memory_cursor = 0
+        self._memory_version = memory.history_version if memory is not None else 0
+        self.requests = 0
+        self.last_request_chars = 0
         
         # Educational system prompt - human-like teacher
         self.system_prompt = """You are JARVIS, an advanced AI assistant and teacher.
@@ -52,16 +93,30 @@ Structure your responses like this:
 
 Be natural, helpful, and educational. Sound like a senior developer mentoring a junior, not a textbook."""
         
-        # Initialize Gemini
+        if model is not None:
+            self.model = model
+            return
+        
+        if genai is None:
+            raise ImportError("google-generativeai not installed. Run: pip install google-generativeai")
+        
+        # Initialize Gemini once - the system prompt and generation settings
+        # live on the model handle instead of being resent as prompt text
         try:
             genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.model_name)
-            logger.info(f"✅ Gemini AI ({self.model_name}) initialized for knowledge responses")
+            self.model = genai.GenerativeModel(
+                self.model_name,
+                system_instruction=self.system_prompt,
+                generation_config=self.generation_config,
+            )
+            logger.info(f"✅ Gemini AI ({self.model_name}) initialized for knowledge responses "
+                        f"(temperature {self.generation_config['temperature']}, "
+                        f"max {self.generation_config['max_output_tokens']} tokens)")
         except Exception as e:
             logger.error(f"❌ Gemini initialization failed: {e}")
             raise
     
-    def explain(self, question: str, context: Optional[str] = None) -> str:
+    def explain(self, question: str, context: Optional[str] = None, cacheable: bool = True) -> str:
         """
         Generate educational explanation using Gemini AI
         NO FALLBACKS - Always uses AI
@@ -69,10 +124,61 @@ Be natural, helpful, and educational. Sound like a senior developer mentoring a
         Args:
             question: User's question
             context: Optional context from previous conversation
+            cacheable: Whether the answer cache may serve/store this question
+                (False for prompts built around something else, e.g. chat replies)
             
         Returns:
             Human-like educational explanation from Gemini
+            (an error message if the request failed)
+        """
+        return self.explain_with_source(question, context, cacheable)[0]
+    
+    def explain_with_source(self, question: str, context: Optional[str] = None,
+                            cacheable: bool = True) -> Tuple[str, str]:
+        """
+        Same as explain(), also saying where the answer came from
+        
+        Returns:
+            (answer, source) - source is 'cache', 'model' or 'error'
+        """
+        if cacheable:
+            cached = self.cached_answer(question)
+            if cached is not None:
+                return cached, 'cache'
+        try:
+            return self.answer(question, context, cacheable), 'model'
+        except Exception as e:
+            logger.error(f"❌ AI generation failed: {e}")
+            # Return error message instead of fallback
+            return f"I encountered an error accessing my knowledge base: {str(e)}. Please try again.", 'error'
+    
+    def cached_answer(self, question: str) -> Optional[str]:
+        """
+        Answer from the answer cache, if any (follow-ups depend on the last topic - never cached)
+        
+        A hit counts as an answered question: the topic and history are
+        updated the same way answer() does, so a follow-up refers to it
+        """
+        if self.answer_cache is None or self._is_followup_question(question):
+            return None
+        cached = self.answer_cache.get(question)
+        if cached is not None:
+            if self.memory is None:
+                self._append_history('user', question)
+                self._append_history('model', cached)
+            self._update_context(question)
+        return cached
+    
+    @traced("knowledge.explain")
+    def answer(self, question: str, context: Optional[str] = None, cacheable: bool = True) -> str:
         """
+        Same as explain(), but errors are raised (for callers with their own fallback)
+        and the answer cache is not consulted (only filled)
+        
+        Raises:
+            Exception: Whatever the Gemini client raised
+        """
+        original_question = question
         logger.info(f"\n{'='*60}")
         logger.info(f"🧠 KNOWLEDGE ENGINE ACTIVATED")
         logger.info(f"❓ QUESTION: '{question}'")
@@ -83,28 +189,94 @@ Be natural, helpful, and educational. Sound like a senior developer mentoring a
             question = self._enhance_followup_question(question)
         
         # Generate AI response (NO FALLBACK)
-        try:
-            response = self._generate_ai_response(question)
-            logger.info(f"✅ AI RESPONSE GENERATED ({len(response)} chars)")
-            logger.info(f"{'='*60}\n")
-            
-            # Update context
-            self._update_context(question)
-            
-            return response
+        response = self._generate_ai_response(question)
+        logger.info(f"✅ AI RESPONSE GENERATED ({len(response)} chars)")
+        logger.info(f"{'='*60}\n")
         
-        except Exception as e:
-            logger.error(f"❌ AI generation failed: {e}")
-            # Return error message instead of fallback
-            return f"I encountered an error accessing my knowledge base: {str(e)}. Please try again."
+        # Update context
+        self._update_context(question)
+        
+        if cacheable and self.answer_cache is not None and not self._is_followup_question(original_question):
+            self.answer_cache.put(original_question, response)
+        
+        return response
     
+    @traced("gemini")
     def _generate_ai_response(self, question: str) -> str:
         """Generate response using Gemini AI"""
-        prompt = f"{self.system_prompt}\n\nQuestion: {question}\n\nExplain clearly:"
+        contents = self._build_contents(question)
+        self.requests += 1
+        self.last_request_chars = sum(len(part) for item in contents for part in item['parts'])
+        logger.debug("📤 Gemini request: %d context messages, %d chars",
+                     len(contents) - 1, self.last_request_chars)
         
-        response = self.model.generate_content(prompt)
+        response = self.model.generate_content(contents)
+        text = response.text.strip()
+        
+        if self.memory is None:
+            # No shared memory - remember the exchange ourselves
+            self._append_history('user', question)
+            self._append_history('model', text)
+        return text
+    
+    def generate_standalone(self, prompt: str) -> str:
+        """
+        One request without the conversation context, leaving history and
+        last_topic untouched (safe to call from a background thread)
+        
+        Raises:
+            Exception: Whatever the Gemini client raised
+        """
+        response = self.model.generate_content([{'role': 'user', 'parts': [prompt]}])
         return response.text.strip()
     
+    def _build_contents(self, question: str) -> List[Dict]:
+        """Context so far plus this question, as Gemini Content dicts"""
+        self._sync_history()
+        summary = self.memory.get_summary() if self.memory is not None else ''
+        if summary:
+            # Sent with the question rather than ahead of the history, so a
+            # changing summary doesn't break the shared prefix
+            question = f"(Earlier in this conversation:\n{summary})\n\n{question}"
+        history = self.history
+        if history and history[-1]['role'] == 'user':
+            # The brain already stored this turn's message - send the
+            # (possibly rewritten) question in its place
+            *head, last = history
+            return head + [{'role': 'user', 'parts': last['parts'][:-1] + [question]}]
+        return history + [{'role': 'user', 'parts': [question]}]
+    
+    def _sync_history(self):
+        """Append messages added to ConversationMemory since the last request"""
+        memory = self.memory
+        if memory is None:
+            return
+        if memory.history_version != self._memory_version:
+            self.history = []
+            self._memory_version = memory.history_version
+        for msg in memory.get_messages_since(self._memory_cursor):
+            self._append_history('model' if msg['role'] == 'assistant' else 'user', msg['content'])
+        self._memory_cursor = memory.message_count
+    
+    def _append_history(self, role: str, text: str):
+        """Add one message, merging consecutive messages from the same side"""
+        text = text[:CONTEXT_MESSAGE_CHARS]
+        if self.history and self.history[-1]['role'] == role:
+            self.history[-1]['parts'].append(text)
+        else:
+            self.history.append({'role': role, 'parts': [text]})
+        
+        while self.history and (len(self.history) > self.max_history
+                                or self._history_chars() > self.max_context_chars):
+            keep = min(len(self.history), self.max_history) // 2
+            del self.history[:len(self.history) - keep]
+            # Gemini expects the context to open with a user turn
+            while self.history and self.history[0]['role'] != 'user':
+                del self.history[0]
+    
+    def _history_chars(self) -> int:
+        return sum(len(part) for item in self.history for part in item['parts'])
+    
     def _is_followup_question(self, question: str) -> bool:
         """Check if question is a follow-up"""
         followup_patterns = [
@@ -143,4 +315,5 @@ Be natural, helpful, and educational. Sound like a senior developer mentoring a
     def clear_context(self):
         """Clear conversation context"""
         self.last_topic = None
+        self.history = []
         logger.info("🧹 Context cleared")
@@ -0,0 +1,132 @@
+"""
+JARVIS Logging Setup - Queued, Rotating Logs
+Loggers on the audio/UI/worker threads only enqueue records; a listener
+thread formats them and writes the rotating log file and the console.
+Per-module levels can be changed while JARVIS is running.
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, Union
+
+from config import LOGGING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread
+
+    The stock prepare() runs the full Formatter (timestamps, layout,
+    tracebacks) on the logging thread so records can be pickled. Records
+    here never leave the process, so only the message arguments are merged
+    (they may be mutated after the call returns).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(config: Optional[Dict] = None) -> QueueListener:
+    """
+    Route all logging through a queue to a rotating file and the console
+
+    Replaces any handlers already on the root logger. Safe to call twice.
+
+    Args:
+        config: Settings (default LOGGING_CONFIG)
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    config = config or LOGGING_CONFIG
+
+    formatter = logging.Formatter(config['format'])
+    handlers = []
+    if config.get('file'):
+        file_handler = RotatingFileHandler(
+            config['file'],
+            maxBytes=config.get('max_bytes', 0),
+            backupCount=config.get('backup_count', 0),
+            encoding='utf-8',
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    if config.get('console', True):
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(config.get('level', 'INFO'))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+    levels = dict(config.get('levels', {}))
+    levels.update(_parse_levels(os.getenv('JARVIS_LOG_LEVELS', '')))
+    for name, level in levels.items():
+        set_level(name, level)
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_level(name: str, level: Union[str, int]):
+    """
+    Change a module's log level at runtime
+
+    Records below the level are dropped by the logger before their
+    message is formatted, so quiet modules cost almost nothing.
+
+    Args:
+        name: Logger name (module name, '' for root)
+        level: 'DEBUG', 'INFO', ... or a logging level number
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            raise ValueError(f"Unknown log level for {name or 'root'}")
+    logging.getLogger(name or None).setLevel(level)
+    logger.info("📝 Log level %s -> %s", name or 'root', logging.getLevelName(level))
+
+
+def get_levels() -> Dict[str, str]:
+    """Explicitly set levels of every known logger"""
+    levels = {'root': logging.getLevelName(logging.getLogger().level)}
+    for name, item in logging.root.manager.loggerDict.items():
+        if isinstance(item, logging.Logger) and item.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(item.level)
+    return levels
+
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    """Parse 'module=LEVEL,module=LEVEL'"""
+    levels = {}
+    for part in spec.split(','):
+        if '=' in part:
+            name, level = part.split('=', 1)
+            levels[name.strip()] = level.strip()
+    return levels
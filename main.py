@@ -13,21 +13,17 @@ import logging
 import sys
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('jarvis.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from log_setup import setup_logging
+from startup import StartupOrchestrator, find_missing
+
+# Configure logging (queued, rotating jarvis.log - see LOGGING_CONFIG)
+setup_logging()
 
 logger = logging.getLogger(__name__)
 
 
 def check_dependencies():
-    """Check if all required packages are installed"""
+    """Check if all required packages are installed (without importing them)"""
     required = {
         'customtkinter': 'customtkinter',
         'speech_recognition': 'SpeechRecognition',
@@ -40,12 +36,7 @@ def check_dependencies():
         'pygame': 'pygame',
     }
     
-    missing = []
-    for module, package in required.items():
-        try:
-            __import__(module.split('.')[0])
-        except ImportError:
-            missing.append(package)
+    missing = find_missing(required)
     
     if missing:
         logger.error(f"❌ Missing packages: {', '.join(missing)}")
@@ -61,43 +52,51 @@ def main():
     logger.info("JARVIS - Advanced AI Assistant")
     logger.info("=" * 70)
     
+    startup = StartupOrchestrator()
+    
     # Check dependencies
-    if not check_dependencies():
+    if not startup.phase("dependency check", check_dependencies):
         logger.error("❌ Please install missing dependencies first")
         return
     
-    # Import modules
     try:
-        from config import USER_NAME, AI_CONFIG, GEMINI_API_KEY
-        from jarvis_memory import ConversationMemory
-        from jarvis_brain import JarvisBrain
-        from jarvis_tasks import JarvisTasks
-        from jarvis_voice_advanced import JarvisVoiceSystem
-        from jarvis_gui_advanced import JarvisAdvancedGUI
+        from config import USER_NAME, AI_CONFIG
         
         logger.info(f"User: {USER_NAME}")
         logger.info(f"AI Model: {AI_CONFIG['model']}")
-        logger.info(f"✅ Gemini API configured")
         logger.info("=" * 70)
         
-        # Initialize systems
+        # Initialize systems in the background - heavy imports (Gemini,
+        # speech recognition, pyautogui) happen off the main thread
         logger.info("Initializing systems...")
         
-        # 1. Memory system
-        memory = ConversationMemory(max_memory=AI_CONFIG['conversation_memory'])
+        def build_memory():
+            from jarvis_memory import ConversationMemory
+            from config import MEMORY_CONFIG
+            return ConversationMemory(max_memory=AI_CONFIG['conversation_memory'],
+                                      path=MEMORY_CONFIG['history_path'] or None)
         
-        # 2. AI Brain
-        brain = JarvisBrain(memory)
+        def build_brain(memory):
+            from jarvis_brain import JarvisBrain
+            return JarvisBrain(memory)
         
-        # 3. Task executor
-        tasks = JarvisTasks()
+        def build_tasks():
+            from jarvis_tasks import JarvisTasks
+            return JarvisTasks()
         
-        # 4. Voice system
-        voice = JarvisVoiceSystem()
+        def build_voice():
+            from jarvis_voice_advanced import JarvisVoiceSystem
+            return JarvisVoiceSystem()
         
-        # 5. GUI
+        memory = startup.start("memory", build_memory)
+        brain = startup.start("brain", build_brain, depends_on=["memory"])
+        tasks = startup.start("tasks", build_tasks)
+        voice = startup.start("voice", build_voice)
+        
+        # GUI first - it waits for the subsystems it needs on its own threads
         logger.info("Starting GUI...")
-        gui = JarvisAdvancedGUI(voice, brain, tasks, memory)
+        from jarvis_gui_advanced import JarvisAdvancedGUI
+        gui = startup.phase("gui", JarvisAdvancedGUI, voice, brain, tasks, memory)
         
         # Run
         gui.run()
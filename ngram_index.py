@@ -0,0 +1,138 @@
+"""
+JARVIS N-gram Index - Inverted Trigram Index for Fuzzy Name Lookup
+Shortlists fuzzy-match candidates without scoring every entry
+"""
+import logging
+import re
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    """
+    Split text into padded character n-grams
+
+    Each word is padded with spaces so prefixes and suffixes get their own
+    grams ("song" -> " so", "son", "ong", "ng ").
+
+    Args:
+        text: Text to split
+        n: Gram length
+
+    Returns:
+        Set of n-grams
+    """
+    grams = set()
+    for word in _NON_WORD.sub(' ', text.lower()).split():
+        padded = f" {word} "
+        if len(padded) <= n:
+            grams.add(padded)
+            continue
+        for i in range(len(padded) - n + 1):
+            grams.add(padded[i:i + n])
+    return grams
+
+
+class NgramIndex:
+    """
+    Inverted index from n-gram to integer entry IDs
+
+    Posting lists are compact ``array('I')`` buffers. Removals are recorded
+    as tombstones and filtered at query time; the index compacts itself once
+    tombstones make up a quarter of the postings.
+    """
+
+    def __init__(self, n: int = 3, max_query_grams: int = 6, max_df_ratio: float = 0.05):
+        """
+        Initialize n-gram index
+
+        Args:
+            n: Gram length
+            max_query_grams: Rarest query grams used for candidate counting
+            max_df_ratio: Grams found in more than this fraction of entries
+                          are skipped when rarer grams are available
+        """
+        self.n = n
+        self.max_query_grams = max_query_grams
+        self.max_df_ratio = max_df_ratio
+        self.postings: Dict[str, array] = {}
+        self.deleted: Set[int] = set()
+        self.size = 0
+
+    def add(self, entry_id: int, text: str):
+        """Index one entry"""
+        for gram in ngrams(text, self.n):
+            posting = self.postings.get(gram)
+            if posting is None:
+                posting = self.postings[gram] = array('I')
+            posting.append(entry_id)
+        self.deleted.discard(entry_id)
+        self.size += 1
+
+    def add_many(self, entries: Iterable[Tuple[int, str]]):
+        """Index many (entry_id, text) pairs"""
+        for entry_id, text in entries:
+            self.add(entry_id, text)
+
+    def remove(self, entry_id: int):
+        """Forget an entry (tombstoned until the next compaction)"""
+        if entry_id not in self.deleted:
+            self.deleted.add(entry_id)
+            self.size = max(self.size - 1, 0)
+        if len(self.deleted) > max(1000, self.size // 4):
+            self.compact()
+
+    def compact(self):
+        """Drop tombstoned IDs from every posting list"""
+        if not self.deleted:
+            return
+        deleted = self.deleted
+        for gram in list(self.postings):
+            kept = array('I', (i for i in self.postings[gram] if i not in deleted))
+            if kept:
+                self.postings[gram] = kept
+            else:
+                del self.postings[gram]
+        logger.debug(f"🧹 N-gram index compacted ({len(deleted)} tombstones)")
+        self.deleted = set()
+
+    def clear(self):
+        """Remove everything"""
+        self.postings.clear()
+        self.deleted.clear()
+        self.size = 0
+
+    def candidates(self, query: str, limit: int = 200) -> List[Tuple[int, int]]:
+        """
+        Shortlist entries sharing the most n-grams with the query
+
+        Args:
+            query: Query text
+            limit: Maximum number of candidates
+
+        Returns:
+            List of (entry_id, shared_gram_count), best first
+        """
+        postings = [self.postings[g] for g in ngrams(query, self.n) if g in self.postings]
+        if not postings:
+            return []
+
+        # Rarest grams are the most selective; very common grams are skipped
+        # as long as something more selective is left to count
+        postings.sort(key=len)
+        max_df = max(int(self.size * self.max_df_ratio), 1)
+        selective = [p for p in postings if len(p) <= max_df] or postings[:2]
+
+        counts = Counter()
+        for posting in selective[:self.max_query_grams]:
+            counts.update(posting)
+
+        if self.deleted:
+            for entry_id in self.deleted.intersection(counts):
+                del counts[entry_id]
+        return counts.most_common(limit)
@@ -0,0 +1,305 @@
+"""
+JARVIS Prefetch - Speculative Follow-Up Answers
+After an explanation, quietly asks the model for the follow-ups users
+most often want next ("simpler", "give an example") while they read, so
+those follow-ups are answered instantly. Optional, and bounded by its own
+quota budget on top of the AI guard's rate limit.
+"""
+import logging
+import queue
+import re
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from ai_guard import GuardedKnowledgeEngine, TokenBucket, is_quota_error
+from config import PREFETCH_CONFIG
+from tracing import traced
+
+logger = logging.getLogger(__name__)
+
+# How often a waiting job checks the guard for spare quota
+QUOTA_POLL_SECONDS = 0.5
+
+# Prompts for each follow-up kind ({question}: what the user asked)
+VARIANT_PROMPTS = {
+    'simpler': ('The user asked: "{question}". Explain it again in much simpler words, '
+                'as if to a complete beginner, in one short paragraph.'),
+    'example': ('The user asked: "{question}". Give one clear, real-world example that '
+                'illustrates the answer, with a short explanation of how it fits.'),
+}
+
+# Follow-up phrasings for each kind (English and Hinglish)
+VARIANT_PATTERNS = {
+    'simpler': r'\b(simpler|simple|simply|easier|easy|aasan|explain (it |that )?again|dobara|phir se)\b',
+    'example': r'\b(example|examples|udaharan)\b',
+}
+
+# Words a bare follow-up is made of - anything else means a new subject
+FOLLOWUP_WORDS = frozenset({
+    'explain', 'again', 'simpler', 'simple', 'simply', 'easier', 'easy', 'words', 'way', 'terms',
+    'example', 'examples', 'give', 'show', 'tell', 'can', 'you', 'could', 'please', 'jarvis',
+    'some', 'one', 'real', 'world', 'life', 'more', 'that', 'this', 'it', 'me', 'us', 'an', 'a',
+    'the', 'with', 'in', 'of', 'for', 'like', 'to', 'i', 'am', 'im', "i'm", "didn't", 'dont',
+    "don't", 'understand', 'get', 'now', 'ok', 'okay', 'and', 'bit', 'little',
+    'dobara', 'phir', 'se', 'mein', 'ek', 'do', 'dijiye', 'batao', 'samjhao', 'samjhaiye',
+    'karo', 'aasan', 'udaharan', 'isko', 'ise', 'ye', 'yeh', 'aur', 'thoda', 'mujhe', 'ka', 'ki',
+})
+
+# Devanagari vowel signs are not \w, so keep the whole block explicitly
+_PUNCTUATION = re.compile(r"[^\w\s'\u0900-\u097F]+", re.UNICODE)
+
+
+class _Entry:
+    """One speculative answer (queued, running or ready)"""
+
+    __slots__ = ('kind', 'generation', 'started', 'done', 'text')
+
+    def __init__(self, kind: str, generation: int):
+        self.kind = kind
+        self.generation = generation
+        self.started = False
+        self.done = threading.Event()
+        self.text = None
+
+
+class FollowupPrefetcher:
+    """
+    Background generator for likely follow-ups
+
+    schedule() is called after each fresh explanation: entries for the
+    previous topic are evicted and one job per follow-up kind is queued
+    for a single worker thread. Jobs only run while the budget and the
+    guard both have spare quota, so background requests never make the
+    user's own turns wait or fall back. take() serves a follow-up from
+    the store, waiting briefly if its answer is still being generated.
+    """
+
+    def __init__(self, engine, kinds: Iterable[str] = ('simpler', 'example'),
+                 max_per_hour: float = 30, keep_tokens: int = 1, max_delay: float = 20.0,
+                 wait_inflight: float = 5.0):
+        """
+        Initialize prefetcher
+
+        Args:
+            engine: KnowledgeEngine (or GuardedKnowledgeEngine) the answers come from
+            kinds: Follow-up kinds to prefetch (keys of VARIANT_PROMPTS)
+            max_per_hour: Background requests allowed per hour
+            keep_tokens: Guard tokens that must stay free for the user's turns
+            max_delay: Seconds a job waits for spare quota before it is skipped
+            wait_inflight: Seconds a follow-up waits for a prefetch that is already running
+        """
+        self.engine = engine
+        self.guard = engine if isinstance(engine, GuardedKnowledgeEngine) else None
+        self.kinds = [kind for kind in kinds if kind in VARIANT_PROMPTS]
+        self.keep_tokens = keep_tokens
+        self.max_delay = max_delay
+        self.wait_inflight = wait_inflight
+        self.budget = TokenBucket(max_per_hour / 60.0, max(1, len(self.kinds)))
+        self._patterns = {kind: re.compile(VARIANT_PATTERNS[kind], re.IGNORECASE) for kind in self.kinds}
+
+        self.topic: Optional[str] = None
+        self.question: Optional[str] = None
+        self._generation = 0
+        self._store: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._worker = None
+
+        self.scheduled = 0
+        self.generated = 0
+        self.served = 0
+        self.waited = 0
+        self.misses = 0
+        self.skipped = 0        # no budget or quota to spare
+        self.discarded = 0      # topic changed before the job ran or finished
+        self.failed = 0
+
+    # ----------------------------------------------------------------- #
+    # Scheduling
+    # ----------------------------------------------------------------- #
+    def schedule(self, question: str):
+        """
+        Prefetch follow-ups for the explanation just given
+
+        Args:
+            question: Question the user asked (follow-ups are ignored - the
+                topic has not changed and its entries stay)
+        """
+        if not self.kinds or self.engine._is_followup_question(question):
+            return
+        with self._lock:
+            self._generation += 1
+            evicted = len(self._store)
+            self.topic = self.engine.last_topic
+            self.question = question
+            self._store = {kind: _Entry(kind, self._generation) for kind in self.kinds}
+            entries = list(self._store.values())
+        if evicted:
+            logger.debug("🧹 Prefetch: dropped %d entries for the previous topic", evicted)
+        for entry in entries:
+            self._queue.put((entry, question))
+        self.scheduled += len(entries)
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._work_loop, daemon=True,
+                                                    name="followup-prefetch")
+                    self._worker.start()
+
+    def _work_loop(self):
+        while True:
+            entry, question = self._queue.get()
+            with self._lock:
+                stale = entry.generation != self._generation or self._store.get(entry.kind) is not entry
+                if not stale:
+                    entry.started = True
+            if stale:
+                self.discarded += 1
+                entry.done.set()
+                continue
+            if not self._reserve(entry):
+                self.skipped += 1
+                self._drop(entry)
+                entry.done.set()
+                continue
+            try:
+                entry.text = self._generate(entry.kind, question)
+                self.generated += 1
+            except Exception as e:
+                self.failed += 1
+                if self.guard is not None and is_quota_error(e):
+                    # Quota is shared with the user's turns - let the guard know
+                    self.guard.breaker.record_failure(quota=True)
+                logger.debug(f"Prefetch ({entry.kind}) failed: {e}")
+                self._drop(entry)
+                continue
+            finally:
+                entry.done.set()
+            if entry.generation != self._generation:
+                self.discarded += 1
+            else:
+                logger.debug("📥 Prefetched '%s' follow-up for '%s'", entry.kind, self.topic)
+
+    def _reserve(self, entry: _Entry) -> bool:
+        """
+        Take budget for one background request, then wait (up to max_delay,
+        while the topic is current) until the guard can spare the quota
+        """
+        if self.budget.reserve(0) is None:
+            return False
+        deadline = time.monotonic() + self.max_delay
+        while self.guard is not None and not self.guard.spare(self.keep_tokens):
+            if entry.generation != self._generation or time.monotonic() >= deadline:
+                return False
+            time.sleep(QUOTA_POLL_SECONDS)
+        return True
+
+    def _drop(self, entry: _Entry):
+        with self._lock:
+            if self._store.get(entry.kind) is entry:
+                del self._store[entry.kind]
+
+    @traced("prefetch")
+    def _generate(self, kind: str, question: str) -> str:
+        return self.engine.generate_standalone(VARIANT_PROMPTS[kind].format(question=question))
+
+    # ----------------------------------------------------------------- #
+    # Serving
+    # ----------------------------------------------------------------- #
+    def kind_of(self, text: str) -> Optional[str]:
+        """
+        Follow-up kind of a bare follow-up ("simpler please", "ek example do")
+
+        Returns:
+            The kind, or None for other questions (including follow-ups that
+            name a subject of their own, e.g. "example of polymorphism")
+        """
+        if not self.engine._is_followup_question(text):
+            return None
+        words = _PUNCTUATION.sub(' ', text.lower()).split()
+        topic_words = set((self.topic or '').split())
+        if any(w not in FOLLOWUP_WORDS and w not in topic_words for w in words):
+            return None
+        for kind, pattern in self._patterns.items():
+            if pattern.search(text):
+                return kind
+        return None
+
+    def take(self, text: str) -> Optional[str]:
+        """
+        Prefetched answer for a follow-up on the current topic
+
+        Returns:
+            Answer text, or None when the model has to be asked
+        """
+        kind = self.kind_of(text)
+        if kind is None:
+            return None
+        with self._lock:
+            entry = self._store.get(kind)
+            if entry is None or self.topic != self.engine.last_topic:
+                entry = None
+            elif entry.done.is_set() or entry.started:
+                # Served once - asking again wants a fresh answer
+                del self._store[kind]
+            else:
+                # Still queued - the live request will answer instead
+                del self._store[kind]
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        if not entry.done.is_set():
+            self.waited += 1
+            entry.done.wait(self.wait_inflight)
+        if entry.text is None:
+            self.misses += 1
+            return None
+        self.served += 1
+        logger.info("⚡ PREFETCH HIT: '%s' follow-up for '%s'", kind, self.topic)
+        return entry.text
+
+    def clear(self):
+        """Forget every prefetched answer"""
+        with self._lock:
+            self._generation += 1
+            self._store = {}
+            self.topic = None
+            self.question = None
+
+    def stats(self) -> Dict:
+        """Scheduled, generated and served counts"""
+        return {
+            'scheduled': self.scheduled,
+            'generated': self.generated,
+            'served': self.served,
+            'waited': self.waited,
+            'misses': self.misses,
+            'skipped': self.skipped,
+            'discarded': self.discarded,
+            'failed': self.failed,
+            'ready': sum(1 for entry in self._store.values() if entry.text is not None),
+        }
+
+
+def get_prefetcher(engine) -> Optional[FollowupPrefetcher]:
+    """
+    Prefetcher for an engine with the settings from PREFETCH_CONFIG
+
+    Returns:
+        The prefetcher, or None if disabled
+    """
+    if not PREFETCH_CONFIG['enabled']:
+        return None
+    return FollowupPrefetcher(
+        engine,
+        kinds=PREFETCH_CONFIG['kinds'],
+        max_per_hour=PREFETCH_CONFIG['max_per_hour'],
+        keep_tokens=PREFETCH_CONFIG['keep_tokens'],
+        max_delay=PREFETCH_CONFIG['max_delay'],
+        wait_inflight=PREFETCH_CONFIG['wait_inflight'],
+    )
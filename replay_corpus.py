@@ -0,0 +1,404 @@
+"""
+JARVIS Replay Corpus - Intent Routing Benchmark
+Extracts the utterances JARVIS actually heard (RECOGNIZED TEXT / RAW INPUT
+lines in jarvis.log) into a versioned corpus, then replays them through
+IntentDetector and JarvisBrain.detect_action_intent without side effects,
+reporting throughput, allocations and routing diffs against a baseline
+
+Usage:
+    python replay_corpus.py extract                              # jarvis.log (+ rotated files)
+    python replay_corpus.py extract --log old.log --log jarvis.log --out replay_corpus.json
+    python replay_corpus.py run                                  # throughput + allocations
+    python replay_corpus.py run --save-baseline replay_baseline.json
+    python replay_corpus.py run --baseline replay_baseline.json  # exit 1 on diffs/regression
+"""
+import argparse
+import gc
+import glob
+import hashlib
+import json
+import logging
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+CORPUS_VERSION = 1
+DEFAULT_CORPUS = 'replay_corpus.json'
+DEFAULT_LOG = 'jarvis.log'
+
+# Log lines may carry a timestamp prefix or (older logs) start on a
+# continuation line after a bare "INFO - " line, so match anywhere.
+_TEXT_LINE = re.compile(r"(✅ RECOGNIZED TEXT|📝 RAW INPUT): '(.*)'\s*$")
+_LANGUAGE_LINE = re.compile(r"🌐 (?:DETECTED )?LANGUAGE: (\w+)")
+_PRIMARY_LINE = re.compile(r"(?:🎯 PRIMARY|⚡ FINAL) INTENT: (\w+) \(confidence: ([\d.]+)\)")
+_ROUTE_LINE = re.compile(r"🎯 DETECTED INTENT: (\w+)")
+_ACTION_LINE = re.compile(r"⚙️? ACTION: (\S+)")
+
+# Same mapping process_input uses for result['intent']
+_ROUTES = {'ACTION': 'task', 'INFORMATION': 'information', 'CONVERSATION': 'conversation', 'EXIT': 'task'}
+
+
+# ----------------------------------------------------------------------- #
+# Extraction
+# ----------------------------------------------------------------------- #
+def log_files(path: str) -> List[str]:
+    """A log and its rotated backups, oldest first (jarvis.log.3, .2, .1, jarvis.log)"""
+    rotated = [p for p in glob.glob(glob.escape(path) + '.*') if p.rsplit('.', 1)[-1].isdigit()]
+    rotated.sort(key=lambda p: int(p.rsplit('.', 1)[-1]), reverse=True)
+    return rotated + [path]
+
+
+def parse_log(lines) -> List[Dict]:
+    """
+    Turn log lines into one record per heard utterance
+
+    A turn starts at RECOGNIZED TEXT (GUI) or at a RAW INPUT that is not
+    the brain echoing the text the GUI just logged. Language, intent and
+    action are the first ones logged after it.
+
+    Returns:
+        List of {text, language, logged_primary, logged_confidence,
+        logged_route, logged_action}
+    """
+    turns = []
+    turn = None
+    for line in lines:
+        match = _TEXT_LINE.search(line)
+        if match:
+            text = match.group(2).strip()
+            echo = (match.group(1).endswith('RAW INPUT') and turn is not None
+                    and turn['text'] == text and turn['logged_primary'] is None
+                    and turn['logged_route'] is None)
+            if not echo and text:
+                turn = {'text': text, 'language': None, 'logged_primary': None,
+                        'logged_confidence': None, 'logged_route': None, 'logged_action': None}
+                turns.append(turn)
+            continue
+        if turn is None:
+            continue
+
+        match = _LANGUAGE_LINE.search(line)
+        if match and turn['language'] is None:
+            turn['language'] = match.group(1)
+            continue
+        match = _PRIMARY_LINE.search(line)
+        if match and turn['logged_primary'] is None:
+            turn['logged_primary'] = match.group(1)
+            turn['logged_confidence'] = float(match.group(2))
+            continue
+        match = _ROUTE_LINE.search(line)
+        if match and turn['logged_route'] is None:
+            turn['logged_route'] = match.group(1)
+            continue
+        match = _ACTION_LINE.search(line)
+        if match and turn['logged_action'] is None:
+            action = match.group(1)
+            turn['logged_action'] = None if action in ('None', 'unknown') else action
+    return turns
+
+
+def build_corpus(turns: List[Dict], sources: List[str]) -> Dict:
+    """
+    Deduplicate turns into a versioned corpus
+
+    Utterances keep the order they were first heard and count how often
+    they were heard. The revision hash changes whenever the texts do, so
+    baselines can tell which corpus they were recorded against.
+    """
+    utterances = {}
+    for turn in turns:
+        key = turn['text'].casefold()
+        if key in utterances:
+            utterances[key]['count'] += 1
+        else:
+            utterances[key] = dict(turn, count=1)
+    items = list(utterances.values())
+    digest = hashlib.sha1('\n'.join(u['text'] for u in items).encode('utf-8')).hexdigest()
+    return {
+        'version': CORPUS_VERSION,
+        'revision': digest[:12],
+        'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'sources': sources,
+        'turns': len(turns),
+        'utterances': items,
+    }
+
+
+def load_corpus(path: str) -> Dict:
+    """Read a corpus file, rejecting versions this tool doesn't know"""
+    with open(path, encoding='utf-8') as f:
+        corpus = json.load(f)
+    if corpus.get('version') != CORPUS_VERSION:
+        raise ValueError(f"{path}: corpus version {corpus.get('version')} "
+                         f"(this tool reads version {CORPUS_VERSION}) - re-run extract")
+    return corpus
+
+
+# ----------------------------------------------------------------------- #
+# Replay
+# ----------------------------------------------------------------------- #
+class _NoModel:
+    """Knowledge model that refuses to be called - routing must not reach Gemini"""
+
+    def generate_content(self, *args, **kwargs):
+        raise RuntimeError("replay must not query the knowledge model")
+
+
+def build_router():
+    """
+    A JarvisBrain with in-memory conversation state and no AI model
+
+    Only the sanitizer, IntentDetector, the small talk table and
+    detect_action_intent are used; nothing is written to memory files,
+    launched or sent anywhere.
+    """
+    from jarvis_brain import JarvisBrain
+    from jarvis_memory import ConversationMemory
+    from knowledge_engine import KnowledgeEngine
+    from tracing import get_tracer
+
+    # Replays would otherwise be recorded as thousands of traces
+    get_tracer().enabled = False
+    knowledge = KnowledgeEngine(api_key='replay', model_name='replay', model=_NoModel())
+    return JarvisBrain(ConversationMemory(), knowledge_engine=knowledge)
+
+
+def route(brain, text: str) -> Tuple[str, Optional[str], str, float]:
+    """
+    Routing decision process_input would make, without its side effects
+
+    Returns:
+        (route, action, primary intent, confidence)
+    """
+    if brain.sanitizer:
+        is_safe, text, _ = brain.sanitizer.sanitize_text(text)
+        if not is_safe:
+            return 'BLOCKED', None, 'BLOCKED', 1.0
+    primary, confidence, _ = brain.intent_detector.classify_intent(text)
+    action = None
+    if primary in ('INFORMATION', 'CONVERSATION') and brain.small_talk.match(text):
+        return 'conversation', None, primary, round(confidence, 2)
+    if primary == 'ACTION':
+        action = brain.detect_action_intent(text)['action']
+    elif primary == 'EXIT':
+        action = 'exit'
+    return _ROUTES.get(primary, 'conversation'), action, primary, round(confidence, 2)
+
+
+def measure_throughput(brain, texts: List[str], repeat: int) -> Dict[str, float]:
+    """Utterances per second over `repeat` passes, plus gen-0 GCs as allocation pressure"""
+    gc.collect()
+    collections_before = gc.get_stats()[0]['collections']
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            route(brain, text)
+    elapsed = time.perf_counter() - started
+    total = len(texts) * repeat
+    return {
+        'utterances_per_sec': round(total / elapsed, 1),
+        'us_per_utterance': round(elapsed / total * 1e6, 1),
+        'gen0_gcs_per_1k': round((gc.get_stats()[0]['collections'] - collections_before) * 1000 / total, 2),
+    }
+
+
+def measure_allocations(brain, texts: List[str]) -> Dict[str, float]:
+    """
+    tracemalloc pass (separate from the timed passes - tracing is slow)
+
+    Reports the blocks and bytes each utterance allocates (net of what it
+    frees, measured at the peak) and what stays alive after a full pass.
+    """
+    route(brain, texts[0])          # warm caches before counting
+    gc.collect()
+    tracemalloc.start()
+    baseline_snapshot = tracemalloc.take_snapshot()
+    peaks = []
+    for text in texts:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        route(brain, text)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    gc.collect()
+    diff = tracemalloc.take_snapshot().compare_to(baseline_snapshot, 'filename')
+    tracemalloc.stop()
+    retained = [stat for stat in diff if 'tracemalloc' not in (stat.traceback[0].filename or '')]
+    return {
+        'peak_kb_per_utterance': round(sum(peaks) / len(peaks) / 1024, 2),
+        'max_peak_kb': round(max(peaks) / 1024, 2),
+        'retained_blocks': sum(stat.count_diff for stat in retained),
+        'retained_kb': round(sum(stat.size_diff for stat in retained) / 1024, 2),
+    }
+
+
+def diff_routes(routes: Dict[str, List], baseline_routes: Dict[str, List]) -> List[str]:
+    """Utterances whose (route, action, primary intent) changed"""
+    changes = []
+    for text, current in routes.items():
+        previous = baseline_routes.get(text)
+        if previous is not None and previous[:3] != current[:3]:
+            changes.append(f"'{text}': {previous[0]}/{previous[1]}/{previous[2]} "
+                           f"-> {current[0]}/{current[1]}/{current[2]}")
+    return changes
+
+
+def logged_disagreements(utterances: List[Dict], routes: Dict[str, List]) -> int:
+    """Utterances routed differently from what the log recorded at the time"""
+    count = 0
+    for u in utterances:
+        current = routes[u['text']]
+        if u['logged_route'] and (u['logged_route'] != current[0] or u['logged_action'] != current[1]):
+            count += 1
+    return count
+
+
+# ----------------------------------------------------------------------- #
+# CLI
+# ----------------------------------------------------------------------- #
+def cmd_extract(args) -> int:
+    sources = []
+    for log in args.log or [DEFAULT_LOG]:
+        sources.extend(log_files(log) if not args.no_rotated else [log])
+    turns = []
+    for path in sources:
+        try:
+            with open(path, encoding='utf-8', errors='replace') as f:
+                turns.extend(parse_log(f))
+        except FileNotFoundError:
+            print(f"⚠️ {path} not found")
+    corpus = build_corpus(turns, sources)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(corpus, f, indent=1, ensure_ascii=False)
+    print(f"💾 {len(corpus['utterances'])} utterances ({corpus['turns']} turns) from "
+          f"{', '.join(sources)} -> {args.out} (revision {corpus['revision']})")
+    return 0 if corpus['utterances'] else 2
+
+
+def cmd_run(args) -> int:
+    corpus = load_corpus(args.corpus)
+    utterances = corpus['utterances']
+    if not utterances:
+        print("Corpus is empty")
+        return 2
+    texts = [u['text'] for u in utterances]
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
+    brain = build_router()
+    if args.semantic:
+        from semantic_intent import get_semantic_classifier
+        brain.intent_detector.semantic = get_semantic_classifier()
+        if brain.intent_detector.semantic is None:
+            print("Semantic classifier unavailable (numpy not installed)")
+            return 2
+
+    print("=" * 70)
+    print("JARVIS INTENT ROUTING REPLAY")
+    print("=" * 70)
+    print(f"Corpus: {args.corpus} v{corpus['version']} rev {corpus['revision']} | "
+          f"{len(texts)} utterances x {args.repeat}"
+          f"{' | semantic classifier on' if args.semantic else ''}")
+
+    routes = {text: list(route(brain, text)) for text in texts}
+    perf = measure_throughput(brain, texts, args.repeat)
+    perf.update(measure_allocations(brain, texts))
+    if args.semantic:
+        started = time.perf_counter()
+        brain.intent_detector.semantic.classify_batch(texts)
+        perf['semantic_batch_per_sec'] = round(len(texts) / (time.perf_counter() - started), 1)
+
+    counts = {}
+    for r, action, _, _ in routes.values():
+        key = f"{r}/{action}" if action else r
+        counts[key] = counts.get(key, 0) + 1
+    print(f"\n{'route':<32}{'utterances':>12}")
+    print("-" * 70)
+    for key, count in sorted(counts.items(), key=lambda kv: -kv[1]):
+        print(f"{key:<32}{count:>12}")
+
+    print(f"\n{'metric':<32}{'value':>12}")
+    print("-" * 70)
+    for key, value in perf.items():
+        print(f"{key:<32}{value:>12}")
+    print(f"{'differs from logged route':<32}{logged_disagreements(utterances, routes):>12}")
+
+    result = {
+        'corpus': args.corpus,
+        'corpus_revision': corpus['revision'],
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'perf': perf,
+        'routes': routes,
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=1, ensure_ascii=False)
+        print(f"\n💾 Baseline saved to {args.save_baseline}")
+
+    problems = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('corpus_revision') != corpus['revision']:
+            print(f"\n⚠️ Baseline was recorded on corpus rev {baseline.get('corpus_revision')} "
+                  f"- comparing shared utterances only")
+        changes = diff_routes(routes, baseline.get('routes', {}))
+        if changes:
+            problems.append(f"{len(changes)} routing change(s):")
+            problems.extend(f"   {change}" for change in changes[:args.show])
+            if len(changes) > args.show:
+                problems.append(f"   ... and {len(changes) - args.show} more")
+
+        # Throughput is only comparable on the machine that recorded it
+        base_perf = baseline.get('perf', {})
+        if baseline.get('host') == result['host'] and base_perf:
+            floor = base_perf['utterances_per_sec'] * (1 - args.tolerance)
+            if perf['utterances_per_sec'] < floor:
+                problems.append(f"throughput {perf['utterances_per_sec']:.0f} utt/s < {floor:.0f} "
+                                f"(baseline {base_perf['utterances_per_sec']:.0f})")
+            ceiling = base_perf['peak_kb_per_utterance'] * (1 + args.tolerance)
+            if perf['peak_kb_per_utterance'] > ceiling:
+                problems.append(f"allocations {perf['peak_kb_per_utterance']:.2f} KB/utt > {ceiling:.2f} "
+                                f"(baseline {base_perf['peak_kb_per_utterance']:.2f})")
+        else:
+            print("\nℹ️ Baseline from another host - checking routes only")
+
+    print("\n" + "=" * 70)
+    if problems:
+        print("❌ REGRESSION")
+        for problem in problems:
+            print(f"   {problem}")
+        return 1
+    print("✅ MATCHES BASELINE" if args.baseline else "REPLAY COMPLETE")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="JARVIS intent routing replay benchmark")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    extract = commands.add_parser('extract', help="Build the corpus from JARVIS logs")
+    extract.add_argument('--log', action='append', help=f"Log file (repeatable, default {DEFAULT_LOG})")
+    extract.add_argument('--no-rotated', action='store_true', help="Skip rotated .1/.2/... backups")
+    extract.add_argument('--out', default=DEFAULT_CORPUS, help="Corpus file to write")
+
+    run = commands.add_parser('run', help="Replay the corpus through the router")
+    run.add_argument('--corpus', default=DEFAULT_CORPUS)
+    run.add_argument('--repeat', type=int, default=50, help="Timed passes over the corpus")
+    run.add_argument('--baseline', help="Baseline JSON to compare against (exit 1 on diffs/regression)")
+    run.add_argument('--save-baseline', help="Write this run's routes and metrics as a baseline")
+    run.add_argument('--tolerance', type=float, default=0.2,
+                     help="Allowed relative throughput drop / allocation increase")
+    run.add_argument('--show', type=int, default=20, help="Routing changes to list")
+    run.add_argument('--semantic', action='store_true',
+                     help="Route with the embedding classifier in front of the keyword scores")
+    run.add_argument('--verbose', action='store_true', help="Show JARVIS logs")
+
+    args = parser.parse_args(argv)
+    return cmd_extract(args) if args.command == 'extract' else cmd_run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
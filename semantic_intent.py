@@ -0,0 +1,242 @@
+"""
+JARVIS Semantic Intent - Nearest-Neighbour Intent Classifier
+Embeds utterances as hashed word and character n-gram vectors and labels
+them by their nearest labelled examples, so paraphrases and Hinglish
+variants the keyword sets miss still route correctly. Optional: needs NumPy.
+"""
+import json
+import logging
+import os
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from config import SEMANTIC_INTENT_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Devanagari vowel signs are not \w, so keep the whole block explicitly
+_PUNCTUATION = re.compile(r'[^\w\s\u0900-\u097F]+', re.UNICODE)
+
+# Wake words and politeness carry no intent
+_IGNORED_WORDS = frozenset({'jarvis', 'please', 'plz', 'जार्विस'})
+
+# Labelled examples: English, Hinglish and Hindi, including the phrasings
+# that show up in jarvis.log
+DEFAULT_EXAMPLES: Dict[str, List[str]] = {
+    'ACTION': [
+        "open chrome", "open youtube", "launch notepad", "start calculator", "open whatsapp",
+        "can you open chrome for me", "could you launch spotify", "bring up the file explorer",
+        "chrome kholo", "whatsapp open karo", "notepad khol do", "kya aap whatsapp open kar sakte ho",
+        "aap whatsapp open kijiye", "क्रोम खोलो", "क्या क्रोम ओपन कर सकते हो",
+        "play despacito on youtube", "play some music", "play hanuman chalisa",
+        "put on some lofi songs", "i want to listen to arijit singh",
+        "hanuman chalisa play kar do", "koi gaana bajao", "arijit ke gaane chalao", "गाना चलाओ",
+        "search for python tutorials", "google the weather in delhi", "look up flights to mumbai",
+        "find restaurants near me", "python tutorial dhundo", "google par search karo",
+        "send a message to mom", "message rahul that i will be late", "whatsapp amma that i am coming",
+        "amma ko message bhejo", "rahul ko bolo main late hoon", "ek message bhejna hai",
+        "turn up the volume", "mute the sound", "set a timer for ten minutes", "set an alarm for 6 am",
+        "remind me to call dad", "volume badhao", "awaaz kam karo", "take a screenshot",
+        "close this window", "minimize everything", "what's the weather like today",
+        "what time is it", "time kya ho raha hai", "aaj mausam kaisa hai",
+    ],
+    'INFORMATION': [
+        "what is machine learning", "explain recursion", "how does the internet work",
+        "why is the sky blue", "what is the difference between tcp and udp",
+        "tell me about black holes", "who invented the telephone", "define photosynthesis",
+        "how do vaccines work", "what does api mean", "can you explain javascript closures",
+        "i don't understand how neural networks learn", "give me an example of polymorphism",
+        "explain it in simpler words", "tell me more about that", "what is the capital of france",
+        "javascript ke bare mein explain karo", "recursion kya hota hai", "python kya hai",
+        "mujhe quantum physics samjhao", "gravity kaise kaam karta hai", "isko simple mein samjhao",
+        "ek example do", "dobara samjhao", "मशीन लर्निंग क्या है", "गुरुत्वाकर्षण समझाओ",
+        "how to make tea", "what are the benefits of yoga", "compare python and java",
+    ],
+    'CONVERSATION': [
+        "hey", "hello", "hi there", "good morning", "good evening", "namaste",
+        "how are you", "how's it going", "what's up", "kaise ho", "kya haal hai", "कैसे हो",
+        "thank you", "thanks a lot", "shukriya", "dhanyavaad", "धन्यवाद",
+        "who are you", "what is your name", "tum kaun ho", "what can you do",
+        "you are awesome", "that's great", "nice work", "ok cool", "achcha theek hai",
+        "sorry", "maaf karo", "i am bored", "tell me a joke", "i'm feeling happy today",
+    ],
+    'EXIT': [
+        "exit", "quit", "goodbye", "bye", "bye bye", "see you later", "stop listening",
+        "go to sleep", "shut down jarvis", "close jarvis", "band karo", "chalo bye",
+        "that's all for now", "so jao", "बंद करो",
+    ],
+}
+
+
+class HashedNgramEmbedder:
+    """
+    Feature-hashing text embedder
+
+    Words, word bigrams and character 3/4-grams (within words) are hashed
+    into a fixed number of signed buckets and the vector is L2-normalised.
+    CRC32 is used instead of hash() so vectors are stable across runs.
+    """
+
+    def __init__(self, dim: int = 4096):
+        self.dim = dim
+        self._word_features = lru_cache(maxsize=8192)(self._hash_word)
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        h = zlib.crc32(feature.encode('utf-8'))
+        return h % self.dim, (1.0 if h & 0x80000000 else -1.0)
+
+    def _hash_word(self, word: str) -> Tuple[Tuple[int, float], ...]:
+        features = [self._bucket('w:' + word)]
+        padded = f' {word} '
+        for n in (3, 4):
+            for i in range(len(padded) - n + 1):
+                bucket, sign = self._bucket('c:' + padded[i:i + n])
+                features.append((bucket, sign * 0.5))
+        return tuple(features)
+
+    def tokens(self, text: str) -> List[str]:
+        return [w for w in _PUNCTUATION.sub(' ', text.lower()).split() if w not in _IGNORED_WORDS]
+
+    def embed(self, text: str) -> "np.ndarray":
+        """One utterance -> unit vector (float32, length dim)"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        words = self.tokens(text)
+        for word in words:
+            for bucket, weight in self._word_features(word):
+                vector[bucket] += weight
+        for first, second in zip(words, words[1:]):
+            bucket, sign = self._bucket(f'b:{first} {second}')
+            vector[bucket] += sign
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def embed_batch(self, texts: Sequence[str]) -> "np.ndarray":
+        """Utterances -> matrix of unit vectors, one row each"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = self.embed(text)
+        return matrix
+
+
+class SemanticIntentClassifier:
+    """
+    k-nearest-neighbour intent classifier over labelled examples
+
+    Brute-force cosine similarity (one matrix product) - a few hundred
+    examples take well under a millisecond per utterance. The top-k
+    neighbours vote with their similarity; confidence is the winning
+    label's share of the vote times its best similarity, so an utterance
+    unlike every example gets a low score and the caller falls back.
+    """
+
+    def __init__(self, examples: Optional[Dict[str, List[str]]] = None, k: int = 5,
+                 min_confidence: float = 0.3, dim: int = 4096):
+        """
+        Initialize classifier
+
+        Args:
+            examples: intent -> example utterances (default DEFAULT_EXAMPLES)
+            k: Neighbours that vote
+            min_confidence: Below this classify() returns no label
+            dim: Hashed feature dimensions
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+        self.k = k
+        self.min_confidence = min_confidence
+        self.embedder = HashedNgramEmbedder(dim)
+        self.texts: List[str] = []
+        self.labels: List[str] = []
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+        self.add_examples(examples or DEFAULT_EXAMPLES)
+
+    def add_examples(self, examples: Dict[str, List[str]]):
+        """Add labelled utterances to the index"""
+        texts = [text for label in examples for text in examples[label]]
+        labels = [label for label in examples for _ in examples[label]]
+        self.matrix = np.vstack([self.matrix, self.embedder.embed_batch(texts)])
+        self.texts.extend(texts)
+        self.labels.extend(labels)
+        self._label_ids = sorted(set(self.labels))
+        self._label_index = np.array([self._label_ids.index(label) for label in self.labels])
+        logger.info(f"✅ Semantic intent index: {len(self.texts)} examples, {len(self._label_ids)} intents")
+
+    def _vote(self, similarities: "np.ndarray") -> Tuple[str, float, str]:
+        k = min(self.k, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        weights = np.clip(similarities[top], 0, None)
+        votes = np.bincount(self._label_index[top], weights=weights, minlength=len(self._label_ids))
+        winner = int(votes.argmax())
+        total = float(votes.sum())
+        if total <= 0:
+            return self._label_ids[winner], 0.0, ''
+        mine = top[self._label_index[top] == winner]
+        nearest = int(mine[similarities[mine].argmax()])
+        confidence = float(votes[winner]) / total * float(similarities[nearest])
+        return self._label_ids[winner], confidence, self.texts[nearest]
+
+    def classify(self, text: str) -> Tuple[Optional[str], float, str]:
+        """
+        Label one utterance
+
+        Returns:
+            (intent or None when below min_confidence, confidence, nearest example)
+        """
+        label, confidence, nearest = self._vote(self.matrix @ self.embedder.embed(text))
+        return (label if confidence >= self.min_confidence else None), round(confidence, 3), nearest
+
+    def classify_batch(self, texts: Sequence[str]) -> List[Tuple[Optional[str], float, str]]:
+        """Label many utterances with one matrix product"""
+        if not texts:
+            return []
+        similarities = self.embedder.embed_batch(texts) @ self.matrix.T
+        results = []
+        for row in similarities:
+            label, confidence, nearest = self._vote(row)
+            results.append(((label if confidence >= self.min_confidence else None),
+                            round(confidence, 3), nearest))
+        return results
+
+
+def load_examples(path: str) -> Dict[str, List[str]]:
+    """Read extra examples ({"ACTION": ["..."], ...}) if the file exists"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Global instance for easy access
+_semantic_classifier = None
+
+def get_semantic_classifier() -> Optional[SemanticIntentClassifier]:
+    """
+    Get or create global classifier (settings from SEMANTIC_INTENT_CONFIG)
+
+    Returns:
+        The classifier, or None if NumPy is missing
+    """
+    global _semantic_classifier
+    if _semantic_classifier is None:
+        if np is None:
+            logger.warning("⚠️ numpy not installed - semantic intent classifier disabled")
+            return None
+        _semantic_classifier = SemanticIntentClassifier(
+            k=SEMANTIC_INTENT_CONFIG['k'],
+            min_confidence=SEMANTIC_INTENT_CONFIG['min_confidence'],
+            dim=SEMANTIC_INTENT_CONFIG['dim'],
+        )
+        extra = load_examples(SEMANTIC_INTENT_CONFIG['examples_file'])
+        if extra:
+            _semantic_classifier.add_examples(extra)
+    return _semantic_classifier
@@ -0,0 +1,230 @@
+"""
+JARVIS Small Talk - Local Conversation Tier
+Answers greetings, thanks, "how are you" and other small talk from a
+compiled pattern table in microseconds, so only real questions reach Gemini
+"""
+import logging
+import random
+import re
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+from config import USER_NAME
+
+logger = logging.getLogger(__name__)
+
+# Devanagari vowel signs are not \w, so keep the whole block explicitly
+_PUNCTUATION = re.compile(r"[^\w\s'\u0900-\u097F]+", re.UNICODE)
+
+# Words that don't change what kind of small talk an utterance is
+FILLER_WORDS = frozenset({
+    'jarvis', 'please', 'ji', 'sir', 'yaar', 'bhai', 'buddy', 'dear', 'there', 'the',
+    'so', 'oh', 'well', 'and', 'aur', 'to', 'hai', 'hain', 'ho', 'very', 'much',
+    'जार्विस', 'जी', 'और', 'है', 'हैं',
+})
+
+
+class SmallTalkRule(NamedTuple):
+    """
+    One kind of small talk
+
+    patterns: language -> phrases (regex, matched on whole words)
+    replies: language -> reply templates ({user}, {part_of_day})
+    """
+    name: str
+    patterns: Dict[str, List[str]]
+    replies: Dict[str, List[str]]
+
+
+# In priority order: when several rules match, the first one answers
+DEFAULT_RULES = [
+    SmallTalkRule('how_are_you', {
+        'en': [r"how (are|r) (you|u)( doing)?", r"how('s| is) it going", r"how do you do", r"what'?s up"],
+        'hinglish': [r"(aap|tum) kaise (ho|hain)", r"kaise ho", r"kaisa (hai|chal raha)", r"kya haal( chaal)?",
+                     r"sab (theek|thik)"],
+        'hi': [r"कैसे (हो|हैं)", r"क्या हाल( चाल)?", r"सब ठीक"],
+    }, {
+        'en': ["I'm doing great, thanks for asking! How can I help you?",
+               "All systems running smoothly, {user}! What can I do for you?"],
+        'hinglish': ["Main bilkul theek hoon! Bataiye, kya madad karun?"],
+        'hi': ["मैं बिल्कुल ठीक हूँ! बताइए, क्या मदद करूँ?"],
+    }),
+    SmallTalkRule('thanks', {
+        'en': [r"thank(s| you)( so)?", r"thanks a lot", r"thx", r"much appreciated"],
+        'hinglish': [r"shukriya", r"dhanyava+d", r"dhanyavaad"],
+        'hi': [r"धन्यवाद", r"शुक्रिया"],
+    }, {
+        'en': ["You're welcome!", "Happy to help, {user}!", "Anytime!"],
+        'hinglish': ["Koi baat nahi!", "Aapki madad karke khushi hui!"],
+        'hi': ["कोई बात नहीं!", "आपकी मदद करके खुशी हुई!"],
+    }),
+    SmallTalkRule('who_are_you', {
+        'en': [r"who (are|r) (you|u)", r"what (are|r) (you|u)", r"introduce yourself"],
+        'hinglish': [r"(tum|aap) kaun (ho|hain)", r"kaun ho"],
+        'hi': [r"(तुम|आप) कौन (हो|हैं)", r"कौन हो"],
+    }, {
+        'en': ["I'm JARVIS, your AI assistant. I can control your computer, answer questions, and help with tasks."],
+        'hinglish': ["Main JARVIS hoon, aapka AI assistant. Apps kholna, sawaalon ke jawab dena, sab kar sakta hoon."],
+        'hi': ["मैं जार्विस हूँ, आपका AI असिस्टेंट। ऐप खोलना, सवालों के जवाब देना, सब कर सकता हूँ।"],
+    }),
+    SmallTalkRule('name', {
+        'en': [r"what('s| is) your name", r"your name"],
+        'hinglish': [r"(tumhara|aapka|tera) naam( kya)?", r"naam kya"],
+        'hi': [r"(तुम्हारा|आपका) नाम( क्या)?", r"नाम क्या"],
+    }, {
+        'en': ["I'm JARVIS."],
+        'hinglish': ["Mera naam JARVIS hai."],
+        'hi': ["मेरा नाम जार्विस है।"],
+    }),
+    SmallTalkRule('capabilities', {
+        'en': [r"what can (you|u) do", r"(your )?capabilities", r"how can (you|u) help( me)?"],
+        'hinglish': [r"(tum|aap) kya( kya)? kar sakte (ho|hain)", r"kya( kya)? kar sakte"],
+        'hi': [r"क्या( क्या)? कर सकते"],
+    }, {
+        'en': ["I can open apps, search the web, play music on YouTube, send messages, and answer your questions."],
+        'hinglish': ["Main apps khol sakta hoon, web search, YouTube par music, messages bhejna aur sawaalon ke jawab."],
+        'hi': ["मैं ऐप खोल सकता हूँ, वेब सर्च, यूट्यूब पर गाने, मैसेज भेजना और सवालों के जवाब दे सकता हूँ।"],
+    }),
+    SmallTalkRule('greeting', {
+        'en': [r"h(i|ii|ello|ey|eya|owdy)", r"good (morning|afternoon|evening)", r"yo", r"greetings"],
+        'hinglish': [r"namaste", r"namask(a|aa)r", r"ram ram", r"salaam"],
+        'hi': [r"नमस्ते", r"नमस्कार", r"हेलो", r"हाय"],
+    }, {
+        'en': ["Hello! What can I do for you?", "{part_of_day}, {user}! How can I help?", "Hey! I'm listening."],
+        'hinglish': ["Namaste {user}! Bataiye, kya madad karun?"],
+        'hi': ["नमस्ते! बताइए, क्या मदद करूँ?"],
+    }),
+    SmallTalkRule('acknowledgement', {
+        'en': [r"ok(ay)?", r"cool", r"nice", r"great", r"awesome", r"perfect", r"got it"],
+        'hinglish': [r"(achcha|accha|acha)", r"(theek|thik)", r"badhiya", r"mast"],
+        'hi': [r"अच्छा", r"ठीक", r"बढ़िया"],
+    }, {
+        'en': ["Great! Anything else?", "Glad to hear it. What next?"],
+        'hinglish': ["Badhiya! Aur kuch?"],
+        'hi': ["बढ़िया! और कुछ?"],
+    }),
+]
+
+
+class SmallTalkMatch(NamedTuple):
+    """Best rule for an utterance"""
+    rule: str
+    language: str
+    confidence: float       # share of the (non-filler) words small talk explains
+    reply: str
+
+
+class SmallTalkEngine:
+    """
+    Pattern table for small talk
+
+    An utterance is answered locally only when small-talk phrases cover
+    at least `min_confidence` of its words, so "hey jarvis" is answered
+    here but "hey jarvis what is quantum physics" still goes to the model.
+    """
+
+    def __init__(self, rules: Optional[List[SmallTalkRule]] = None, min_confidence: float = 0.75,
+                 miss_samples: int = 50):
+        """
+        Initialize small talk engine
+
+        Args:
+            rules: Rules in priority order (default DEFAULT_RULES)
+            min_confidence: Minimum word coverage to answer locally
+            miss_samples: Recent near-misses kept for tuning the table
+        """
+        self.min_confidence = min_confidence
+        self.rules = rules or DEFAULT_RULES
+        # One alternation per rule and language, matched on whole words
+        self._compiled = [
+            (rule, language, re.compile(r"(?:^|(?<= ))(?:" + '|'.join(phrases) + r")(?= |$)"))
+            for rule in self.rules
+            for language, phrases in rule.patterns.items()
+        ]
+
+        self.calls = 0
+        self.hits: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+        self.low_confidence = 0
+        self.total_us = 0.0
+        self.near_misses = deque(maxlen=miss_samples)
+
+    def match(self, text: str, min_confidence: Optional[float] = None) -> Optional[SmallTalkMatch]:
+        """
+        Find the small talk in an utterance
+
+        Args:
+            text: User's words
+            min_confidence: Override the engine's threshold (0 = any match)
+
+        Returns:
+            SmallTalkMatch, or None if nothing matched well enough
+        """
+        threshold = self.min_confidence if min_confidence is None else min_confidence
+        words = _PUNCTUATION.sub(' ', text.lower()).split()
+        content_words = sum(1 for w in words if w not in FILLER_WORDS)
+        if not content_words:
+            return None
+        cleaned = ' '.join(words)
+
+        best = None
+        covered = 0
+        for rule, language, pattern in self._compiled:
+            spans = [m.group(0) for m in pattern.finditer(cleaned)]
+            if not spans:
+                continue
+            covered += sum(1 for span in spans for w in span.split() if w not in FILLER_WORDS)
+            if best is None:
+                best = (rule, language)
+        if best is None:
+            return None
+
+        confidence = min(covered / content_words, 1.0)
+        if confidence < threshold:
+            return None
+        rule, language = best
+        return SmallTalkMatch(rule.name, language, round(confidence, 2), self._render(rule, language))
+
+    def reply(self, text: str) -> Optional[str]:
+        """
+        Local reply for small talk (counted in the statistics)
+
+        Returns:
+            Reply text, or None when the model should answer
+        """
+        started = time.perf_counter()
+        match = self.match(text, min_confidence=0)
+        self.calls += 1
+        if match is not None and match.confidence >= self.min_confidence:
+            self.hits[match.rule] += 1
+            result = match.reply
+            logger.info("⚡ SMALL TALK: %s (%s, confidence %.2f) - answered locally",
+                        match.rule, match.language, match.confidence)
+        else:
+            if match is not None:
+                self.low_confidence += 1
+                self.near_misses.append((text, match.rule, match.confidence))
+            result = None
+        self.total_us += (time.perf_counter() - started) * 1e6
+        return result
+
+    @staticmethod
+    def _render(rule: SmallTalkRule, language: str) -> str:
+        templates = rule.replies.get(language) or rule.replies['en']
+        hour = datetime.now().hour
+        part_of_day = 'Good morning' if hour < 12 else 'Good afternoon' if hour < 17 else 'Good evening'
+        return random.choice(templates).format(user=USER_NAME, part_of_day=part_of_day)
+
+    def stats(self) -> Dict:
+        """Hit rate per rule and near-misses, for tuning the table"""
+        hits = sum(self.hits.values())
+        return {
+            'calls': self.calls,
+            'hits': hits,
+            'hit_rate': round(hits / self.calls, 3) if self.calls else 0.0,
+            'low_confidence': self.low_confidence,
+            'avg_us': round(self.total_us / self.calls, 1) if self.calls else 0.0,
+            'by_rule': {name: count for name, count in self.hits.items() if count},
+            'near_misses': list(self.near_misses),
+        }
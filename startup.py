@@ -0,0 +1,186 @@
+"""
+JARVIS Startup Orchestrator - GUI First, Subsystems in Parallel
+Builds subsystems in background threads with readiness events, checks
+dependencies without importing them and reports per-phase timings
+"""
+import importlib.util
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def find_missing(required: Dict[str, str]) -> List[str]:
+    """
+    Find packages that are not installed, without importing them
+
+    Args:
+        required: Module name -> pip package name
+
+    Returns:
+        List of missing pip package names
+    """
+    missing = []
+    for module, package in required.items():
+        try:
+            # Only the top-level package is located; nothing is executed
+            if importlib.util.find_spec(module.split('.')[0]) is None:
+                missing.append(package)
+        except (ImportError, ValueError):
+            missing.append(package)
+    return missing
+
+
+class Subsystem:
+    """
+    A subsystem being built in the background
+
+    `ready` is set once the build finished (successfully or not); `value`
+    holds the built object and `error` the exception if it failed.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.ready = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self, timeout: Optional[float] = None):
+        """
+        Block until the subsystem is built
+
+        Returns:
+            The built object
+
+        Raises:
+            TimeoutError: If not ready within timeout
+            RuntimeError: If the build failed
+        """
+        if not self.ready.wait(timeout):
+            raise TimeoutError(f"{self.name} not ready after {timeout}s")
+        if self.error is not None:
+            raise RuntimeError(f"{self.name} failed to start: {self.error}") from self.error
+        return self.value
+
+    @property
+    def ok(self) -> bool:
+        return self.ready.is_set() and self.error is None
+
+
+def resolve(subsystem, timeout: Optional[float] = None):
+    """Return the object behind a Subsystem handle (plain objects pass through)"""
+    if isinstance(subsystem, Subsystem):
+        return subsystem.wait(timeout)
+    return subsystem
+
+
+class StartupOrchestrator:
+    """Runs startup phases and background subsystem builds, timing each one"""
+
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self.phases: List[Dict] = []
+        self.subsystems: Dict[str, Subsystem] = {}
+        self._lock = threading.Lock()
+        self._reported = False
+        self._active_phases = 0
+
+    def _record(self, name: str, started: float, status: str):
+        with self._lock:
+            self.phases.append({
+                'name': name,
+                'start_ms': (started - self.t0) * 1000,
+                'duration_ms': (time.perf_counter() - started) * 1000,
+                'thread': threading.current_thread().name,
+                'status': status,
+            })
+
+    def phase(self, name: str, fn: Callable, *args, **kwargs):
+        """Run a phase on the calling thread and time it"""
+        with self._lock:
+            self._active_phases += 1
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            self._record(name, started, 'failed')
+            raise
+        finally:
+            with self._lock:
+                self._active_phases -= 1
+        self._record(name, started, 'ok')
+        self._maybe_report()
+        return result
+
+    def start(self, name: str, factory: Callable, depends_on: Sequence[str] = ()) -> Subsystem:
+        """
+        Build a subsystem in a background thread
+
+        Args:
+            name: Subsystem name
+            factory: Called with the built dependencies, in order
+            depends_on: Names of subsystems this one needs
+
+        Returns:
+            Subsystem handle (check `.ready`)
+        """
+        subsystem = Subsystem(name)
+        self.subsystems[name] = subsystem
+        deps = [self.subsystems[dep] for dep in depends_on]
+
+        def build():
+            try:
+                args = [dep.wait() for dep in deps]
+                started = time.perf_counter()
+                try:
+                    subsystem.value = factory(*args)
+                    self._record(name, started, 'ok')
+                    logger.info(f"✅ {name} ready ({(time.perf_counter() - started) * 1000:.0f} ms)")
+                except Exception as e:
+                    self._record(name, started, 'failed')
+                    raise e
+            except Exception as e:
+                subsystem.error = e
+                logger.error(f"❌ {name} failed to start: {e}")
+            finally:
+                subsystem.ready.set()
+                self._maybe_report()
+
+        threading.Thread(target=build, daemon=True, name=f"init-{name}").start()
+        return subsystem
+
+    def wait_all(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every background subsystem"""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        for subsystem in list(self.subsystems.values()):
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            if not subsystem.ready.wait(remaining):
+                return False
+        return True
+
+    def _maybe_report(self):
+        """Log the timing report once every phase and subsystem has finished"""
+        with self._lock:
+            if self._reported or self._active_phases or not self.subsystems:
+                return
+            if not all(s.ready.is_set() for s in self.subsystems.values()):
+                return
+            self._reported = True
+        logger.info(self.report())
+
+    def report(self) -> str:
+        """Per-phase startup timing table"""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p['start_ms'])
+        total = max((p['start_ms'] + p['duration_ms'] for p in phases), default=0.0)
+        lines = ["⏱️ Startup timing:"]
+        for p in phases:
+            marker = "" if p['status'] == 'ok' else f"  [{p['status']}]"
+            lines.append(
+                f"   {p['name']:<20} +{p['start_ms']:7.0f} ms  {p['duration_ms']:7.0f} ms  "
+                f"({p['thread']}){marker}"
+            )
+        lines.append(f"   {'all ready':<20} +{total:7.0f} ms")
+        return "\n".join(lines)
@@ -9,14 +9,139 @@ import subprocess
 import webbrowser
 import shlex
 import os
+import threading
 from typing import Optional, List, Dict, Tuple
 
+from app_resolver import which
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 logger = logging.getLogger(__name__)
 
 # Detect current operating system
 CURRENT_OS = platform.system().lower()  # 'windows', 'darwin', 'linux'
 logger.info(f"🖥️ Detected OS: {CURRENT_OS}")
 
+# Cross-platform app commands, compiled per OS by SystemController
+APP_COMMANDS = {
+    'windows': {
+        # Browsers
+        'chrome': 'start chrome',
+        'browser': 'start chrome',
+        'google chrome': 'start chrome',
+        'edge': 'start msedge',
+        'microsoft edge': 'start msedge',
+        'firefox': 'start firefox',
+
+        # Development
+        'vscode': 'code',
+        'vs code': 'code',
+        'visual studio code': 'code',
+        'pycharm': 'start pycharm',
+        'sublime': 'start sublime_text',
+
+        # Communication
+        'whatsapp': 'start whatsapp:',
+        'telegram': 'start telegram:',
+        'slack': 'start slack:',
+        'discord': 'start discord:',
+
+        # Media
+        'spotify': 'start spotify:',
+        'vlc': 'start vlc',
+        'music': 'start wmplayer',
+
+        # Utilities
+        'notepad': 'notepad',
+        'calculator': 'calc',
+        'paint': 'mspaint',
+        'files': 'start explorer',
+        'file explorer': 'start explorer',
+        'explorer': 'start explorer',
+        'terminal': 'start cmd',
+        'cmd': 'start cmd',
+        'command prompt': 'start cmd',
+        'powershell': 'start powershell',
+
+        # Office
+        'word': 'start winword',
+        'excel': 'start excel',
+        'powerpoint': 'start powerpnt',
+    },
+    'darwin': {  # macOS
+        # Browsers
+        'chrome': 'open -a "Google Chrome"',
+        'browser': 'open -a "Safari"',
+        'safari': 'open -a "Safari"',
+        'firefox': 'open -a "Firefox"',
+        'edge': 'open -a "Microsoft Edge"',
+
+        # Development
+        'vscode': 'open -a "Visual Studio Code"',
+        'vs code': 'open -a "Visual Studio Code"',
+        'pycharm': 'open -a "PyCharm"',
+        'sublime': 'open -a "Sublime Text"',
+
+        # Communication
+        'whatsapp': 'open -a "WhatsApp"',
+        'telegram': 'open -a "Telegram"',
+        'slack': 'open -a "Slack"',
+
+        # Media
+        'spotify': 'open -a "Spotify"',
+        'vlc': 'open -a "VLC"',
+
+        # Utilities
+        'terminal': 'open -a "Terminal"',
+        'finder': 'open -a "Finder"',
+        'files': 'open -a "Finder"',
+        'calculator': 'open -a "Calculator"',
+        'notes': 'open -a "Notes"',
+    },
+    'linux': {
+        # Browsers
+        'chrome': 'google-chrome',
+        'chromium': 'chromium',
+        'browser': 'xdg-open http://google.com',
+        'firefox': 'firefox',
+        'edge': 'microsoft-edge',
+
+        # Development
+        'vscode': 'code',
+        'vs code': 'code',
+        'pycharm': 'pycharm',
+        'sublime': 'subl',
+
+        # Communication
+        'whatsapp': 'whatsapp-for-linux',
+        'telegram': 'telegram-desktop',
+        'slack': 'slack',
+
+        # Media
+        'spotify': 'spotify',
+        'vlc': 'vlc',
+
+        # Utilities
+        'terminal': 'gnome-terminal',
+        'files': 'nautilus',
+        'file manager': 'nautilus',
+        'calculator': 'gnome-calculator',
+        'text editor': 'gedit',
+    }
+}
+
+# Where macOS keeps .app bundles for `open -a`
+MACOS_APP_DIRS = [
+    '/Applications',
+    '/Applications/Utilities',
+    '/System/Applications',
+    '/System/Applications/Utilities',
+    os.path.expanduser('~/Applications'),
+]
+
 
 class SystemController:
     """
@@ -31,7 +156,22 @@ class SystemController:
             'rm -rf /', 'del /f /s /q', 'format', 'fdisk',
             'dd if=', 'mkfs', ':(){:|:&};:', 'shutdown', 'reboot'
         }
-        logger.info(f"✅ System controller initialized for {self.os}")
+        
+        # App commands for this OS only, compiled once
+        self.app_commands: Dict[str, str] = dict(APP_COMMANDS.get(self.os, {}))
+        self._app_argv: Dict[str, List[str]] = {}
+        if self.os != 'windows':
+            for name, command in self.app_commands.items():
+                self._app_argv[name] = shlex.split(command)
+        
+        # Command -> installed? (both hits and misses are cached)
+        self._installed: Dict[str, bool] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Resolve executables in the background so the first query is instant
+        threading.Thread(target=self.list_launchable_apps, daemon=True).start()
+        
+        logger.info(f"✅ System controller initialized for {self.os} ({len(self.app_commands)} app commands)")
     
     def open_url(self, url: str) -> Tuple[bool, str]:
         """
@@ -130,6 +270,16 @@ class SystemController:
                 logger.warning(f"⚠️ App not found: {app_name}")
                 return False, f"I don't know how to open {app_name}"
             
+            # Cached install check - fail fast instead of spawning a dead command.
+            # `start` also finds apps the probe can't see (Store apps, other
+            # per-user registrations), so on Windows a miss there is only a hint.
+            if not self.is_app_installed(app_name_lower):
+                if self.os == 'windows' and command.startswith('start '):
+                    logger.info(f"ℹ️ {app_name} not found by the install check - trying `{command}` anyway")
+                else:
+                    logger.warning(f"⚠️ Not installed: {app_name} ({command})")
+                    return False, f"{app_name} is not installed or not in PATH"
+            
             # Security check
             if not self._is_safe_command(command):
                 logger.error(f"❌ BLOCKED: Unsafe command: {command}")
@@ -143,10 +293,8 @@ class SystemController:
                                stdout=subprocess.DEVNULL, 
                                stderr=subprocess.DEVNULL)
             else:
-                # Unix-like systems - use proper argument splitting
-                if isinstance(command, str):
-                    command = shlex.split(command)
-                subprocess.Popen(command, 
+                # Unix-like systems - argv was split once at startup
+                subprocess.Popen(self._app_argv[app_name_lower], 
                                stdout=subprocess.DEVNULL, 
                                stderr=subprocess.DEVNULL)
             
@@ -155,6 +303,8 @@ class SystemController:
             
         except FileNotFoundError:
             logger.error(f"❌ Application not found: {app_name}")
+            with self._cache_lock:
+                self._installed[self.app_commands[app_name.lower()]] = False
             return False, f"{app_name} is not installed or not in PATH"
         except Exception as e:
             logger.error(f"❌ App open error: {e}")
@@ -170,116 +320,93 @@ class SystemController:
         Returns:
             Command string or None if not found
         """
-        # Define cross-platform app commands
-        app_commands = {
-            'windows': {
-                # Browsers
-                'chrome': 'start chrome',
-                'browser': 'start chrome',
-                'google chrome': 'start chrome',
-                'edge': 'start msedge',
-                'microsoft edge': 'start msedge',
-                'firefox': 'start firefox',
-                
-                # Development
-                'vscode': 'code',
-                'vs code': 'code',
-                'visual studio code': 'code',
-                'pycharm': 'start pycharm',
-                'sublime': 'start sublime_text',
-                
-                # Communication
-                'whatsapp': 'start whatsapp:',
-                'telegram': 'start telegram:',
-                'slack': 'start slack:',
-                'discord': 'start discord:',
-                
-                # Media
-                'spotify': 'start spotify:',
-                'vlc': 'start vlc',
-                
-                # Utilities
-                'notepad': 'notepad',
-                'calculator': 'calc',
-                'paint': 'mspaint',
-                'files': 'start explorer',
-                'file explorer': 'start explorer',
-                'explorer': 'start explorer',
-                'terminal': 'start cmd',
-                'cmd': 'start cmd',
-                'command prompt': 'start cmd',
-                'powershell': 'start powershell',
-                
-                # Office
-                'word': 'start winword',
-                'excel': 'start excel',
-                'powerpoint': 'start powerpnt',
-            },
-            'darwin': {  # macOS
-                # Browsers
-                'chrome': 'open -a "Google Chrome"',
-                'browser': 'open -a "Safari"',
-                'safari': 'open -a "Safari"',
-                'firefox': 'open -a "Firefox"',
-                'edge': 'open -a "Microsoft Edge"',
-                
-                # Development
-                'vscode': 'open -a "Visual Studio Code"',
-                'vs code': 'open -a "Visual Studio Code"',
-                'pycharm': 'open -a "PyCharm"',
-                'sublime': 'open -a "Sublime Text"',
-                
-                # Communication
-                'whatsapp': 'open -a "WhatsApp"',
-                'telegram': 'open -a "Telegram"',
-                'slack': 'open -a "Slack"',
-                
-                # Media
-                'spotify': 'open -a "Spotify"',
-                'vlc': 'open -a "VLC"',
-                
-                # Utilities
-                'terminal': 'open -a "Terminal"',
-                'finder': 'open -a "Finder"',
-                'files': 'open -a "Finder"',
-                'calculator': 'open -a "Calculator"',
-                'notes': 'open -a "Notes"',
-            },
-            'linux': {
-                # Browsers
-                'chrome': 'google-chrome',
-                'chromium': 'chromium',
-                'browser': 'xdg-open http://google.com',
-                'firefox': 'firefox',
-                'edge': 'microsoft-edge',
-                
-                # Development
-                'vscode': 'code',
-                'vs code': 'code',
-                'pycharm': 'pycharm',
-                'sublime': 'subl',
-                
-                # Communication
-                'whatsapp': 'whatsapp-for-linux',
-                'telegram': 'telegram-desktop',
-                'slack': 'slack',
-                
-                # Media
-                'spotify': 'spotify',
-                'vlc': 'vlc',
-                
-                # Utilities
-                'terminal': 'gnome-terminal',
-                'files': 'nautilus',
-                'file manager': 'nautilus',
-                'calculator': 'gnome-calculator',
-                'text editor': 'gedit',
-            }
-        }
+        return self.app_commands.get(app_name)
+    
+    def is_app_installed(self, app_name: str) -> bool:
+        """
+        Check whether an app can be launched, without spawning anything
+        
+        Args:
+            app_name: App name as used by open_application
+            
+        Returns:
+            True if the app's executable (or URI handler) was found
+        """
+        command = self._get_app_command(app_name.lower())
+        if not command:
+            return False
         
-        # Get commands for current OS
-        os_commands = app_commands.get(self.os, {})
-        return os_commands.get(app_name)
+        installed = self._installed.get(command)
+        if installed is None:
+            installed = self._probe_command(command)
+            with self._cache_lock:
+                self._installed[command] = installed
+        return installed
+    
+    def list_launchable_apps(self) -> List[str]:
+        """
+        List app names that are actually launchable on this machine
+        
+        Returns:
+            Sorted list of app names
+        """
+        apps = sorted(name for name in self.app_commands if self.is_app_installed(name))
+        logger.debug(f"💻 Launchable apps: {len(apps)}/{len(self.app_commands)}")
+        return apps
+    
+    def refresh_app_cache(self):
+        """Forget cached install checks (e.g. after installing an app)"""
+        with self._cache_lock:
+            self._installed.clear()
+        which.cache_clear()
+        logger.info("🔄 App install cache cleared")
+    
+    def _probe_command(self, command: str) -> bool:
+        """
+        Resolve the executable behind an app command
+        
+        Args:
+            command: Command string from the app table
+            
+        Returns:
+            True if the executable or URI handler exists
+        """
+        try:
+            if self.os == 'windows':
+                if not command.startswith('start '):
+                    return which(command.split()[0]) is not None
+                target = command[len('start '):].strip()
+                if target.endswith(':'):
+                    # URI scheme such as ms-settings: or spotify:
+                    return self._has_registry_key(target[:-1])
+                if which(target) is not None:
+                    return True
+                # Machine-wide and per-user installs (Chrome, VS Code and
+                # Spotify user installers register under HKCU)
+                app_path = rf"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\{target}.exe"
+                return winreg is not None and any(
+                    self._has_registry_key(app_path, root)
+                    for root in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER))
+            
+            argv = shlex.split(command)
+            if self.os == 'darwin' and argv[:2] == ['open', '-a']:
+                bundle = f"{argv[2]}.app"
+                return any(os.path.isdir(os.path.join(folder, bundle)) for folder in MACOS_APP_DIRS)
+            return which(argv[0]) is not None
+        except Exception as e:
+            logger.debug(f"App probe failed for '{command}': {e}")
+            return False
+    
+    @staticmethod
+    def _has_registry_key(key: str, root=None) -> bool:
+        """Check for a Windows registry key (HKEY_CLASSES_ROOT by default)"""
+        if winreg is None:
+            return False
+        try:
+            with winreg.OpenKey(root if root is not None else winreg.HKEY_CLASSES_ROOT, key):
+                return True
+        except OSError:
+            return False
     
     def _is_safe_url(self, url: str) -> bool:
         """
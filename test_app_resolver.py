@@ -0,0 +1,59 @@
+"""
+Test shared app resolution (Hindi, English, Hinglish, misheard names)
+"""
+import time
+
+from app_resolver import get_app_resolver
+
+print("=" * 70)
+print("TESTING APP RESOLVER")
+print("=" * 70)
+
+resolver = get_app_resolver()
+
+test_cases = [
+    ("open chrome", "chrome"),
+    ("chrome kholo", "chrome"),
+    ("क्रोम खोलो", "chrome"),
+    ("open krome", "chrome"),
+    ("open google chrome", "chrome"),
+    ("व्हाट्सएप ओपन करो", "whatsapp"),
+    ("kya aap WhatsApp open kar sakte ho", "whatsapp"),
+    ("नोटपैड खोलो और उसमें लिख दो hello", "notepad"),
+    ("open calculater", "calculator"),
+    ("open vs code", "vscode"),
+    ("open file explorer", "files"),
+    ("यूट्यूब खोलो", "youtube"),
+    ("open github", "github"),
+    ("hello jarvis what are you doing", None),
+    # Sound-alike keys but different apps / not an app at all
+    ("open clock", None),
+    ("open file hanuman chalisa", None),
+]
+
+print("\nResolving commands...")
+print("-" * 70)
+for command, expected in test_cases:
+    if expected and expected not in resolver.targets:
+        print(f"SKIP | '{command}' ({expected} can't be launched on this OS)")
+        continue
+    match = resolver.resolve(command)
+    actual = match.name if match else None
+    status = "PASS" if actual == expected else "FAIL"
+    print(f"{status} | '{command}' -> {actual} (expected {expected})")
+
+started = time.perf_counter()
+for _ in range(10000):
+    resolver.resolve("open chrome")
+per_call = (time.perf_counter() - started) / 10000 * 1e6
+# "chromium" is its own app on Linux, never a misheard chrome
+match = resolver.resolve("open chromium")
+actual = match.name if match else None
+expected = "chromium" if "chromium" in resolver.targets else None
+print(f"{'PASS' if actual == expected else 'FAIL'} | 'open chromium' -> {actual} (expected {expected})")
+
+print(f"\nMemoized resolution: {per_call:.2f} µs per call")
+
+print("\n" + "=" * 70)
+print("TEST COMPLETE")
+print("=" * 70)
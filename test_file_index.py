@@ -0,0 +1,76 @@
+"""
+Test the persistent file index and trigram search used by Play_file
+"""
+import os
+import random
+import string
+import tempfile
+import time
+
+from file_index import FileIndex
+
+print("=" * 70)
+print("TESTING FILE INDEX")
+print("=" * 70)
+
+# Test 1: Build, search and incremental updates on a temp tree
+print("\n1. INDEX + SEARCH")
+print("-" * 70)
+root = tempfile.mkdtemp()
+os.makedirs(os.path.join(root, 'music', 'old'))
+os.makedirs(os.path.join(root, 'node_modules'))
+for rel in ['music/hanuman chalisa.mp3', 'music/hanuman chalisa.txt',
+            'music/old/despacito.mp4', 'node_modules/skip.js']:
+    open(os.path.join(root, rel), 'w').close()
+
+index = FileIndex(os.path.join(root, 'index.db'), [root])
+index.start()
+index.ready.wait(10)
+
+checks = [
+    ("hanuman chalisa", "hanuman chalisa.mp3"),
+    ("despasito", "despacito.mp4"),
+    ("skip", None),
+]
+for query, expected in checks:
+    results = index.search(query)
+    actual = results[0]['name'] if results and results[0]['score'] > 70 else None
+    status = "PASS" if actual == expected else "FAIL"
+    print(f"{status} | '{query}' -> {actual} (expected {expected})")
+
+open(os.path.join(root, 'music', 'kesariya.mp3'), 'w').close()
+index.rescan()
+results = index.search("kesariya")
+print(f"{'PASS' if results else 'FAIL'} | new file picked up by rescan")
+index.stop()
+
+# Test 2: Search latency at a million entries - end to end (trigram
+# shortlist, row fetch, exact scoring and ranking), as Play_file sees it
+print("\n2. SEARCH LATENCY (1,000,000 entries)")
+print("-" * 70)
+random.seed(7)
+words = [''.join(random.choices(string.ascii_lowercase, k=random.randint(3, 9))) for _ in range(30000)]
+names = [' '.join(random.choices(words, k=random.randint(1, 4))) for _ in range(1000000)]
+big = FileIndex(os.path.join(root, 'big.db'), [root])
+started = time.perf_counter()
+rows = (FileIndex._row_for(f'/media/d{i % 1000}/{i} {name}.mp3', f'{name}.mp3', f'/media/d{i % 1000}', 0.0)
+        for i, name in enumerate(names))
+with big._lock:
+    big._conn.executemany('INSERT INTO files (path, name, name_lower, dir, ext, mtime) '
+                          'VALUES (?, ?, ?, ?, ?, ?)', rows)
+    big._conn.commit()
+big._load_ngrams()
+print(f"Built in {time.perf_counter() - started:.1f}s")
+
+timings = []
+for i in random.sample(range(len(names)), 50):
+    started = time.perf_counter()
+    big.search(names[i][:12])
+    timings.append((time.perf_counter() - started) * 1000)
+timings.sort()
+print(f"p50: {timings[25]:.1f} ms | max: {timings[-1]:.1f} ms")
+print(f"{'PASS' if timings[-1] < 50 else 'FAIL'} | FileIndex.search below 50 ms")
+
+print("\n" + "=" * 70)
+print("TEST COMPLETE")
+print("=" * 70)
@@ -0,0 +1,125 @@
+"""
+Test the shared HTTP client against a local mock server
+(keep-alive pooling, per-endpoint cache, retries with backoff, timeouts)
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from http_client import HTTPClient
+
+
+class MockServer:
+    """
+    Local HTTP server fixture
+
+    Serves /json (counts hits), /flaky (503 for the first `fail_times`
+    requests) and /slow (sleeps before answering). Records the client
+    ports it saw so tests can check that connections are reused.
+    """
+
+    def __init__(self, fail_times: int = 2, slow_seconds: float = 1.0):
+        self.hits = {}
+        self.client_ports = set()
+        self.fail_times = fail_times
+        self.slow_seconds = slow_seconds
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"   # keep-alive
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                server.hits[path] = server.hits.get(path, 0) + 1
+                server.client_ports.add(self.client_address[1])
+
+                status = 200
+                if path == '/flaky' and server.hits[path] <= server.fail_times:
+                    status = 503
+                elif path == '/slow':
+                    time.sleep(server.slow_seconds)
+                elif path not in ('/json', '/flaky'):
+                    status = 404
+
+                body = json.dumps({'path': self.path, 'hit': server.hits[path]}).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass    # client gave up (timeout test)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def check(name, ok, detail=""):
+    print(f"{'PASS' if ok else 'FAIL'} | {name} {detail}")
+
+
+async def run_tests(server: MockServer):
+    client = HTTPClient(timeout=0.5, retries=2, backoff=0.05)
+
+    # Connection reuse
+    for i in range(10):
+        await client.get(f"{server.url}/json", params={'i': i})
+    check("keep-alive pool", len(server.client_ports) == 1,
+          f"({len(server.client_ports)} connection(s) for 10 requests)")
+
+    # Cache with TTL
+    hits_before = server.hits['/json']
+    first = await client.get(f"{server.url}/json", params={'q': 'weather'}, ttl=0.3)
+    second = await client.get(f"{server.url}/json", params={'q': 'weather'}, ttl=0.3)
+    check("cache hit", second.cached and server.hits['/json'] == hits_before + 1)
+    await asyncio.sleep(0.35)
+    third = await client.get(f"{server.url}/json", params={'q': 'weather'}, ttl=0.3)
+    check("cache expiry", not third.cached and first.json()['hit'] != third.json()['hit'])
+
+    # Retries with backoff
+    started = time.perf_counter()
+    response = await client.get(f"{server.url}/flaky")
+    check("retry on 503", response.status_code == 200 and server.hits['/flaky'] == 3,
+          f"({(time.perf_counter() - started) * 1000:.0f} ms, {client.retried} retries)")
+
+    # Errors are not cached
+    cached_before = client.stats()['cached']
+    response = await client.get(f"{server.url}/missing", ttl=60)
+    check("404 not cached", response.status_code == 404 and client.stats()['cached'] == cached_before)
+
+    # Timeout after every attempt
+    started = time.perf_counter()
+    try:
+        await client.get(f"{server.url}/slow")
+        check("timeout", False)
+    except asyncio.TimeoutError:
+        check("timeout", True, f"({time.perf_counter() - started:.2f} s for 3 attempts)")
+
+    print(f"\nStats: {client.stats()}")
+    await client.close()
+
+
+print("=" * 70)
+print("TESTING HTTP CLIENT")
+print("=" * 70)
+
+with MockServer() as mock_server:
+    asyncio.run(run_tests(mock_server))
+
+print("\n" + "=" * 70)
+print("TEST COMPLETE")
+print("=" * 70)
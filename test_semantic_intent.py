@@ -0,0 +1,59 @@
+"""
+Test the semantic intent classifier
+(paraphrases, Hinglish variants, batch classification and keyword fallback)
+"""
+import time
+
+from intent_detector import IntentDetector
+from semantic_intent import SemanticIntentClassifier
+
+
+def check(name, ok, detail=""):
+    print(f"{'PASS' if ok else 'FAIL'} | {name} {detail}")
+
+
+print("=" * 70)
+print("TESTING SEMANTIC INTENT CLASSIFIER")
+print("=" * 70)
+
+classifier = SemanticIntentClassifier()
+
+cases = [
+    ("can you fire up chrome", 'ACTION'),
+    ("whatsapp kholiye", 'ACTION'),
+    ("please play some old bollywood songs", 'ACTION'),
+    ("message bhejo papa ko", 'ACTION'),
+    ("how does a car engine work", 'INFORMATION'),
+    ("Achcha JavaScript ke bare mein explain karo", 'INFORMATION'),
+    ("hey jarvis", 'CONVERSATION'),
+    ("how are you doing today", 'CONVERSATION'),
+    ("goodbye jarvis", 'EXIT'),
+]
+for text, expected in cases:
+    intent, confidence, nearest = classifier.classify(text)
+    check(f"'{text}'", intent == expected, f"-> {intent} ({confidence:.2f}, like '{nearest}')")
+
+intent, confidence, _ = classifier.classify("asdf qwer zxcv")
+check("gibberish is not labelled", intent is None, f"({confidence:.2f})")
+
+texts = [text for text, _ in cases]
+batch = classifier.classify_batch(texts)
+check("batch matches single", [b[0] for b in batch] == [classifier.classify(t)[0] for t in texts])
+
+started = time.perf_counter()
+for _ in range(20):
+    for text in texts:
+        classifier.classify(text)
+per_call_ms = (time.perf_counter() - started) * 1000 / (20 * len(texts))
+check("latency", per_call_ms < 5, f"({per_call_ms:.2f} ms per utterance)")
+
+# Keyword scores take over when the classifier is unsure
+detector = IntentDetector(semantic=classifier)
+intent, _, details = detector.classify_intent("whatsapp kholiye")
+check("detector uses semantic", details.get('classifier') == 'semantic' and intent == 'ACTION')
+intent, _, details = detector.classify_intent("asdf qwer zxcv")
+check("detector falls back to keywords", 'classifier' not in details, f"-> {intent}")
+
+print("\n" + "=" * 70)
+print("TEST COMPLETE")
+print("=" * 70)
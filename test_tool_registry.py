@@ -0,0 +1,62 @@
+"""
+Test agent tool declarations against their implementations
+(every module that imports here is checked; a mismatch disables the tool)
+"""
+import asyncio
+import sys
+import types
+
+from agent_tools import TOOL_SPECS
+from tool_registry import ToolRegistry, ToolSpec
+
+print("=" * 70)
+print("TESTING TOOL REGISTRY")
+print("=" * 70)
+
+# Test 1: The agent's declarations
+print("\n1. AGENT TOOL DECLARATIONS")
+print("-" * 70)
+registry = ToolRegistry()
+failed = 0
+for name, problem in registry.verify(TOOL_SPECS).items():
+    if problem is None:
+        print(f"PASS | {name}")
+    elif problem.startswith('unavailable'):
+        print(f"SKIP | {name} ({problem})")
+    else:
+        failed += 1
+        print(f"FAIL | {name}: {problem}")
+
+# Test 2: A wrong declaration is refused, not called
+print("\n2. MISMATCH IS A HARD ERROR")
+print("-" * 70)
+fake = types.ModuleType('fake_tools')
+calls = []
+
+async def type_text(text: str, interval: float = 0.0) -> str:
+    calls.append(text)
+    return f"typed {text}"
+
+fake.type_text = type_text
+sys.modules['fake_tools'] = fake
+
+good = ToolSpec("good", "fake_tools", "type_text", "Type text.", {"text": str})
+wrong_name = ToolSpec("wrong_name", "fake_tools", "type_text", "Type text.", {"message": str})
+wrong_type = ToolSpec("wrong_type", "fake_tools", "type_text", "Type text.", {"text": int})
+for spec, expected in [(good, None), (wrong_name, 'unknown'), (wrong_type, 'declared int')]:
+    problem = ToolRegistry.signature_problem(spec, type_text)
+    ok = problem is None if expected is None else (problem is not None and expected in problem)
+    print(f"{'PASS' if ok else 'FAIL'} | {spec.name}: {problem}")
+
+registry = ToolRegistry()
+tool = registry.declare(wrong_name)
+result = asyncio.run(tool("hello"))
+print(f"{'PASS' if result.startswith('❌') and not calls else 'FAIL'} | mismatched tool not called: {result}")
+print(f"{'PASS' if registry.stats()['wrong_name']['status'] == 'mismatch' else 'FAIL'} | reported as mismatch")
+tool = registry.declare(good)
+result = asyncio.run(tool("hello"))
+print(f"{'PASS' if result == 'typed hello' else 'FAIL'} | matching tool called: {result}")
+
+print("\n" + "=" * 70)
+print(f"TEST COMPLETE ({failed} declaration mismatches)")
+print("=" * 70)
@@ -0,0 +1,290 @@
+"""
+JARVIS Tool Registry - Lazy Agent Tools
+Declares every agent tool with its name, description and parameters up
+front and imports the implementation module only on the tool's first call
+"""
+import asyncio
+import importlib
+import inspect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ToolSpec(NamedTuple):
+    """
+    Declaration of a lazily loaded tool
+
+    `params` maps parameter name -> type, or -> (type, default) for
+    optional parameters. It is what the model sees; the implementation's
+    own signature is checked when it is imported (a mismatch disables the
+    tool) and by ToolRegistry.verify().
+    """
+    name: str
+    module: str
+    attr: str
+    description: str
+    params: Dict[str, Any] = {}
+
+    def signature(self) -> inspect.Signature:
+        parameters = []
+        for param, declared in self.params.items():
+            annotation, default = declared if isinstance(declared, tuple) else (declared, inspect.Parameter.empty)
+            parameters.append(inspect.Parameter(
+                param, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=default, annotation=annotation
+            ))
+        return inspect.Signature(parameters, return_annotation=str)
+
+
+class ToolRegistry:
+    """
+    Registry of lazily imported tool implementations
+
+    Modules are imported in a worker thread (so the event loop keeps
+    running), at most once, and the time each import took is recorded.
+    A module that fails to import only disables the tools that need it.
+    """
+
+    def __init__(self, decorator: Optional[Callable] = None):
+        """
+        Initialize tool registry
+
+        Args:
+            decorator: Applied to each generated tool, e.g. livekit's function_tool
+        """
+        self.decorator = decorator
+        self.specs: Dict[str, ToolSpec] = {}
+        self._modules: Dict[str, Any] = {}
+        self._module_errors: Dict[str, str] = {}
+        self._mismatches: Dict[str, str] = {}   # tool -> why its declaration is wrong
+        self._import_lock = threading.Lock()
+
+        self.import_ms: Dict[str, float] = {}   # module -> import time
+        self.load_ms: Dict[str, float] = {}     # tool -> time its first call waited for loading
+        self.calls: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+
+    # ----------------------------------------------------------------- #
+    # Declaration
+    # ----------------------------------------------------------------- #
+    def declare(self, spec: ToolSpec) -> Callable:
+        """
+        Register a tool and build its callable stub
+
+        Returns:
+            Async function with the declared name, docstring and signature
+            (passed through the decorator) that forwards to the implementation
+        """
+        self.specs[spec.name] = spec
+        signature = spec.signature()
+        registry = self
+
+        async def tool(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return await registry.call(spec.name, **bound.arguments)
+
+        tool.__name__ = tool.__qualname__ = spec.name
+        tool.__doc__ = spec.description
+        tool.__signature__ = signature
+        tool.__annotations__ = {
+            **{p.name: p.annotation for p in signature.parameters.values()},
+            'return': str,
+        }
+        return self.decorator(tool) if self.decorator else tool
+
+    def declare_all(self, specs: List[ToolSpec]) -> List[Callable]:
+        """Declare several tools, in order"""
+        return [self.declare(spec) for spec in specs]
+
+    # ----------------------------------------------------------------- #
+    # Loading and calling
+    # ----------------------------------------------------------------- #
+    def _import(self, module: str):
+        """Import a module once, timing it (runs in a worker thread)"""
+        with self._import_lock:
+            if module in self._modules:
+                return self._modules[module]
+            if module in self._module_errors:
+                raise ImportError(self._module_errors[module])
+
+            started = time.perf_counter()
+            try:
+                loaded = importlib.import_module(module)
+            except Exception as e:
+                self._module_errors[module] = f"{type(e).__name__}: {e}"
+                logger.warning(f"⚠️ Tool module {module} failed to import: {e}")
+                raise ImportError(self._module_errors[module]) from e
+            finally:
+                self.import_ms[module] = (time.perf_counter() - started) * 1000
+
+            self._modules[module] = loaded
+            logger.info(f"📦 Loaded tool module {module} ({self.import_ms[module]:.0f} ms)")
+            return loaded
+
+    async def load(self, module: str, attr: str):
+        """
+        Get an implementation, importing its module on first use
+
+        Raises:
+            ImportError: If the module or attribute is missing
+        """
+        loaded = self._modules.get(module)
+        if loaded is None:
+            loaded = await asyncio.to_thread(self._import, module)
+        try:
+            return getattr(loaded, attr)
+        except AttributeError:
+            raise ImportError(f"{module} has no attribute {attr}") from None
+
+    async def run(self, module: str, attr: str, *args, **kwargs):
+        """Load an implementation and call it (sync or async)"""
+        impl = await self.load(module, attr)
+        result = impl(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def call(self, name: str, **kwargs) -> str:
+        """
+        Call a declared tool
+
+        Returns:
+            The tool's result, or an error message if it is unavailable or fails
+        """
+        spec = self.specs[name]
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+        first_call = name not in self.load_ms
+        started = time.perf_counter()
+        try:
+            impl = await self.load(spec.module, spec.attr)
+        except ImportError as e:
+            self.failures[name] = self.failures.get(name, 0) + 1
+            return f"❌ {name} is unavailable: {e}"
+        if first_call:
+            self.load_ms[name] = (time.perf_counter() - started) * 1000
+            problem = self.signature_problem(spec, impl)
+            if problem:
+                self._mismatches[name] = problem
+                logger.error(f"❌ Tool {name} declaration doesn't match {spec.module}.{spec.attr}: {problem}")
+        if name in self._mismatches:
+            # Calling with the wrong arguments would fail (or do the wrong thing) anyway
+            self.failures[name] = self.failures.get(name, 0) + 1
+            return f"❌ {name} is unavailable: declaration doesn't match the implementation"
+
+        try:
+            result = impl(**kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as e:
+            self.failures[name] = self.failures.get(name, 0) + 1
+            logger.error(f"❌ Tool {name} failed: {e}")
+            return f"❌ {name} failed: {e}"
+
+    @staticmethod
+    def signature_problem(spec: ToolSpec, impl) -> Optional[str]:
+        """
+        Compare a declaration with the implementation's signature
+
+        Returns:
+            What doesn't match (unknown or missing parameters, differing
+            types), or None if the declaration fits
+        """
+        try:
+            signature = inspect.signature(inspect.unwrap(impl))
+        except (TypeError, ValueError):
+            return None  # builtins without a signature
+        params = signature.parameters
+        var_keyword = any(p.kind == p.VAR_KEYWORD for p in params.values())
+        named = {name: p for name, p in params.items() if p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)}
+
+        problems = []
+        unknown = [param for param in spec.params if param not in named and not var_keyword]
+        if unknown:
+            problems.append(f"unknown parameters {unknown}")
+        missing = [name for name, p in named.items() if p.default is p.empty and name not in spec.params]
+        if missing:
+            problems.append(f"missing required parameters {missing}")
+        for param, declared in spec.params.items():
+            annotation = declared[0] if isinstance(declared, tuple) else declared
+            if param not in named:
+                continue
+            actual = named[param].annotation
+            if isinstance(actual, type) and actual is not inspect.Parameter.empty and actual is not annotation:
+                problems.append(f"{param} is {actual.__name__}, declared {getattr(annotation, '__name__', annotation)}")
+        return '; '.join(problems) or None
+
+    def verify(self, specs: Optional[List[ToolSpec]] = None) -> Dict[str, Optional[str]]:
+        """
+        Import every tool module now and check each declaration
+        (for tests and diagnostics - the agent itself stays lazy)
+
+        Returns:
+            Tool name -> problem, None if it matches, or 'unavailable: ...'
+            if its module can't be imported here
+        """
+        results = {}
+        for spec in (specs if specs is not None else list(self.specs.values())):
+            try:
+                impl = getattr(self._import(spec.module), spec.attr)
+            except (ImportError, AttributeError) as e:
+                results[spec.name] = f"unavailable: {e}"
+                continue
+            results[spec.name] = self.signature_problem(spec, impl)
+        return results
+
+    # ----------------------------------------------------------------- #
+    # Diagnostics
+    # ----------------------------------------------------------------- #
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool load state, load time and call counts"""
+        stats = {}
+        for name, spec in self.specs.items():
+            if spec.module in self._module_errors:
+                status = 'unavailable'
+            elif name in self._mismatches:
+                status = 'mismatch'
+            elif spec.module in self._modules:
+                status = 'loaded'
+            else:
+                status = 'declared'
+            stats[name] = {
+                'module': spec.module,
+                'status': status,
+                'import_ms': round(self.import_ms.get(spec.module, 0.0), 1),
+                'load_ms': round(self.load_ms.get(name, 0.0), 1),
+                'calls': self.calls.get(name, 0),
+                'failures': self.failures.get(name, 0),
+            }
+        return stats
+
+    def report(self) -> str:
+        """Tool load timing table"""
+        lines = ["🧰 Tools:"]
+        for name, s in sorted(self.stats().items(), key=lambda item: -item[1]['import_ms']):
+            lines.append(
+                f"   {name:<28} {s['status']:<12} import {s['import_ms']:7.1f} ms  "
+                f"first call {s['load_ms']:7.1f} ms  calls {s['calls']}"
+            )
+        return "\n".join(lines)
+
+
+# Global instance for easy access
+_tool_registry = None
+
+def get_tool_registry() -> ToolRegistry:
+    """Get or create global tool registry (tools are wrapped with livekit's function_tool)"""
+    global _tool_registry
+    if _tool_registry is None:
+        try:
+            from livekit.agents import function_tool
+        except ImportError:
+            function_tool = None
+        _tool_registry = ToolRegistry(decorator=function_tool)
+    return _tool_registry
@@ -0,0 +1,271 @@
+"""
+JARVIS Tracing - Per-Turn Timing Spans
+Nested spans with monotonic timings (context manager or decorator),
+exported as one JSON line per turn and kept in a ring buffer for the GUI
+"""
+import functools
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+from config import TRACING_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("jarvis_current_span", default=None)
+_ids = itertools.count(1)
+
+
+class Span:
+    """
+    One timed operation
+
+    Spans started while another span is active on the same thread (or
+    asyncio task) become its children; a span without a parent is the root
+    of a new trace, which is exported when the root ends.
+    """
+
+    __slots__ = ('tracer', 'name', 'span_id', 'parent', 'root', 'attrs', 'thread',
+                 'started', 'duration_ms', 'error', 'finished', 'wall_time', '_token', '_dropped')
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = next(_ids)
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.attrs = attrs
+        self.thread = threading.current_thread().name
+        self.duration_ms = None
+        self.error = None
+        self.finished: List[Span] = []       # root only: ended descendants
+        self.wall_time = time.time() if parent is None else None
+        self._dropped = False
+        self.started = time.perf_counter()
+        self._token = _current_span.set(self)
+
+    def set(self, **attrs):
+        """Attach attributes (e.g. text, action)"""
+        self.attrs.update(attrs)
+
+    def end(self, error: Optional[BaseException] = None):
+        """Finish the span (idempotent)"""
+        if self.duration_ms is not None:
+            return
+        self.duration_ms = (time.perf_counter() - self.started) * 1000
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Ended from another context - just stop being current here
+            _current_span.set(self.parent)
+        if self.root is self:
+            if not self._dropped:
+                self.tracer._finish_trace(self)
+        else:
+            self.root.finished.append(self)
+
+    def drop(self):
+        """End the span and discard its trace (e.g. a listen that heard nothing)"""
+        self.root._dropped = True
+        self.end()
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'start_ms': round((self.started - self.root.started) * 1000, 3),
+            'duration_ms': round(self.duration_ms, 3),
+            'thread': self.thread,
+        }
+        if self.attrs:
+            record['attrs'] = self.attrs
+        if self.error:
+            record['error'] = self.error
+        return record
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled"""
+
+    def set(self, **attrs):
+        pass
+
+    def end(self, error=None):
+        pass
+
+    def drop(self):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Records spans and exports finished traces
+
+    Traces go to an in-memory ring buffer immediately; the JSONL file is
+    written by a background thread so ending a turn never waits on disk.
+    """
+
+    def __init__(self, enabled: bool = True, path: Optional[str] = None,
+                 ring_size: int = 200, max_bytes: int = 0):
+        """
+        Initialize tracer
+
+        Args:
+            enabled: Record spans at all
+            path: JSONL file for finished traces (None = memory only)
+            ring_size: Finished traces kept in memory
+            max_bytes: Roll the file over to path + '.1' beyond this size (0 = never)
+        """
+        self.enabled = enabled
+        self.path = path
+        self.max_bytes = max_bytes
+        self.traces = deque(maxlen=ring_size)
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+
+    # ----------------------------------------------------------------- #
+    # Recording
+    # ----------------------------------------------------------------- #
+    def start_span(self, name: str, **attrs):
+        """Start a span and make it current; call .end() when done"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, _current_span.get(), attrs)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block: `with tracer.span("intent"):`"""
+        span = self.start_span(name, **attrs)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(error=e)
+            raise
+        finally:
+            span.end()
+
+    def current_span(self):
+        """The active span, or a no-op span"""
+        return _current_span.get() or _NOOP_SPAN
+
+    # ----------------------------------------------------------------- #
+    # Export
+    # ----------------------------------------------------------------- #
+    def _finish_trace(self, root: Span):
+        spans = [root] + sorted(root.finished, key=lambda s: s.started)
+        trace = {
+            'trace_id': root.span_id,
+            'name': root.name,
+            'ts': root.wall_time,
+            'duration_ms': round(root.duration_ms, 3),
+            'spans': [span.to_dict() for span in spans],
+        }
+        self.traces.append(trace)
+        if self.path:
+            self._queue.put(trace)
+            self._ensure_writer()
+
+    def _ensure_writer(self):
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, daemon=True,
+                                                    name="trace-writer")
+                    self._writer.start()
+
+    def _write_loop(self):
+        while True:
+            trace = self._queue.get()
+            lines = [trace]
+            # Batch whatever else is already waiting
+            while True:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if self.max_bytes and os.path.exists(self.path) \
+                        and os.path.getsize(self.path) > self.max_bytes:
+                    os.replace(self.path, self.path + '.1')
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    for item in lines:
+                        f.write(json.dumps(item, ensure_ascii=False, default=str) + '\n')
+            except Exception as e:
+                logger.error(f"❌ Trace export failed: {e}")
+
+    def recent(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Most recent finished traces, newest last"""
+        traces = list(self.traces)
+        return traces if count is None else traces[-count:]
+
+    @staticmethod
+    def format_trace(trace: Dict[str, Any]) -> str:
+        """Indented span tree with durations, for display"""
+        depth = {}
+        lines = [f"⏱️ {trace['name']} {trace['duration_ms']:.0f} ms"]
+        for span in trace['spans'][1:]:
+            level = depth.get(span['parent_id'], 0) + 1
+            depth[span['span_id']] = level
+            marker = " ❌" if 'error' in span else ""
+            lines.append(f"{'   ' * level}{span['name']:<20} +{span['start_ms']:6.0f} ms  "
+                         f"{span['duration_ms']:7.1f} ms{marker}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def summarize(trace: Dict[str, Any]) -> str:
+        """One line: total and top-level stage durations"""
+        root_id = trace['spans'][0]['span_id']
+        stages = [f"{s['name']} {s['duration_ms']:.0f}" for s in trace['spans'] if s['parent_id'] == root_id]
+        return f"⏱️ {trace['name']} {trace['duration_ms']:.0f} ms | " + " | ".join(stages)
+
+
+def traced(name: Optional[str] = None):
+    """
+    Decorator: record each call as a span
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# Global instance for easy access
+_tracer = None
+
+def get_tracer() -> Tracer:
+    """Get or create global tracer (settings from TRACING_CONFIG)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(
+            enabled=TRACING_CONFIG['enabled'],
+            path=TRACING_CONFIG['file'] or None,
+            ring_size=TRACING_CONFIG['ring_size'],
+            max_bytes=TRACING_CONFIG['max_bytes'],
+        )
+    return _tracer
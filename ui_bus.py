@@ -0,0 +1,148 @@
+"""
+JARVIS UI Event Bus - Thread-Safe GUI Updates
+Worker threads publish typed events; the Tk main thread drains them once
+per frame, coalescing repeated state changes into a single update
+"""
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ----------------------------------------------------------------- #
+# Event types
+# ----------------------------------------------------------------- #
+# Events whose class sets `coalesce = True` only keep the newest
+# instance per drain; the rest are delivered in order.
+
+class StatusChanged(NamedTuple):
+    """Assistant state changed (STANDBY, LISTENING, THINKING, ...)"""
+    status: str
+    detail: str = ""
+    coalesce = True
+
+
+class ChatMessage(NamedTuple):
+    """Append a message to the chat transcript"""
+    sender: str
+    message: str
+    msg_type: str = "user"
+    coalesce = False
+
+
+class ContinueButton(NamedTuple):
+    """Show or hide the Continue Explanation button"""
+    visible: bool
+    coalesce = True
+
+
+class UIEventBus:
+    """
+    Single-consumer event bus between worker threads and the Tk main loop
+
+    publish() may be called from any thread (deque appends are atomic);
+    handlers only ever run on the main thread, from drain().
+    """
+
+    def __init__(self, root, interval_ms: int = 16, latency_window: int = 200):
+        """
+        Initialize UI event bus
+
+        Args:
+            root: Tk root window (drain is scheduled with root.after)
+            interval_ms: Drain interval - one frame at 60 FPS by default
+            latency_window: Number of recent latencies kept for percentiles
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._queue = deque()
+        self._handlers: Dict[type, List[Callable]] = {}
+        self._latencies = deque(maxlen=latency_window)
+        self._running = False
+
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    def subscribe(self, event_type: type, handler: Callable):
+        """Run handler(event) on the main thread for each event of this type"""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event):
+        """Queue an event (thread-safe, never blocks)"""
+        self._queue.append((event, time.perf_counter()))
+        self.published += 1
+
+    def start(self):
+        """Start draining on the Tk main loop"""
+        if not self._running:
+            self._running = True
+            self.root.after(self.interval_ms, self._drain_loop)
+
+    def stop(self):
+        """Stop draining"""
+        self._running = False
+
+    def drain(self) -> int:
+        """
+        Deliver everything queued so far (main thread only)
+
+        Returns:
+            Number of events delivered to handlers
+        """
+        depth = len(self._queue)
+        if not depth:
+            return 0
+        self.max_depth = max(self.max_depth, depth)
+
+        batch = [self._queue.popleft() for _ in range(depth)]
+
+        # Keep only the newest event of each coalescing type, in its position
+        latest = {}
+        for index, (event, _) in enumerate(batch):
+            if event.coalesce:
+                latest[type(event)] = index
+        delivered = 0
+        for index, (event, published_at) in enumerate(batch):
+            if event.coalesce and latest[type(event)] != index:
+                self.coalesced += 1
+                continue
+            for handler in self._handlers.get(type(event), ()):
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(f"❌ UI handler error ({type(event).__name__}): {e}")
+            self._latencies.append(time.perf_counter() - published_at)
+            delivered += 1
+
+        self.delivered += delivered
+        return delivered
+
+    def _drain_loop(self):
+        if not self._running:
+            return
+        self.drain()
+        self.root.after(self.interval_ms, self._drain_loop)
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """Queue depth and publish-to-handled latency"""
+        latencies = sorted(self._latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 2)
+
+        return {
+            'queue_depth': len(self._queue),
+            'max_depth': self.max_depth,
+            'published': self.published,
+            'delivered': self.delivered,
+            'coalesced': self.coalesced,
+            'latency_p50_ms': percentile(0.50),
+            'latency_p95_ms': percentile(0.95),
+            'latency_max_ms': percentile(1.0),
+        }
@@ -0,0 +1,324 @@
+"""
+JARVIS Window Tracker - Cached Window List With Awaitable Title Matches
+Keeps an incrementally updated list of top-level windows so callers can
+focus a window the moment it appears instead of sleeping and enumerating
+"""
+import asyncio
+import logging
+import threading
+from collections import namedtuple
+from typing import Dict, List, Optional
+
+try:
+    from Xlib import X, display as xdisplay
+    from Xlib.protocol import event as xevent
+except ImportError:
+    xdisplay = None
+
+try:
+    import pygetwindow as gw
+except Exception:
+    gw = None
+
+logger = logging.getLogger(__name__)
+
+WindowInfo = namedtuple('WindowInfo', ['handle', 'title'])
+
+
+class WindowTracker:
+    """
+    Tracks top-level windows and wakes up coroutines waiting for a title
+
+    On Linux the list is kept current from EWMH property events
+    (_NET_CLIENT_LIST and per-window _NET_WM_NAME) through python-xlib.
+    Elsewhere, or when X11 is unavailable, pygetwindow is polled - quickly
+    while someone is waiting for a window, slowly otherwise.
+    """
+
+    def __init__(self, poll_interval: float = 0.1, idle_interval: float = 2.0):
+        """
+        Initialize window tracker
+
+        Args:
+            poll_interval: Seconds between polls while a caller is waiting
+            idle_interval: Seconds between polls when nobody is waiting
+        """
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self.windows: Dict[object, str] = {}
+        self.backend = None
+        self._handles: Dict[object, object] = {}
+        self._waiters: List[tuple] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._display = None
+
+    # ----------------------------------------------------------------- #
+    # Lifecycle
+    # ----------------------------------------------------------------- #
+    def start(self) -> bool:
+        """Start tracking in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return True
+
+        if xdisplay is not None:
+            try:
+                self._display = xdisplay.Display()
+                self.backend = 'x11'
+            except Exception as e:
+                logger.debug(f"X11 display unavailable: {e}")
+                self._display = None
+        if self._display is None:
+            if gw is None:
+                logger.warning("⚠️ Window tracking unavailable (no python-xlib or pygetwindow)")
+                return False
+            self.backend = 'poll'
+
+        target = self._run_x11 if self.backend == 'x11' else self._run_poll
+        self._stop.clear()
+        self._thread = threading.Thread(target=target, daemon=True, name="WindowTracker")
+        self._thread.start()
+        logger.info(f"✅ Window tracker started ({self.backend})")
+        return True
+
+    def stop(self):
+        """Stop tracking"""
+        self._stop.set()
+        self._wake.set()
+        if self._display is not None:
+            try:
+                self._display.close()
+            except Exception:
+                pass
+            self._display = None
+
+    # ----------------------------------------------------------------- #
+    # Queries
+    # ----------------------------------------------------------------- #
+    def find(self, title: str) -> Optional[WindowInfo]:
+        """
+        Find a known window whose title contains the given text
+
+        Args:
+            title: Case-insensitive title fragment
+
+        Returns:
+            WindowInfo or None
+        """
+        needle = title.lower().strip()
+        with self._lock:
+            for handle, window_title in self.windows.items():
+                if needle in window_title.lower():
+                    return WindowInfo(handle, window_title)
+        return None
+
+    def list_windows(self) -> List[WindowInfo]:
+        """Snapshot of the cached window list"""
+        with self._lock:
+            return [WindowInfo(h, t) for h, t in self.windows.items()]
+
+    async def wait_for_window(self, title: str, timeout: float = 10.0) -> Optional[WindowInfo]:
+        """
+        Wait until a window whose title contains `title` exists
+
+        Args:
+            title: Case-insensitive title fragment
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            WindowInfo or None on timeout
+        """
+        if not self.start():
+            return None
+
+        needle = title.lower().strip()
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (needle, loop, future)
+
+        # Register before checking the cache so no update slips between the two
+        with self._lock:
+            self._waiters.append(waiter)
+        self._wake.set()
+
+        existing = self.find(needle)
+        if existing:
+            self._remove_waiter(waiter)
+            return existing
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.debug(f"Window '{title}' did not appear within {timeout}s")
+            return None
+        finally:
+            self._remove_waiter(waiter)
+
+    async def focus(self, title: str, timeout: float = 10.0) -> bool:
+        """
+        Focus a window as soon as one matching `title` appears
+
+        Args:
+            title: Case-insensitive title fragment
+            timeout: Seconds to wait for the window
+
+        Returns:
+            True if a window was found and activated
+        """
+        window = await self.wait_for_window(title, timeout)
+        if window is None:
+            return False
+        return await asyncio.to_thread(self.activate, window)
+
+    def activate(self, window: WindowInfo) -> bool:
+        """Restore and raise a tracked window"""
+        try:
+            if self.backend == 'x11':
+                self._activate_x11(window.handle)
+            else:
+                handle = self._handles.get(window.handle)
+                if handle is None:
+                    return False
+                if handle.isMinimized:
+                    handle.restore()
+                handle.activate()
+            logger.info(f"🪟 Focused: {window.title}")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Couldn't focus '{window.title}': {e}")
+            return False
+
+    # ----------------------------------------------------------------- #
+    # Cache updates
+    # ----------------------------------------------------------------- #
+    def _remove_waiter(self, waiter: tuple):
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def _update(self, windows: Dict[int, str]):
+        """Replace the cached list and resolve any waiters it satisfies"""
+        with self._lock:
+            self.windows = windows
+            waiters = list(self._waiters)
+        for needle, loop, future in waiters:
+            for handle, title in windows.items():
+                if needle in title.lower():
+                    loop.call_soon_threadsafe(self._resolve, future, WindowInfo(handle, title))
+                    break
+
+    def _set_title(self, handle: int, title: str):
+        """Incremental update for a single window"""
+        with self._lock:
+            if self.windows.get(handle) == title:
+                return
+            windows = dict(self.windows)
+        windows[handle] = title
+        self._update(windows)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, window: WindowInfo):
+        if not future.done():
+            future.set_result(window)
+
+    # ----------------------------------------------------------------- #
+    # Polling backend (Windows, macOS, fallback)
+    # ----------------------------------------------------------------- #
+    def _run_poll(self):
+        while not self._stop.is_set():
+            try:
+                handles = {}
+                windows = {}
+                for window in gw.getAllWindows():
+                    title = window.title
+                    if not title:
+                        continue
+                    # Native handle on Windows; the title has to do elsewhere
+                    key = getattr(window, '_hWnd', None) or title
+                    handles[key] = window
+                    windows[key] = title
+                self._handles = handles
+                self._update(windows)
+            except Exception as e:
+                logger.debug(f"Window poll failed: {e}")
+
+            interval = self.poll_interval if self._waiters else self.idle_interval
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    # ----------------------------------------------------------------- #
+    # X11 backend (EWMH property events)
+    # ----------------------------------------------------------------- #
+    def _run_x11(self):
+        disp = self._display
+        root = disp.screen().root
+        atoms = {name: disp.intern_atom(name) for name in
+                 ('_NET_CLIENT_LIST', '_NET_WM_NAME', 'WM_NAME', 'UTF8_STRING')}
+        root.change_attributes(event_mask=X.PropertyChangeMask)
+
+        def read_title(win) -> str:
+            prop = win.get_full_property(atoms['_NET_WM_NAME'], atoms['UTF8_STRING'])
+            if prop is None:
+                prop = win.get_full_property(atoms['WM_NAME'], X.AnyPropertyType)
+            if prop is None:
+                return ''
+            value = prop.value
+            return value.decode('utf-8', 'replace') if isinstance(value, bytes) else str(value)
+
+        def read_clients():
+            prop = root.get_full_property(atoms['_NET_CLIENT_LIST'], X.AnyPropertyType)
+            windows = {}
+            for handle in (prop.value if prop else []):
+                try:
+                    win = disp.create_resource_object('window', handle)
+                    # Titles are often set after the window is listed
+                    win.change_attributes(event_mask=X.PropertyChangeMask)
+                    windows[handle] = read_title(win)
+                except Exception:
+                    continue
+            self._update(windows)
+
+        try:
+            read_clients()
+            while not self._stop.is_set():
+                ev = disp.next_event()
+                if ev.type != X.PropertyNotify:
+                    continue
+                if ev.window == root and ev.atom == atoms['_NET_CLIENT_LIST']:
+                    read_clients()
+                elif ev.atom in (atoms['_NET_WM_NAME'], atoms['WM_NAME']):
+                    self._set_title(ev.window.id, read_title(ev.window))
+        except Exception as e:
+            if not self._stop.is_set():
+                logger.warning(f"⚠️ X11 window events stopped ({e}), falling back to polling")
+                if gw is not None:
+                    self.backend = 'poll'
+                    self._run_poll()
+
+    def _activate_x11(self, handle: int):
+        # The event thread owns self._display; Xlib connections aren't thread-safe
+        disp = xdisplay.Display()
+        root = disp.screen().root
+        win = disp.create_resource_object('window', handle)
+        message = xevent.ClientMessage(
+            window=win,
+            client_type=disp.intern_atom('_NET_ACTIVE_WINDOW'),
+            data=(32, [1, X.CurrentTime, 0, 0, 0]),
+        )
+        mask = X.SubstructureRedirectMask | X.SubstructureNotifyMask
+        root.send_event(message, event_mask=mask)
+        disp.flush()
+        disp.close()
+
+
+# Global instance for easy access
+_window_tracker = None
+
+def get_window_tracker() -> WindowTracker:
+    """Get global WindowTracker instance"""
+    global _window_tracker
+    if _window_tracker is None:
+        _window_tracker = WindowTracker()
+    return _window_tracker